@@ -102,8 +102,8 @@ try:
                                 )
                             ),
                         )
-                        panel.set_value("voltage_waveform", waveforms[0])
-                        panel.set_value("thermocouple_waveform", waveforms[1])
+                        # Send both channels as one value, so they update on the panel together.
+                        panel.set_value("waveforms", waveforms)
                 except KeyboardInterrupt:
                     raise
                 finally:
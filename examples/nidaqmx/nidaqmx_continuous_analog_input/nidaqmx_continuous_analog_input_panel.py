@@ -201,8 +201,9 @@ with right_column:
             # Graph section
             st.header("Acquired Data")
 
-            thermocouple_waveform = panel.get_value("thermocouple_waveform", AnalogWaveform())
-            voltage_waveform = panel.get_value("voltage_waveform", AnalogWaveform())
+            voltage_waveform, thermocouple_waveform = panel.get_value(
+                "waveforms", [AnalogWaveform(), AnalogWaveform()]
+            )
             if voltage_waveform.sample_count == 0:
                 time_labels = ["00:00:00.000"]
             else:
@@ -8,6 +8,7 @@ import hightime
 import niscope
 import numpy as np
 from niscope.errors import Error
+from nitypes.waveform import AnalogWaveform, LinearScaleMode
 
 import nipanel
 
@@ -81,12 +82,13 @@ try:
                                 break
                             else:
                                 time.sleep(0.1)
-                                binary_data = waveforms[i].samples.tolist()
-                                panel.set_value("binary_data", waveforms[i].samples.tolist())
-
-                                samples_array = np.array(binary_data)
-                                voltage_values = samples_array * gain + offset
-                                panel.set_value("scaled_voltage_data", voltage_values.tolist())
+                                # Publish the raw samples with their scaling, and let the
+                                # panel scale them, instead of publishing both as lists.
+                                binary_waveform = AnalogWaveform.from_array_1d(
+                                    waveforms[i].samples,
+                                    scale_mode=LinearScaleMode(gain, offset),
+                                )
+                                panel.set_value("binary_waveform", binary_waveform)
 
                     actual_binary_data_size = session.binary_sample_width
                     panel.set_value("actual_binary_data_size", actual_binary_data_size)
@@ -1,6 +1,8 @@
 """Streamlit dashboard for visualizing NI-SCOPE waveform data in real time."""
 
+import numpy as np
 import streamlit as st
+from nitypes.waveform import AnalogWaveform
 from streamlit_echarts import st_echarts
 
 import nipanel
@@ -123,7 +125,8 @@ with left_col:
 with right_col:
     with st.container(border=True):
         st.title("Binary Waveform Graph")
-        binary_data = panel.get_value("binary_data", [0])
+        binary_waveform = panel.get_value("binary_waveform", AnalogWaveform(1, np.int8))
+        binary_data = binary_waveform.raw_data.tolist()
 
         binary_graph = {
             "animation": False,
@@ -157,7 +160,7 @@ with right_col:
         st_echarts(options=binary_graph, height="400px", width="75%", key="binary_graph")
     with st.container(border=True):
         st.title("Scaled Voltage Graph")
-        scaled_voltage_data = panel.get_value("scaled_voltage_data", [0])
+        scaled_voltage_data = binary_waveform.scaled_data.tolist()
         scaled_voltage_graph = {
             "animation": False,
             "tooltip": {"trigger": "axis"},
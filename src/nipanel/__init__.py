@@ -2,6 +2,9 @@
 
 from importlib.metadata import version
 
+from nipanel._convert import encode_many, register_converter
+from nipanel._encoded_value import EncodedValue
+from nipanel._lazy_value import LazyValue
 from nipanel._panel_value_accessor import PanelValueAccessor
 from nipanel._streamlit_panel import StreamlitPanel
 from nipanel._streamlit_panel_initializer import (
@@ -11,12 +14,18 @@ from nipanel._streamlit_panel_initializer import (
 
 __all__ = [
     "create_streamlit_panel",
+    "encode_many",
+    "EncodedValue",
     "get_streamlit_panel_accessor",
+    "LazyValue",
     "PanelValueAccessor",
+    "register_converter",
     "StreamlitPanel",
 ]
 
 # Hide that it was defined in a helper file
+EncodedValue.__module__ = __name__
+LazyValue.__module__ = __name__
 PanelValueAccessor.__module__ = __name__
 StreamlitPanel.__module__ = __name__
 
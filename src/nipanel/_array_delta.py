@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import random
+import zlib
+from typing import Any
+
+import numpy as np
+from google.protobuf import any_pb2
+
+from nipanel._protos import array_pb2
+from nipanel.converters.numpy_types import NDArrayConverter, _get_little_endian_data
+
+_KEYFRAME_VALUE_ID_SUFFIX = ".__keyframe__"
+
+_DELTA_TYPE_URL = f"type.googleapis.com/{array_pb2.ArrayDelta.DESCRIPTOR.full_name}"
+
+_KEYFRAME_INTERVAL = 100
+"""The number of deltas after which a keyframe is sent, even if the array changed little."""
+
+_MAX_DELTA_RATIO = 0.75
+"""The size of a delta, relative to the array, above which a keyframe is sent instead.
+
+Noise in the low bits of floats does not compress, so a delta of an array whose every element
+changed slightly can be over half the size of the array, but it is still smaller than a keyframe.
+"""
+
+_MAX_INDEX = np.iinfo(np.uint32).max
+
+# The fastest compression level. The XORed bytes are mostly zeros, which compress well at any
+# level.
+_COMPRESSION_LEVEL = 1
+
+
+class _ArrayDeltaEncoder:
+    """Encodes the numpy arrays set for one value ID as keyframes and deltas.
+
+    Each array is encoded as an ArrayDelta, which holds only the elements that differ from the
+    last keyframe. A panel only keeps the last value set for each value ID, so a reader that
+    reads less often than the arrays are set would miss deltas that are relative to the
+    previous array. Deltas that are relative to the keyframe can be applied to it no matter how
+    many were missed.
+
+    The keyframe is encoded as an ArrayKeyframe when the shape or dtype changes, when a delta
+    would be more than _MAX_DELTA_RATIO of the size of the array, and after every
+    _KEYFRAME_INTERVAL deltas.
+    """
+
+    __slots__ = ["_generation", "_keyframe", "_delta_count"]
+
+    def __init__(self) -> None:
+        """Initialize the encoder."""
+        # Start from a random generation, so a reader never mistakes a keyframe that an earlier
+        # producer published for a keyframe of this one.
+        self._generation = random.getrandbits(64)
+        self._keyframe: np.ndarray[Any, Any] | None = None
+        self._delta_count = 0
+
+    def encode(self, value: object) -> tuple[any_pb2.Any | None, any_pb2.Any]:
+        """Encode an array as a keyframe and a delta.
+
+        Returns:
+            A tuple of the keyframe, or None if the delta is relative to the last keyframe,
+            and the delta.
+
+        Raises:
+            TypeError: If the value is not a numpy array, or its dtype is not supported.
+        """
+        if not isinstance(value, np.ndarray):
+            raise TypeError(f"Only numpy arrays can be sent as deltas, not {type(value).__name__}.")
+
+        # ascontiguousarray makes a 0-dimensional array 1-dimensional, so restore its shape.
+        data = _get_little_endian_data(value).reshape(value.shape)
+        delta: array_pb2.ArrayDelta | None = None
+        if (
+            self._keyframe is not None
+            and data.dtype == self._keyframe.dtype
+            and data.shape == self._keyframe.shape
+            and self._delta_count < _KEYFRAME_INTERVAL
+        ):
+            delta = _create_delta(data, self._keyframe)
+
+        keyframe_any: any_pb2.Any | None = None
+        if delta is None:
+            self._generation = (self._generation + 1) % 2**64
+            # Copy the array, since the caller may update it in place, as when averaging.
+            self._keyframe = data.copy()
+            self._delta_count = 0
+            keyframe_any = any_pb2.Any()
+            keyframe_any.Pack(
+                array_pb2.ArrayKeyframe(
+                    generation=self._generation,
+                    array=NDArrayConverter().to_protobuf_message(self._keyframe),
+                )
+            )
+            delta = array_pb2.ArrayDelta()
+        else:
+            self._delta_count += 1
+
+        delta.keyframe_generation = self._generation
+        delta_any = any_pb2.Any()
+        delta_any.Pack(delta)
+        return keyframe_any, delta_any
+
+
+def _create_delta(
+    data: np.ndarray[Any, Any], keyframe: np.ndarray[Any, Any]
+) -> array_pb2.ArrayDelta | None:
+    """Create the smaller kind of delta, or return None if neither is small enough."""
+    xor = _as_bit_patterns(data) ^ _as_bit_patterns(keyframe)
+    is_changed = xor != 0
+    if is_changed.ndim == 2:
+        is_changed = is_changed.any(axis=1)
+    changed_indices = np.flatnonzero(is_changed)
+
+    # A sparse delta is much cheaper to create than a compressed one, so it is used without
+    # compressing the XORed bytes if few enough elements changed.
+    itemsize = data.dtype.itemsize
+    sparse_size = changed_indices.size * (4 + itemsize)
+    can_be_sparse = data.size <= _MAX_INDEX
+    if can_be_sparse and sparse_size <= data.nbytes // 16:
+        return _create_sparse_delta(data, changed_indices)
+
+    # Group the first byte of every element, then the second byte, and so on.
+    shuffled_xor = np.ascontiguousarray(xor.reshape(-1).view(np.uint8).reshape(-1, itemsize).T)
+    compressed_xor = zlib.compress(shuffled_xor.data, _COMPRESSION_LEVEL)
+    if can_be_sparse and sparse_size <= len(compressed_xor):
+        delta = _create_sparse_delta(data, changed_indices)
+    else:
+        delta = array_pb2.ArrayDelta(compressed_xor=compressed_xor)
+    if delta.ByteSize() > data.nbytes * _MAX_DELTA_RATIO:
+        return None
+    return delta
+
+
+def _create_sparse_delta(
+    data: np.ndarray[Any, Any], changed_indices: np.ndarray[Any, Any]
+) -> array_pb2.ArrayDelta:
+    return array_pb2.ArrayDelta(
+        changed_indices=changed_indices.astype("<u4").tobytes(),
+        changed_values=data.reshape(-1)[changed_indices].tobytes(),
+    )
+
+
+def _as_bit_patterns(data: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """View the elements of a contiguous array as unsigned integers, or rows of bytes."""
+    itemsize = data.dtype.itemsize
+    flat_data = data.reshape(-1)
+    if itemsize in (1, 2, 4, 8):
+        return flat_data.view(f"<u{itemsize}")
+    return flat_data.view(np.uint8).reshape(-1, itemsize)
+
+
+def _apply_delta(keyframe: array_pb2.ArrayKeyframe, delta_any: any_pb2.Any) -> np.ndarray[Any, Any]:
+    """Apply an ArrayDelta to its keyframe to get the array."""
+    delta = array_pb2.ArrayDelta()
+    delta_any.Unpack(delta)
+    array = NDArrayConverter().to_python_value(keyframe.array)
+    flat_array = array.reshape(-1)
+    if delta.compressed_xor:
+        itemsize = array.dtype.itemsize
+        shuffled_xor = np.frombuffer(zlib.decompress(delta.compressed_xor), dtype=np.uint8)
+        if shuffled_xor.size != array.nbytes:
+            raise ValueError(
+                f"ArrayDelta has {shuffled_xor.size} XORed bytes, but its keyframe has "
+                f"{array.nbytes} bytes."
+            )
+        flat_array.view(np.uint8).reshape(-1, itemsize)[...] ^= shuffled_xor.reshape(itemsize, -1).T
+    elif delta.changed_indices:
+        changed_indices = np.frombuffer(delta.changed_indices, dtype="<u4")
+        changed_values = np.frombuffer(delta.changed_values, dtype=array.dtype)
+        if changed_indices.size != changed_values.size:
+            raise ValueError(
+                f"ArrayDelta has {changed_indices.size} changed indices but "
+                f"{changed_values.size} changed values."
+            )
+        flat_array[changed_indices] = changed_values
+    return array
@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import enum
+import functools
+import hashlib
 import logging
+import mmap
+import sys
+import threading
 from collections.abc import Collection
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Iterable
 
+import numpy as np
 from google.protobuf import any_pb2
+from google.protobuf.message import Message
 from nitypes.vector import Vector
 from nitypes.waveform import AnalogWaveform, ComplexWaveform
+from typing_extensions import TypeAlias
 
+from nipanel._converter_registry import _ConverterRegistry
+from nipanel._decoded_value_cache import _DecodedValueCache
+from nipanel._encoded_value import EncodedValue, _EncodedValueMemo
+from nipanel._lazy_value import LazyValue
+from nipanel._protos import composite_pb2
 from nipanel.converters import Converter
+from nipanel.converters.arrow_types import ArrowRecordBatchConverter, ArrowTableConverter
 from nipanel.converters.builtin import (
     BoolConverter,
     BytesConverter,
@@ -21,6 +36,10 @@ from nipanel.converters.builtin import (
     IntConverter,
     StrConverter,
 )
+from nipanel.converters.composite import CompositeConverter, get_fields, is_composite
+from nipanel.converters.image_types import ImageConverter
+from nipanel.converters.numpy_types import NDARRAY_DTYPE_KINDS, NDArrayConverter
+from nipanel.converters.pandas_types import DataFrameConverter, SeriesConverter
 from nipanel.converters.protobuf_types import (
     BTDateTimeConverter,
     BTTimeDeltaConverter,
@@ -41,11 +60,23 @@ from nipanel.converters.protobuf_types import (
     StrCollectionConverter,
     VectorConverter,
 )
+from nipanel.converters.timestamp_types import TimestampCollectionConverter
+from nipanel.converters.waveform_collection_types import (
+    DoubleAnalogWaveformCollectionConverter,
+    DoubleComplexWaveformCollectionConverter,
+    DoubleSpectrumCollectionConverter,
+    QuantizedAnalogWaveformCollectionConverter,
+)
+from nipanel.converters.waveform_types import (
+    Int32AnalogWaveformConverter,
+    Int8AnalogWaveformConverter,
+    PackedDigitalWaveformConverter,
+    QuantizedAnalogWaveformConverter,
+)
 
 _logger = logging.getLogger(__name__)
 
-# FFV -- consider adding a RegisterConverter mechanism
-_CONVERTIBLE_TYPES: list[Converter[Any, Any]] = [
+_BUILTIN_CONVERTERS: list[Converter[Any, Any]] = [
     # Built-in Types
     BoolConverter(),
     BytesConverter(),
@@ -55,123 +86,442 @@ _CONVERTIBLE_TYPES: list[Converter[Any, Any]] = [
     DTDateTimeConverter(),
     DTTimeDeltaConverter(),
     # Protobuf Types
+    ArrowRecordBatchConverter(),
+    ArrowTableConverter(),
     BTDateTimeConverter(),
     BTTimeDeltaConverter(),
     BoolCollectionConverter(),
     BytesCollectionConverter(),
+    CompositeConverter(),
+    DataFrameConverter(),
     DigitalWaveformConverter(),
     Double2DArrayConverter(),
+    DoubleAnalogWaveformCollectionConverter(),
     DoubleAnalogWaveformConverter(),
+    DoubleComplexWaveformCollectionConverter(),
     DoubleComplexWaveformConverter(),
+    DoubleSpectrumCollectionConverter(),
     DoubleSpectrumConverter(),
     FloatCollectionConverter(),
     HTDateTimeConverter(),
     HTTimeDeltaConverter(),
+    ImageConverter(),
     Int16AnalogWaveformConverter(),
     Int16ComplexWaveformConverter(),
+    Int32AnalogWaveformConverter(),
+    Int8AnalogWaveformConverter(),
     IntCollectionConverter(),
+    NDArrayConverter(),
     StrCollectionConverter(),
     ScalarConverter(),
+    SeriesConverter(),
+    TimestampCollectionConverter(),
     VectorConverter(),
 ]
 
-_CONVERTER_FOR_PYTHON_TYPE = {entry.python_typename: entry for entry in _CONVERTIBLE_TYPES}
-_CONVERTER_FOR_GRPC_TYPE = {entry.protobuf_typename: entry for entry in _CONVERTIBLE_TYPES}
-_SUPPORTED_PYTHON_TYPES = _CONVERTER_FOR_PYTHON_TYPE.keys()
+# Built-in converters that only decode by default, because another built-in converter encodes
+# their Python type. Register one with a priority above 0 to also encode with it.
+_OPT_IN_CONVERTERS: list[Converter[Any, Any]] = [
+    PackedDigitalWaveformConverter(),
+    QuantizedAnalogWaveformConverter(),
+    QuantizedAnalogWaveformCollectionConverter(),
+]
+
+
+def _create_converter_registry() -> _ConverterRegistry:
+    registry = _ConverterRegistry()
+    for converter in _BUILTIN_CONVERTERS:
+        registry.register(converter, priority=0)
+    for converter in _OPT_IN_CONVERTERS:
+        registry.register(converter, priority=-1)
+    return registry
+
+
+_CONVERTER_REGISTRY = _create_converter_registry()
+
+# (value type, innermost element type, nesting depth, additional type info), used to cache the
+# converter that handles a value, or None if the type is not supported.
+_DispatchKey: TypeAlias = tuple[type, type, int, str]
+
+_DECODED_VALUE_CACHE = _DecodedValueCache(
+    max_entries=64,
+    max_bytes=64 * 1024 * 1024,
+    min_bytes=4 * 1024,
+)
+# Values decoded with as_numpy=True, which differ from the default decoding for arrays.
+_DECODED_NUMPY_VALUE_CACHE = _DecodedValueCache(
+    max_entries=64,
+    max_bytes=64 * 1024 * 1024,
+    min_bytes=4 * 1024,
+)
+
+_ENCODED_VALUE_MEMO = _EncodedValueMemo(max_entries=256, max_bytes=64 * 1024 * 1024)
+
+# The thread pool that encode_many() uses by default on free-threaded builds of Python.
+_ENCODE_EXECUTOR: ThreadPoolExecutor | None = None
+_ENCODE_EXECUTOR_LOCK = threading.Lock()
+
+# Maps (dtype kind, item size, number of dimensions) to the item type of the collection
+# converter whose message represents such numpy arrays exactly. NDArrayConverter handles
+# other numeric arrays.
+_ITEM_TYPE_FOR_NDARRAY_LAYOUT: dict[tuple[str, int, int], type] = {
+    ("b", 1, 1): bool,
+    ("i", 8, 1): int,
+    ("f", 8, 1): float,
+    ("f", 8, 2): float,
+}
 
 _SKIPPED_COLLECTIONS = (
     str,  # Handled by StrConverter
     bytes,  # Handled by BytesConverter
-    dict,  # Unsupported data type
+    dict,  # Handled by CompositeConverter
     enum.Enum,  # Handled by IntConverter
     Vector,  # Handled by VectorConverter
 )
 
+# Buffer types that are also collections, or are common enough to check for before the
+# collection types. Other objects that support the buffer protocol are checked for only if
+# no other converter handles them.
+_BUFFER_TYPES = (bytearray, memoryview, mmap.mmap)
+
+
+def register_converter(converter: Converter[Any, Any], *, priority: int = 0) -> None:
+    """Register a converter for a Python type and protobuf message type.
+
+    Registered converters take effect for all later conversions. When several converters
+    handle the same Python type or protobuf message type, the one with the highest priority
+    is used. The built-in converters have priority 0, so register a converter with a higher
+    priority to replace one of them.
+
+    Packages can also provide converters through the ``nipanel.converters`` entry point
+    group. Each entry point must refer to a callable that takes no arguments, such as a
+    Converter subclass. If the callable returns a Converter, it is registered with priority 0.
+    Entry points are loaded before the first conversion or registration.
+
+    Args:
+        converter: The converter to register.
+        priority: The priority of the converter.
+
+    Raises:
+        ValueError: If a converter with the same priority is already registered for the
+            converter's Python type or protobuf message type.
+    """
+    _CONVERTER_REGISTRY.load_entry_points()
+    _CONVERTER_REGISTRY.register(converter, priority)
+    # Values already decoded by a replaced converter would be stale.
+    _DECODED_VALUE_CACHE.clear()
+    _DECODED_NUMPY_VALUE_CACHE.clear()
+
 
 def to_any(python_value: object) -> any_pb2.Any:
     """Convert a Python object to a protobuf Any."""
-    best_matching_type = _get_best_matching_type(python_value)
-    converter = _CONVERTER_FOR_PYTHON_TYPE[best_matching_type]
+    converter = _get_best_matching_converter(python_value)
     return converter.to_protobuf_any(python_value)
 
 
+def _to_quantized_any(python_value: object) -> tuple[any_pb2.Any, float]:
+    """Convert a Python object to a protobuf Any, quantizing its float64 analog waveforms.
+
+    float64 AnalogWaveforms, collections of them, and those in the fields of composite values
+    are sent as 16-bit samples. Other values are converted as to_any() converts them.
+
+    Returns:
+        A tuple of the Any and the largest error bound of the quantized waveforms, or 0.0 if
+        the value has none.
+
+    Raises:
+        ValueError: If a sample of a waveform is NaN or infinite.
+    """
+    converter = _get_best_matching_converter(python_value)
+    message: Message
+    if isinstance(converter, (DoubleAnalogWaveformConverter, QuantizedAnalogWaveformConverter)):
+        assert isinstance(python_value, AnalogWaveform)
+        message, error_bound = QuantizedAnalogWaveformConverter().to_quantized_message(python_value)
+    elif isinstance(
+        converter,
+        (DoubleAnalogWaveformCollectionConverter, QuantizedAnalogWaveformCollectionConverter),
+    ):
+        assert isinstance(python_value, Collection)
+        message, error_bound = QuantizedAnalogWaveformCollectionConverter().to_quantized_message(
+            python_value
+        )
+    elif isinstance(converter, CompositeConverter):
+        fields = []
+        error_bound = 0.0
+        for name, field_value in get_fields(python_value).items():
+            field_any, field_error_bound = _to_quantized_any(field_value)
+            fields.append(composite_pb2.Composite.Field(name=name, value=field_any))
+            error_bound = max(error_bound, field_error_bound)
+        message = composite_pb2.Composite(fields=fields)
+    else:
+        return converter.to_protobuf_any(python_value), 0.0
+    as_any = any_pb2.Any()
+    as_any.Pack(message)
+    return as_any, error_bound
+
+
+def encode(python_value: object) -> EncodedValue:
+    """Convert a Python object to an EncodedValue.
+
+    Immutable values, such as strings, numbers, and tuples of them, are remembered by
+    identity, so encoding the same object again does not convert it again.
+    """
+    version = (_CONVERTER_REGISTRY, _CONVERTER_REGISTRY.version)
+    return _ENCODED_VALUE_MEMO.get_or_encode(python_value, version, _encode)
+
+
+def _encode(python_value: object) -> EncodedValue:
+    return EncodedValue(to_any(python_value))
+
+
+def encode_many(
+    python_values: Iterable[object], *, executor: Executor | None = None
+) -> list[any_pb2.Any]:
+    """Convert several Python objects to protobuf Any messages.
+
+    Each Any holds its value already serialized, so it can be sent without converting the
+    value again.
+
+    The protobuf runtime holds the GIL while it builds and serializes messages, so encoding
+    in a thread pool only runs in parallel on a free-threaded build of Python. On those
+    builds, the values are encoded in a shared thread pool by default. Otherwise, they are
+    encoded in the calling thread, unless an executor such as a
+    concurrent.futures.ProcessPoolExecutor is passed. Worker processes only have the
+    built-in converters and the converters provided through entry points, not converters
+    registered with register_converter().
+
+    Args:
+        python_values: The Python objects to convert.
+        executor: The executor to encode the values in.
+
+    Returns:
+        The protobuf Any messages, in the same order as python_values.
+    """
+    if executor is None:
+        executor = _get_default_encode_executor()
+    if executor is None:
+        return [to_any(python_value) for python_value in python_values]
+    return list(executor.map(to_any, python_values))
+
+
+def _get_default_encode_executor() -> Executor | None:
+    global _ENCODE_EXECUTOR
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    if is_gil_enabled():
+        return None
+    with _ENCODE_EXECUTOR_LOCK:
+        if _ENCODE_EXECUTOR is None:
+            _ENCODE_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="nipanel_encode")
+        return _ENCODE_EXECUTOR
+
+
 def _get_best_matching_type(python_value: object) -> str:
-    underlying_parents = type(python_value).mro()  # This covers enum.IntEnum and similar
-    additional_info_string = _get_additional_type_info_string(python_value)
+    return _get_best_matching_converter(python_value).python_typename
+
+
+def _get_best_matching_converter(python_value: object) -> Converter[Any, Any]:
+    # The dispatch key depends on which types have registered converters, so load them first.
+    _CONVERTER_REGISTRY.load_entry_points()
+    dispatch_key = _get_dispatch_key(python_value)
+    converter = _lookup_converter(dispatch_key)
+    if converter is None:
+        converter = _lookup_buffer_converter(python_value)
+    if converter is None:
+        raise _create_unsupported_type_error(dispatch_key)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(
+            "Best matching type for %r resolved to %s", python_value, converter.python_typename
+        )
+    return converter
+
+
+def _get_dispatch_key(python_value: object) -> _DispatchKey:
+    """Get the key that determines which converter handles a Python value.
+
+    The key is made of the value's type, the type of its innermost element, its collection
+    nesting depth, and any additional type info such as a waveform's dtype. numpy arrays are
+    keyed by their dtype and number of dimensions instead.
+    """
+    if isinstance(python_value, np.ndarray):
+        return _get_ndarray_dispatch_key(python_value)
+    python_type = type(python_value)
+    if _has_registered_converter(python_type):
+        # A converter registered for the value's type or a base type takes precedence over
+        # converting it as a composite or a collection, such as for a pandas DataFrame.
+        return (python_type, python_type, 0, "")
+    if is_composite(python_value):
+        # Dataclasses and named tuples convert like dicts of their fields.
+        return (python_type, dict, 0, "")
+    if isinstance(python_value, _BUFFER_TYPES):
+        # Buffers convert like bytes, instead of like collections of their elements.
+        return (python_type, bytes, 0, "")
 
-    container_types = []
-    value_is_collection = _is_collection_for_convert(python_value)
+    nesting_depth = 0
     # Variable to use when traversing down through collection types.
     working_python_value = python_value
-    while value_is_collection:
+    while _is_collection_for_convert(working_python_value):
         # Assume Sized -- Generators not supported, callers must use list(), set(), ... as desired
-        if not isinstance(working_python_value, Collection):
-            raise TypeError()
+        assert isinstance(working_python_value, Collection)
+        nesting_depth += 1
         if len(working_python_value) == 0:
-            underlying_parents = type(None).mro()
-            value_is_collection = False
-        else:
-            # Assume homogenous -- collections of mixed-types not supported
-            visitor = iter(working_python_value)
-
-            # Store off the first element. If it's a container, we'll need it in the next while
-            # loop iteration.
-            working_python_value = next(visitor)
-            underlying_parents = type(working_python_value).mro()
-
-            # If this element is a collection, we want to continue traversing. Once we find a
-            # non-collection, underlying_parents will refer to the candidates for the non-
-            # collection type.
-            value_is_collection = _is_collection_for_convert(working_python_value)
-        container_types.append(Collection)
-
-    best_matching_type = None
-    candidates = _get_candidate_strings(underlying_parents)
+            working_python_value = None
+            break
+        # Assume homogenous -- collections of mixed-types not supported
+        working_python_value = next(iter(working_python_value))
+
+    # The type info of the innermost element, so that a collection of waveforms is keyed by
+    # their dtype.
+    additional_info_string = _get_additional_type_info_string(working_python_value)
+    return (type(python_value), type(working_python_value), nesting_depth, additional_info_string)
+
+
+def _get_ndarray_dispatch_key(python_value: np.ndarray[Any, Any]) -> _DispatchKey:
+    dtype = python_value.dtype
+    layout = (dtype.kind, dtype.itemsize, python_value.ndim)
+    if layout in _ITEM_TYPE_FOR_NDARRAY_LAYOUT:
+        return (np.ndarray, _ITEM_TYPE_FOR_NDARRAY_LAYOUT[layout], python_value.ndim, "")
+    if dtype.kind in NDARRAY_DTYPE_KINDS:
+        return (np.ndarray, np.ndarray, 0, "")
+    # Arrays of other dtypes, such as strings, convert like collections of their elements.
+    item_type: type = dtype.type
+    return (np.ndarray, item_type, python_value.ndim, "")
+
+
+def _lookup_buffer_converter(python_value: object) -> Converter[Any, Any] | None:
+    """Get the converter for bytes if a value that no other converter handles is a buffer."""
+    if isinstance(python_value, (np.ndarray, np.generic)):
+        # Unsupported arrays, such as object arrays, and numpy scalars, such as the result of
+        # argmax(), are not sent as their raw bytes.
+        return None
+    # Whether a type supports the buffer protocol is cached in the dispatch table, so that
+    # unsupported values, which callers may check on every update, are not tried each time.
+    dispatch_key = (type(python_value), memoryview, 0, "")
+    converter_for_dispatch_key = _CONVERTER_REGISTRY.converter_for_dispatch_key
+    if dispatch_key in converter_for_dispatch_key:
+        return converter_for_dispatch_key[dispatch_key]
+    converter: Converter[Any, Any] | None = None
+    try:
+        memoryview(python_value)  # type: ignore[arg-type]
+    except TypeError:
+        pass
+    else:
+        converter = _lookup_converter((bytes, bytes, 0, ""))
+    converter_for_dispatch_key[dispatch_key] = converter
+    return converter
+
+
+def _has_registered_converter(python_type: type) -> bool:
+    converter_for_python_type = _CONVERTER_REGISTRY.converter_for_python_type
+    # Walking the MRO covers subclasses, such as of pandas.DataFrame, like _resolve_converter.
+    for base_type in python_type.mro():
+        for typename in _get_typenames(base_type):
+            if typename in converter_for_python_type:
+                return True
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_typenames(python_type: type) -> tuple[str, ...]:
+    """Get the names that a converter can be registered under for a Python type.
+
+    Besides its full name, a type can be registered under its name in its top-level package.
+    This is how a converter registers a type like pandas.DataFrame, which some versions of
+    pandas report as a member of the submodule that defines it.
+    """
+    typename = f"{python_type.__module__}.{python_type.__name__}"
+    package_name = python_type.__module__.partition(".")[0]
+    package_typename = f"{package_name}.{python_type.__name__}"
+    if package_typename == typename:
+        return (typename,)
+    return (typename, package_typename)
+
+
+def _lookup_converter(dispatch_key: _DispatchKey) -> Converter[Any, Any] | None:
+    _CONVERTER_REGISTRY.load_entry_points()
+    converter_for_dispatch_key = _CONVERTER_REGISTRY.converter_for_dispatch_key
+    if dispatch_key in converter_for_dispatch_key:
+        return converter_for_dispatch_key[dispatch_key]
+    converter = _resolve_converter(dispatch_key)
+    converter_for_dispatch_key[dispatch_key] = converter
+    return converter
+
+
+def _resolve_converter(dispatch_key: _DispatchKey) -> Converter[Any, Any] | None:
+    _, item_type, nesting_depth, additional_info_string = dispatch_key
+    container_types = [Collection] * nesting_depth
+    # Walking the MRO covers enum.IntEnum and similar
+    candidates = _get_candidate_strings(item_type.mro())
+    converter_for_python_type = _CONVERTER_REGISTRY.converter_for_python_type
     for candidate in candidates:
         python_typename = _create_python_typename(
             candidate, container_types, additional_info_string
         )
-        if python_typename not in _SUPPORTED_PYTHON_TYPES:
-            continue
-        best_matching_type = python_typename
-        break
-
-    if not best_matching_type:
-        payload_type = underlying_parents[0]
-        raise TypeError(
-            f"Unsupported type: ({container_types}, {payload_type}) with parents "
-            f"{underlying_parents}.\n\nSupported types are: {_SUPPORTED_PYTHON_TYPES}"
-            f"\n\nAdditional type info: {additional_info_string}"
-        )
-    _logger.debug(f"Best matching type for '{repr(python_value)}' resolved to {best_matching_type}")
-    return best_matching_type
+        converter = converter_for_python_type.get(python_typename)
+        if converter is not None:
+            return converter
+    return None
 
 
-def from_any(protobuf_any: any_pb2.Any) -> object:
-    """Convert a protobuf Any to a Python object."""
+def _create_unsupported_type_error(dispatch_key: _DispatchKey) -> TypeError:
+    _, item_type, nesting_depth, additional_info_string = dispatch_key
+    container_types = [Collection] * nesting_depth
+    return TypeError(
+        f"Unsupported type: ({container_types}, {item_type}) with parents "
+        f"{item_type.mro()}.\n\nSupported types are: "
+        f"{_CONVERTER_REGISTRY.converter_for_python_type.keys()}"
+        f"\n\nAdditional type info: {additional_info_string}"
+    )
+
+
+def from_any(protobuf_any: any_pb2.Any, *, as_numpy: bool = False, lazy: bool = False) -> object:
+    """Convert a protobuf Any to a Python object.
+
+    If as_numpy is True, numeric and boolean arrays are decoded into numpy arrays instead of
+    lists. Other types are decoded the same way either way.
+
+    If lazy is True, return a LazyValue that decodes the value when it is first used.
+    """
     if not isinstance(protobuf_any, any_pb2.Any):
         raise ValueError(f"Unexpected type: {type(protobuf_any)}")
+    if lazy:
+        return LazyValue(protobuf_any, as_numpy=as_numpy)
 
     underlying_typename = protobuf_any.TypeName()
-    _logger.debug(f"Unpacking type '{underlying_typename}'")
+    _logger.debug("Unpacking type '%s'", underlying_typename)
 
-    converter = _CONVERTER_FOR_GRPC_TYPE[underlying_typename]
-    return converter.to_python(protobuf_any)
+    _CONVERTER_REGISTRY.load_entry_points()
+    converter = _CONVERTER_REGISTRY.converter_for_protobuf_type[underlying_typename]
+    if as_numpy:
+        return _DECODED_NUMPY_VALUE_CACHE.get_or_decode(protobuf_any, converter.to_python_numpy)
+    return _DECODED_VALUE_CACHE.get_or_decode(protobuf_any, converter.to_python)
+
+
+def get_fingerprint(protobuf_any: any_pb2.Any) -> str:
+    """Get a fingerprint that identifies the contents of a protobuf Any."""
+    digest = hashlib.sha256(protobuf_any.type_url.encode())
+    digest.update(protobuf_any.value)
+    return digest.hexdigest()
 
 
 def is_supported_type(value: object) -> bool:
     """Check if a given Python value can be converted to protobuf Any."""
-    try:
-        _get_best_matching_type(value)
-        return True
-    except TypeError:
-        return False
+    _CONVERTER_REGISTRY.load_entry_points()
+    converter = _lookup_converter(_get_dispatch_key(value))
+    if converter is None:
+        converter = _lookup_buffer_converter(value)
+    if isinstance(converter, CompositeConverter):
+        try:
+            fields = get_fields(value)
+        except TypeError:
+            return False
+        return all(is_supported_type(field_value) for field_value in fields.values())
+    return converter is not None
 
 
 def _get_candidate_strings(candidates: Iterable[type]) -> list[str]:
-    candidate_names = []
+    candidate_names: list[str] = []
     for candidate in candidates:
-        candidate_names.append(f"{candidate.__module__}.{candidate.__name__}")
+        candidate_names.extend(_get_typenames(candidate))
     return candidate_names
 
 
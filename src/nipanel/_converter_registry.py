@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import importlib.metadata
+import logging
+import threading
+from collections.abc import Hashable, Mapping
+from typing import Any, NamedTuple
+
+from nipanel.converters import Converter
+
+_logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "nipanel.converters"
+
+
+class _Registration(NamedTuple):
+    priority: int
+    sequence_number: int
+    converter: Converter[Any, Any]
+
+
+class _ConverterRegistry:
+    """A registry of converters with constant-time lookup in both directions.
+
+    Each Python typename and protobuf typename maps to the registered converter with the
+    highest priority. Registering a converter only updates the entries for its own typenames.
+    """
+
+    __slots__ = [
+        "_lock",
+        "_registrations_for_python_type",
+        "_registrations_for_protobuf_type",
+        "_converter_for_python_type",
+        "_converter_for_protobuf_type",
+        "_converter_for_dispatch_key",
+        "_sequence_number",
+        "_entry_points_loaded",
+    ]
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.RLock()
+        self._registrations_for_python_type: dict[str, list[_Registration]] = {}
+        self._registrations_for_protobuf_type: dict[str, list[_Registration]] = {}
+        self._converter_for_python_type: dict[str, Converter[Any, Any]] = {}
+        self._converter_for_protobuf_type: dict[str, Converter[Any, Any]] = {}
+        self._converter_for_dispatch_key: dict[Hashable, Converter[Any, Any] | None] = {}
+        self._sequence_number = 0
+        self._entry_points_loaded = False
+
+    @property
+    def converter_for_python_type(self) -> Mapping[str, Converter[Any, Any]]:
+        """The highest priority converter for each Python typename."""
+        return self._converter_for_python_type
+
+    @property
+    def converter_for_protobuf_type(self) -> Mapping[str, Converter[Any, Any]]:
+        """The highest priority converter for each protobuf typename."""
+        return self._converter_for_protobuf_type
+
+    @property
+    def converter_for_dispatch_key(self) -> dict[Hashable, Converter[Any, Any] | None]:
+        """A cache of resolved converters, which is cleared when a converter is registered."""
+        return self._converter_for_dispatch_key
+
+    @property
+    def version(self) -> int:
+        """A number that increases each time a converter is registered."""
+        return self._sequence_number
+
+    def register(self, converter: Converter[Any, Any], priority: int) -> None:
+        """Register a converter.
+
+        Raises:
+            ValueError: If a converter with the same priority is already registered for the
+                same Python typename or protobuf typename.
+        """
+        python_typename = converter.python_typename
+        protobuf_typename = converter.protobuf_typename
+        with self._lock:
+            _check_for_conflict(
+                self._registrations_for_python_type.get(python_typename, []),
+                converter,
+                priority,
+                f"Python type '{python_typename}'",
+            )
+            _check_for_conflict(
+                self._registrations_for_protobuf_type.get(protobuf_typename, []),
+                converter,
+                priority,
+                f"protobuf type '{protobuf_typename}'",
+            )
+
+            registration = _Registration(priority, self._sequence_number, converter)
+            self._sequence_number += 1
+            _add_registration(
+                self._registrations_for_python_type,
+                self._converter_for_python_type,
+                python_typename,
+                registration,
+            )
+            _add_registration(
+                self._registrations_for_protobuf_type,
+                self._converter_for_protobuf_type,
+                protobuf_typename,
+                registration,
+            )
+            self._converter_for_dispatch_key.clear()
+
+    def load_entry_points(self) -> None:
+        """Register converters from installed packages, if that has not been done yet.
+
+        Each entry point in the ``nipanel.converters`` group must refer to a callable that
+        takes no arguments, such as a Converter subclass or a function that calls
+        nipanel.register_converter(). If the callable returns a Converter, it is registered
+        with the default priority.
+        """
+        if self._entry_points_loaded:
+            return
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+            for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+                try:
+                    result = entry_point.load()()
+                    if isinstance(result, Converter):
+                        self.register(result, priority=0)
+                except Exception:
+                    _logger.warning(
+                        "Failed to register converters from entry point '%s'.",
+                        entry_point.name,
+                        exc_info=True,
+                    )
+
+
+def _check_for_conflict(
+    registrations: list[_Registration],
+    converter: Converter[Any, Any],
+    priority: int,
+    description: str,
+) -> None:
+    for registration in registrations:
+        if registration.priority == priority:
+            raise ValueError(
+                f"{type(converter).__name__} conflicts with "
+                f"{type(registration.converter).__name__} for {description} at priority "
+                f"{priority}. Register it with a different priority to override or defer to "
+                "the existing converter."
+            )
+
+
+def _add_registration(
+    registrations_for_typename: dict[str, list[_Registration]],
+    converter_for_typename: dict[str, Converter[Any, Any]],
+    typename: str,
+    registration: _Registration,
+) -> None:
+    registrations = registrations_for_typename.setdefault(typename, [])
+    registrations.append(registration)
+    registrations.sort(key=lambda entry: (-entry.priority, entry.sequence_number))
+    converter_for_typename[typename] = registrations[0].converter
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import collections
+import datetime as dt
+import sys
+import threading
+from typing import Callable
+
+from google.protobuf import any_pb2
+
+# Immutable types that are not imported by default, so they are identified by name.
+_IMMUTABLE_TYPENAMES = frozenset({"pyarrow.lib.RecordBatch", "pyarrow.lib.Table"})
+
+# The list elements that can be shared between copies of a list. hightime datetimes and
+# timedeltas are subclasses of the datetime ones.
+_IMMUTABLE_SCALAR_TYPES = (bool, int, float, complex, str, bytes, dt.datetime, dt.timedelta)
+
+
+class _DecodedValueCache:
+    """An LRU cache of Python values decoded from protobuf Any messages.
+
+    Entries are keyed by the Any's type URL and payload. Using the payload itself as the key is
+    cheaper than computing a cryptographic digest of it, and the equality check on lookup rules
+    out false hits.
+
+    Only values that are immutable, or that can be copied much faster than they are decoded,
+    are cached: strings, bytes, pyarrow tables, and lists of immutable scalars. Callers get a
+    copy of a cached list, so mutating it does not affect later lookups. Other values, such as
+    numpy arrays and waveforms, take about as long to copy as to decode, so they are decoded
+    on every lookup, and their type URL is not looked up again until the cache is cleared.
+    """
+
+    __slots__ = [
+        "_lock",
+        "_entries",
+        "_uncacheable_type_urls",
+        "_total_bytes",
+        "_max_entries",
+        "_max_bytes",
+        "_min_bytes",
+    ]
+
+    def __init__(self, *, max_entries: int, max_bytes: int, min_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The maximum number of values to keep.
+            max_bytes: The maximum total size of the values to keep, counting both the payload
+                and an estimate of the size of the decoded value.
+            min_bytes: The minimum payload size worth caching. Smaller payloads decode faster
+                than they can be looked up.
+        """
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[tuple[str, bytes], tuple[object, int]] = (
+            collections.OrderedDict()
+        )
+        self._uncacheable_type_urls: set[str] = set()
+        self._total_bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._min_bytes = min_bytes
+
+    def get_or_decode(
+        self, protobuf_any: any_pb2.Any, decode: Callable[[any_pb2.Any], object]
+    ) -> object:
+        """Return a copy of the cached value for protobuf_any, decoding it on a cache miss."""
+        type_url = protobuf_any.type_url
+        if type_url in self._uncacheable_type_urls:
+            return decode(protobuf_any)
+        payload = protobuf_any.value
+        if len(payload) < self._min_bytes or len(payload) > self._max_bytes:
+            return decode(protobuf_any)
+
+        key = (type_url, payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return _copy_decoded_value(entry[0])
+
+        value = decode(protobuf_any)
+        value_size = _get_decoded_size(value)
+        if value_size is None:
+            with self._lock:
+                self._uncacheable_type_urls.add(type_url)
+            return value
+
+        size = len(payload) + value_size
+        with self._lock:
+            if key not in self._entries and size <= self._max_bytes:
+                self._entries[key] = (value, size)
+                self._total_bytes += size
+                self._evict()
+        return _copy_decoded_value(value)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._uncacheable_type_urls.clear()
+            self._total_bytes = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+
+
+def _get_decoded_size(value: object) -> int | None:
+    """Estimate the memory used by a decoded value, or return None if it cannot be cached."""
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    value_type = type(value)
+    if f"{value_type.__module__}.{value_type.__qualname__}" in _IMMUTABLE_TYPENAMES:
+        return int(getattr(value, "nbytes", 0))
+    if isinstance(value, list):
+        # Decoded lists are homogeneous, so the first element stands in for the others, and
+        # for 2D arrays the first row stands in for the other rows.
+        if not value:
+            return sys.getsizeof(value)
+        if isinstance(value[0], list):
+            row_size = _get_decoded_size(value[0])
+            return None if row_size is None else sys.getsizeof(value) + len(value) * row_size
+        if isinstance(value[0], _IMMUTABLE_SCALAR_TYPES):
+            return sys.getsizeof(value) + len(value) * sys.getsizeof(value[0])
+    return None
+
+
+def _copy_decoded_value(value: object) -> object:
+    if isinstance(value, list):
+        if value and isinstance(value[0], list):
+            return [list(row) for row in value]
+        return list(value)
+    return value
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+import datetime as dt
+import enum
+import threading
+from typing import Callable, NamedTuple
+
+import nitypes.bintime as bt
+from google.protobuf import any_pb2
+
+_IMMUTABLE_SCALAR_TYPES = (
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    enum.Enum,
+    dt.datetime,  # Includes hightime.datetime
+    dt.timedelta,  # Includes hightime.timedelta
+    bt.DateTime,
+    bt.TimeDelta,
+)
+
+
+class EncodedValue:
+    """A panel value that has already been converted to the form that is sent to the panel.
+
+    Encode a value once with ``PanelValueAccessor.encode()`` and pass it to ``set_encoded()``
+    to send it to several value ids or panels without converting it again.
+    """
+
+    __slots__ = ["_protobuf_any", "__weakref__"]
+
+    def __init__(self, protobuf_any: any_pb2.Any) -> None:
+        """Initialize the encoded value.
+
+        Args:
+            protobuf_any: The serialized value.
+        """
+        self._protobuf_any = protobuf_any
+
+    @property
+    def typename(self) -> str:
+        """The full name of the value's protobuf message type."""
+        return self._protobuf_any.TypeName()
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the serialized value in bytes."""
+        return self._protobuf_any.ByteSize()
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__name__}"
+            f"({self.typename!r}, nbytes={self.nbytes})"
+        )
+
+
+class _MemoEntry(NamedTuple):
+    value: object
+    version: object
+    encoded_value: EncodedValue
+
+
+class _EncodedValueMemo:
+    """Remembers the encoded form of recently encoded immutable values.
+
+    Entries are keyed by the value's identity, so looking one up does not compare or hash the
+    value. Each entry keeps a reference to its value, so that the identity cannot be reused
+    by another object, and records the version of the converters that encoded it. Mutable
+    values, such as lists, arrays, and waveforms, are always encoded again, because they may
+    have changed since they were last encoded.
+    """
+
+    __slots__ = ["_lock", "_entries", "_total_bytes", "_max_entries", "_max_bytes"]
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_entries: The maximum number of values to remember.
+            max_bytes: The maximum total size of the encoded values to remember.
+        """
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[int, _MemoEntry] = collections.OrderedDict()
+        self._total_bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+    def get_or_encode(
+        self, value: object, version: object, encode: Callable[[object], EncodedValue]
+    ) -> EncodedValue:
+        """Return the remembered encoded value, or encode the value with encode."""
+        key = id(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.value is value and entry.version == version:
+                self._entries.move_to_end(key)
+                return entry.encoded_value
+
+        encoded_value = encode(value)
+        # An immutable value is only checked when it is first remembered, since it cannot
+        # become mutable later.
+        if encoded_value.nbytes > self._max_bytes or not _is_immutable(value):
+            return encoded_value
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._total_bytes -= old_entry.encoded_value.nbytes
+            self._entries[key] = _MemoEntry(value, version, encoded_value)
+            self._total_bytes += encoded_value.nbytes
+            while len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_entry.encoded_value.nbytes
+        return encoded_value
+
+
+def _is_immutable(value: object) -> bool:
+    if isinstance(value, _IMMUTABLE_SCALAR_TYPES):
+        return True
+    # Includes named tuples.
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        parameters = getattr(value, "__dataclass_params__")
+        return bool(parameters.frozen) and all(
+            _is_immutable(getattr(value, field.name)) for field in dataclasses.fields(value)
+        )
+    return False
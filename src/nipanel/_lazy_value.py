@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+import nitypes.bintime as bt
+import numpy as np
+from google.protobuf import any_pb2, symbol_database
+from google.protobuf.message import Message
+from ni.protobuf.types import precision_timestamp_conversion
+from nitypes.complex import ComplexInt32DType
+
+from nipanel.converters._wire_format import (
+    _WIRE_TYPE_LENGTH_DELIMITED,
+    _WireField,
+    _iter_wire_fields,
+)
+
+_NOT_DECODED = object()
+
+
+class _SampleField(NamedTuple):
+    """How a message type stores its samples."""
+
+    field_number: int
+    dtype: np.dtype[Any]
+    bytes_per_value: int | None
+    """The size of each value, or None for varints."""
+    values_per_sample: int = 1
+
+
+_SAMPLE_FIELD_FOR_PROTOBUF_TYPE = {
+    "ni.protobuf.types.BoolArray": _SampleField(1, np.dtype(np.bool_), None),
+    "ni.protobuf.types.DoubleArray": _SampleField(1, np.dtype(np.float64), 8),
+    "ni.protobuf.types.SInt64Array": _SampleField(1, np.dtype(np.int64), None),
+    "ni.protobuf.types.Double2DArray": _SampleField(3, np.dtype(np.float64), 8),
+    "ni.protobuf.types.DoubleAnalogWaveform": _SampleField(3, np.dtype(np.float64), 8),
+    "ni.protobuf.types.I16AnalogWaveform": _SampleField(3, np.dtype(np.int16), None),
+    "ni.protobuf.types.DoubleComplexWaveform": _SampleField(3, np.dtype(np.complex128), 8, 2),
+    "ni.protobuf.types.I16ComplexWaveform": _SampleField(3, ComplexInt32DType, None, 2),
+    "ni.protobuf.types.DoubleSpectrum": _SampleField(3, np.dtype(np.float64), 8),
+    "ni.protobuf.types.DigitalWaveform": _SampleField(4, np.dtype(np.uint8), 1),
+    "nipanel.protobuf.types.I8AnalogWaveform": _SampleField(3, np.dtype(np.int8), 1),
+    "nipanel.protobuf.types.I32AnalogWaveform": _SampleField(3, np.dtype(np.int32), 4),
+    "nipanel.protobuf.types.Image": _SampleField(4, np.dtype(np.uint8), 1),
+    "nipanel.protobuf.types.NDArray": _SampleField(3, np.dtype(np.uint8), 1),
+    "nipanel.protobuf.types.PackedDigitalWaveform": _SampleField(4, np.dtype(np.uint8), 1),
+    "nipanel.protobuf.types.QuantizedAnalogWaveform": _SampleField(3, np.dtype(np.int16), 2),
+    "nipanel.protobuf.types.TimestampArray": _SampleField(1, np.dtype("datetime64[ns]"), 8),
+}
+
+# Message types that store their shape and dtype, like numpy arrays.
+_SHAPED_PROTOBUF_TYPES = frozenset(
+    {"nipanel.protobuf.types.Image", "nipanel.protobuf.types.NDArray"}
+)
+
+
+class LazyValue:
+    """A panel value that is not decoded until it is used.
+
+    Getting a value with ``lazy=True`` returns a LazyValue that holds the value's serialized
+    bytes. The value is decoded the first time one of its attributes is accessed, or when it
+    is compared, indexed, iterated, or converted to a numpy array. A value that is never used
+    never costs decode time.
+
+    For arrays and waveforms, ``sample_count``, ``dtype``, and ``t0`` are read from the
+    serialized bytes without decoding the samples.
+    """
+
+    __slots__ = ["_protobuf_any", "_as_numpy", "_value", "_data", "_metadata", "__weakref__"]
+
+    def __init__(self, protobuf_any: any_pb2.Any, *, as_numpy: bool = False) -> None:
+        """Initialize the lazy value.
+
+        Args:
+            protobuf_any: The serialized value.
+            as_numpy: Whether to decode arrays as numpy arrays. See ``from_any``.
+        """
+        self._protobuf_any = protobuf_any
+        self._as_numpy = as_numpy
+        self._value: object = _NOT_DECODED
+        self._data: memoryview | None = None
+        self._metadata: Message | None = None
+
+    @property
+    def typename(self) -> str:
+        """The full name of the value's protobuf message type."""
+        return self._protobuf_any.TypeName()
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the value has been decoded."""
+        return self._value is not _NOT_DECODED
+
+    @property
+    def value(self) -> object:
+        """The decoded value. The value is decoded the first time this is read."""
+        if self._value is _NOT_DECODED:
+            # Imported here because nipanel._convert imports this module.
+            from nipanel._convert import from_any
+
+            self._value = from_any(self._protobuf_any, as_numpy=self._as_numpy)
+        return self._value
+
+    @property
+    def sample_count(self) -> int | None:
+        """The number of samples in a waveform or spectrum, or elements in an array.
+
+        This is None for other types.
+        """
+        sample_field = _SAMPLE_FIELD_FOR_PROTOBUF_TYPE.get(self.typename)
+        if sample_field is None:
+            return None
+        metadata: Any = self._get_metadata()
+        if self.typename in _SHAPED_PROTOBUF_TYPES:
+            shape: list[int] = metadata.shape
+            return math.prod(shape)
+        value_count = _count_values(self._get_sample_fields(), sample_field)
+        bytes_per_sample = sample_field.values_per_sample
+        if self.typename == "ni.protobuf.types.DigitalWaveform":
+            bytes_per_sample = metadata.signal_count
+        elif self.typename == "nipanel.protobuf.types.PackedDigitalWaveform":
+            bytes_per_sample = (metadata.signal_count + 7) // 8
+        return value_count // max(bytes_per_sample, 1)
+
+    @property
+    def dtype(self) -> np.dtype[Any] | None:
+        """The numpy dtype of the samples in an array, waveform, or spectrum.
+
+        This is None for other types.
+        """
+        sample_field = _SAMPLE_FIELD_FOR_PROTOBUF_TYPE.get(self.typename)
+        if sample_field is None:
+            return None
+        if self.typename in _SHAPED_PROTOBUF_TYPES:
+            metadata: Any = self._get_metadata()
+            dtype_str: str = metadata.dtype
+            return np.dtype(dtype_str)
+        return sample_field.dtype
+
+    @property
+    def t0(self) -> bt.DateTime | None:
+        """The time of a waveform's first sample, or None if it does not have one."""
+        if self.typename not in _SAMPLE_FIELD_FOR_PROTOBUF_TYPE:
+            return None
+        metadata: Any = self._get_metadata()
+        fields = metadata.DESCRIPTOR.fields_by_name
+        if "t0" in fields and metadata.HasField("t0"):
+            return precision_timestamp_conversion.bintime_datetime_from_protobuf(metadata.t0)
+        if "timestamps" in fields and metadata.timestamps:
+            return precision_timestamp_conversion.bintime_datetime_from_protobuf(
+                metadata.timestamps[0]
+            )
+        return None
+
+    def _get_metadata(self) -> Message:
+        """Parse every field of the message except its samples."""
+        if self._metadata is None:
+            sample_field = _SAMPLE_FIELD_FOR_PROTOBUF_TYPE[self.typename]
+            data = self._get_data()
+            message_type = symbol_database.Default().GetSymbol(self.typename)
+            self._metadata = message_type.FromString(
+                b"".join(
+                    data[field.start : field.end]
+                    for field in _iter_wire_fields(data)
+                    if field.field_number != sample_field.field_number
+                )
+            )
+        return self._metadata
+
+    def _get_data(self) -> memoryview:
+        # Reading Any.value can copy the serialized bytes, so only read it once.
+        if self._data is None:
+            self._data = memoryview(self._protobuf_any.value)
+        return self._data
+
+    def _get_sample_fields(self) -> list[tuple[_WireField, memoryview]]:
+        sample_field = _SAMPLE_FIELD_FOR_PROTOBUF_TYPE[self.typename]
+        data = self._get_data()
+        return [
+            (field, data[field.value_start : field.end])
+            for field in _iter_wire_fields(data)
+            if field.field_number == sample_field.field_number
+        ]
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the decoded value."""
+        # Leave special methods alone, so that protocols like copy and pickle see LazyValue.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __len__(self) -> int:
+        """Get the length of the decoded value."""
+        value: Any = self.value
+        return len(value)
+
+    def __bool__(self) -> bool:
+        """Get the truth value of the decoded value."""
+        return bool(self.value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the decoded value."""
+        value: Any = self.value
+        return iter(value)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Index the decoded value."""
+        value: Any = self.value
+        return value[key]
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray[Any, Any]:
+        """Convert the decoded value to a numpy array.
+
+        Raises:
+            ValueError: If copy is False and the decoded value is not a numpy array with the
+                requested dtype.
+        """
+        value = self.value
+        if copy is False:
+            if not isinstance(value, np.ndarray) or (
+                dtype is not None and np.dtype(dtype) != value.dtype
+            ):
+                raise ValueError("Unable to avoid copy while creating an array as requested.")
+            return value
+        if copy:
+            return np.array(value, dtype=dtype, copy=True)
+        return np.asarray(value, dtype=dtype)
+
+    def __eq__(self, other: object) -> Any:
+        """Compare the decoded value with another value.
+
+        Like comparing the decoded value itself, comparing a numpy array returns an array of
+        elementwise results.
+        """
+        if isinstance(other, LazyValue):
+            other = other.value
+        value: Any = self.value
+        return value == other
+
+    def __ne__(self, other: object) -> Any:
+        """Compare the decoded value with another value."""
+        if isinstance(other, LazyValue):
+            other = other.value
+        value: Any = self.value
+        return value != other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return repr(self) without decoding the value."""
+        state = f"value={self._value!r}" if self.is_decoded else "not decoded"
+        return f"{self.__class__.__module__}.{self.__class__.__name__}({self.typename!r}, {state})"
+
+
+def _count_values(
+    sample_fields: list[tuple[_WireField, memoryview]], sample_field: _SampleField
+) -> int:
+    count = 0
+    for field, payload in sample_fields:
+        if field.wire_type != _WIRE_TYPE_LENGTH_DELIMITED:
+            # An unpacked repeated value.
+            count += 1
+        elif sample_field.bytes_per_value is None:
+            # Each varint ends with the only one of its bytes that has the high bit clear.
+            count += int(np.count_nonzero(np.frombuffer(payload, dtype=np.uint8) < 0x80))
+        else:
+            count += len(payload) // sample_field.bytes_per_value
+    return count
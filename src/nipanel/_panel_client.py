@@ -21,10 +21,8 @@ from ni.panels.v1.streamlit_panel_configuration_pb2 import StreamlitPanelConfigu
 from ni_grpc_extensions.channelpool import GrpcChannelPool
 from typing_extensions import ParamSpec
 
-from nipanel._convert import (
-    from_any,
-    to_any,
-)
+from nipanel._convert import from_any
+from nipanel._value_encoder import _ValueEncoder
 
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
@@ -47,6 +45,7 @@ class _PanelClient:
         self._grpc_channel_pool = grpc_channel_pool
         self._grpc_channel = grpc_channel
         self._stub: PanelServiceStub | None = None
+        self._value_encoders: dict[tuple[str, str], _ValueEncoder] = {}
 
     def start_streamlit_panel(
         self, panel_id: str, panel_script_path: pathlib.Path, python_interpreter_path: pathlib.Path
@@ -79,22 +78,43 @@ class _PanelClient:
         }
 
     def set_value(self, panel_id: str, value_id: str, value: object, notify: bool) -> None:
-        new_any = to_any(value)
+        value_encoder = self._value_encoders.get((panel_id, value_id))
+        if value_encoder is None:
+            value_encoder = self._value_encoders.setdefault(
+                (panel_id, value_id), _ValueEncoder(panel_id, value_id)
+            )
+        value_encoder.encode_and_send(value, notify, self._send_set_value_request)
+
+    def set_value_any(self, panel_id: str, value_id: str, value: Any, notify: bool) -> None:
         set_value_request = SetValueRequest(
-            panel_id=panel_id, value_id=value_id, value=new_any, notify=notify
+            panel_id=panel_id, value_id=value_id, value=value, notify=notify
         )
+        self._send_set_value_request(set_value_request)
+
+    def _send_set_value_request(self, set_value_request: SetValueRequest) -> None:
         self._invoke_with_retry(self._get_stub().SetValue, set_value_request)
 
-    def get_value(self, panel_id: str, value_id: str) -> object:
+    def get_value(
+        self, panel_id: str, value_id: str, *, as_numpy: bool = False, lazy: bool = False
+    ) -> object:
         get_value_request = GetValueRequest(panel_id=panel_id, value_id=value_id)
         response = self._invoke_with_retry(self._get_stub().GetValue, get_value_request)
-        return from_any(response.value)
+        return from_any(response.value, as_numpy=as_numpy, lazy=lazy)
+
+    def try_get_value(
+        self, panel_id: str, value_id: str, *, as_numpy: bool = False, lazy: bool = False
+    ) -> object | None:
+        value_any = self.try_get_value_any(panel_id, value_id)
+        if value_any is not None:
+            return from_any(value_any, as_numpy=as_numpy, lazy=lazy)
+        else:
+            return None
 
-    def try_get_value(self, panel_id: str, value_id: str) -> object | None:
+    def try_get_value_any(self, panel_id: str, value_id: str) -> Any | None:
         try_get_value_request = TryGetValueRequest(panel_id=panel_id, value_id=value_id)
         response = self._invoke_with_retry(self._get_stub().TryGetValue, try_get_value_request)
         if response.HasField("value"):
-            return from_any(response.value)
+            return response.value
         else:
             return None
 
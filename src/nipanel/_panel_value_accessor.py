@@ -3,19 +3,83 @@ from __future__ import annotations
 import collections
 import enum
 from abc import ABC
-from typing import TypeVar, overload
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from typing import Any, Callable, NamedTuple, TypeVar, overload
 
 import grpc
 import hightime as ht
 import nitypes.bintime as bt
+import numpy as np
+from google.protobuf import any_pb2
+from google.protobuf.message import Message
 from ni.measurementlink.discovery.v1.client import DiscoveryClient
 from ni_grpc_extensions.channelpool import GrpcChannelPool
 from nitypes.time import convert_datetime, convert_timedelta
 
+from nipanel._array_delta import (
+    _DELTA_TYPE_URL,
+    _KEYFRAME_VALUE_ID_SUFFIX,
+    _apply_delta,
+    _ArrayDeltaEncoder,
+)
+from nipanel._convert import (
+    _to_quantized_any,
+    encode,
+    encode_many,
+    from_any,
+    get_fingerprint,
+    to_any,
+)
+from nipanel._encoded_value import EncodedValue
+from nipanel._lazy_value import LazyValue
 from nipanel._panel_client import _PanelClient
+from nipanel._protos import array_pb2
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel._waveform_metadata import (
+    _METADATA_VALUE_ID_SUFFIX,
+    _SAMPLES_TYPE_URL,
+    _join_waveform,
+    _WaveformMetadataEncoder,
+)
+from nipanel.converters._wire_format import _read_varint_field
+from nipanel.converters.composite import is_composite
 
 _T = TypeVar("_T")
 
+_FINGERPRINT_VALUE_ID_SUFFIX = ".__fingerprint__"
+
+# How many times to read a value again when its companion value changes while reading it.
+_MAX_COMPANION_ATTEMPTS = 3
+
+
+class _Companion(NamedTuple):
+    """A value that is published separately from the values that are relative to it."""
+
+    value_id_suffix: str
+    message_type: type[Message]
+    """The message type of the companion value, which has a generation field."""
+    generation_field_number: int
+    """The field of the relative value that holds the generation of its companion value."""
+    combine: Callable[[Any, any_pb2.Any], object]
+    """Combine the companion message and the relative value into the whole value."""
+
+
+_COMPANION_FOR_TYPE_URL = {
+    _SAMPLES_TYPE_URL: _Companion(
+        _METADATA_VALUE_ID_SUFFIX,
+        waveform_pb2_nipanel.DoubleAnalogWaveformMetadata,
+        waveform_pb2_nipanel.DoubleAnalogWaveformSamples.METADATA_GENERATION_FIELD_NUMBER,
+        _join_waveform,
+    ),
+    _DELTA_TYPE_URL: _Companion(
+        _KEYFRAME_VALUE_ID_SUFFIX,
+        array_pb2.ArrayKeyframe,
+        array_pb2.ArrayDelta.KEYFRAME_GENERATION_FIELD_NUMBER,
+        _apply_delta,
+    ),
+}
+
 
 class PanelValueAccessor(ABC):
     """This class allows you to access values for a panel's controls."""
@@ -25,6 +89,11 @@ class PanelValueAccessor(ABC):
         "_panel_id",
         "_notify_on_set_value",
         "_last_values",
+        "_fingerprinted_value_ids",
+        "_fingerprinted_values",
+        "_waveform_metadata_encoders",
+        "_array_delta_encoders",
+        "_companion_messages",
         "__weakref__",
     ]
 
@@ -48,6 +117,11 @@ class PanelValueAccessor(ABC):
         self._last_values: collections.defaultdict[str, object] = collections.defaultdict(
             lambda: object()
         )
+        self._fingerprinted_value_ids: set[str] = set()
+        self._fingerprinted_values: dict[str, tuple[str, any_pb2.Any]] = {}
+        self._waveform_metadata_encoders: dict[str, _WaveformMetadataEncoder] = {}
+        self._array_delta_encoders: dict[str, _ArrayDeltaEncoder] = {}
+        self._companion_messages: dict[str, Any] = {}
 
     @property
     def panel_id(self) -> str:
@@ -55,17 +129,45 @@ class PanelValueAccessor(ABC):
         return self._panel_id
 
     @overload
-    def get_value(self, value_id: str) -> object: ...
+    def get_value(
+        self, value_id: str, *, fingerprint: bool = ..., as_numpy: bool = ..., lazy: bool = ...
+    ) -> object: ...
 
     @overload
-    def get_value(self, value_id: str, default_value: _T) -> _T: ...
+    def get_value(
+        self,
+        value_id: str,
+        default_value: _T,
+        *,
+        fingerprint: bool = ...,
+        as_numpy: bool = ...,
+        lazy: bool = ...,
+    ) -> _T: ...
 
-    def get_value(self, value_id: str, default_value: _T | None = None) -> _T | object:
+    def get_value(
+        self,
+        value_id: str,
+        default_value: _T | None = None,
+        *,
+        fingerprint: bool = False,
+        as_numpy: bool = False,
+        lazy: bool = False,
+    ) -> _T | object:
         """Get the value for a control on the panel with an optional default value.
 
         Args:
             value_id: The id of the value
             default_value: The default value to return if the value is not set
+            fingerprint: If True, fetch the value's fingerprint first and reuse the
+                previously fetched value if the fingerprint has not changed. This only
+                avoids a transfer if the value was set with ``fingerprint=True``.
+            as_numpy: If True, return arrays of floats, integers, and bools as numpy arrays
+                instead of lists. This avoids creating a Python object for each element.
+            lazy: If True, return a LazyValue that is decoded the first time it is used,
+                instead of the value itself. Its sample count, dtype, and t0 can be read
+                without decoding it. The value is not converted to the type of
+                default_value. A waveform set with ``metadata_once=True`` or an array set
+                with ``delta=True`` is always decoded.
 
         Returns:
             The value, or the default value if not set. The returned value will
@@ -74,13 +176,20 @@ class PanelValueAccessor(ABC):
         Raises:
             KeyError: If the value is not set and no default value is provided
         """
-        value = self._panel_client.try_get_value(self._panel_id, value_id)
+        if fingerprint:
+            value = self._try_get_fingerprinted_value(value_id, as_numpy, lazy)
+        else:
+            value = self._try_get_value(value_id, as_numpy, lazy)
         if value is None:
             if default_value is not None:
                 return default_value
             raise KeyError(f"Value with id '{value_id}' not found on panel '{self._panel_id}'.")
 
-        if default_value is not None and not isinstance(value, type(default_value)):
+        if (
+            default_value is not None
+            and not isinstance(value, type(default_value))
+            and not isinstance(value, LazyValue)
+        ):
             if isinstance(default_value, enum.Enum):
                 enum_type = type(default_value)
                 return enum_type(value)
@@ -97,30 +206,196 @@ class PanelValueAccessor(ABC):
             if isinstance(default_value, bt.TimeDelta) and isinstance(value, ht.timedelta):
                 return convert_timedelta(bt.TimeDelta, value)
 
-            # lists are allowed to not match, since sets and tuples are converted to lists
-            if not isinstance(value, list):
+            # Composite values are always read back as dicts, so a dataclass or named tuple
+            # default is rebuilt from the dict's fields.
+            if isinstance(value, dict) and is_composite(default_value):
+                composite_type = type(default_value)
+                try:
+                    return composite_type(**value)
+                except TypeError as e:
+                    raise TypeError(
+                        f"Value fields {list(value)} do not match default value type {composite_type.__name__}."
+                    ) from e
+
+            # lists are allowed to not match, since sets and tuples are converted to lists,
+            # and so are numpy arrays, since any collection may be returned as one
+            if not isinstance(value, (list, np.ndarray)):
                 raise TypeError(
                     f"Value type {type(value).__name__} does not match default value type {type(default_value).__name__}."
                 )
 
         return value
 
-    def set_value(self, value_id: str, value: object) -> None:
+    def set_value(
+        self,
+        value_id: str,
+        value: object,
+        *,
+        fingerprint: bool = False,
+        metadata_once: bool = False,
+        delta: bool = False,
+        quantize: bool = False,
+    ) -> float | None:
         """Set the value for a control on the panel.
 
         Args:
             value_id: The id of the value
             value: The value
+            fingerprint: If True, also publish a fingerprint of the value so that
+                ``get_value(..., fingerprint=True)`` can skip fetching it when it has
+                not changed. If False, a fingerprint that this accessor published for the
+                value is cleared. A fingerprint that another accessor published, such as
+                one in an earlier run of a script, is not, so readers would keep getting the
+                value it identifies. Set a value either always or never with a fingerprint.
+            metadata_once: If True, the value must be an AnalogWaveform with float64
+                samples. Its extended properties, sample interval, and time offset are
+                published separately, and only when they differ from those of the last
+                waveform set this way, so the value itself is just the samples and start
+                time. ``get_value()`` combines them into the whole waveform again. This
+                suits small waveforms that are set many times a second.
+            delta: If True, the value must be a numpy array. Only the elements that differ
+                from a keyframe, an earlier array that is published separately, are sent,
+                either as their indices and values or as compressed XORed bytes, whichever is
+                smaller. A new keyframe is published when the shape or dtype changes, when
+                too much of the array changed, and periodically. This suits large arrays that
+                change slowly, such as averaged spectra and heatmaps. ``get_value()`` applies
+                the changes to the keyframe and returns a numpy array.
+            quantize: If True, send the samples of float64 AnalogWaveforms as 16-bit integers
+                with a linear scale, which is a quarter of the data. This applies to a
+                waveform, a collection of waveforms, and the waveforms in the fields of a
+                dict, dataclass, or named tuple. ``get_value()`` returns AnalogWaveforms with
+                the 16-bit samples as their raw_data, whose scaled_data approximates the
+                original samples. This suits waveforms that are only plotted.
+
+        Returns:
+            If quantize is True, the error bound: the most that a scaled sample of a sent
+            waveform differs from the original sample, or 0.0 if the value has no float64
+            AnalogWaveforms. Otherwise, None.
+
+        Raises:
+            TypeError: If metadata_once is True and the value is not an AnalogWaveform with
+                float64 samples, or if delta is True and the value is not a numpy array.
+            ValueError: If quantize is combined with metadata_once or delta, or a sample of a
+                waveform to quantize is NaN or infinite.
         """
         if isinstance(value, enum.Enum):
             value = value.value
 
-        self._panel_client.set_value(
-            self._panel_id, value_id, value, notify=self._notify_on_set_value
-        )
+        error_bound: float | None = None
+        if quantize:
+            if metadata_once or delta:
+                raise ValueError("quantize cannot be combined with metadata_once or delta.")
+            value_any, error_bound = _to_quantized_any(value)
+            self._set_value_any(value_id, value_any, fingerprint)
+        elif metadata_once:
+            encoder = self._waveform_metadata_encoders.get(value_id)
+            if encoder is None:
+                encoder = self._waveform_metadata_encoders.setdefault(
+                    value_id, _WaveformMetadataEncoder()
+                )
+            metadata_any, samples_any = encoder.encode(value)
+            self._set_value_with_companion(
+                value_id,
+                samples_any,
+                value_id + _METADATA_VALUE_ID_SUFFIX,
+                metadata_any,
+                fingerprint,
+            )
+        elif delta:
+            delta_encoder = self._array_delta_encoders.get(value_id)
+            if delta_encoder is None:
+                delta_encoder = self._array_delta_encoders.setdefault(
+                    value_id, _ArrayDeltaEncoder()
+                )
+            keyframe_any, delta_any = delta_encoder.encode(value)
+            self._set_value_with_companion(
+                value_id,
+                delta_any,
+                value_id + _KEYFRAME_VALUE_ID_SUFFIX,
+                keyframe_any,
+                fingerprint,
+            )
+        elif fingerprint or value_id in self._fingerprinted_value_ids:
+            self._set_fingerprinted_value(value_id, value, fingerprint)
+        else:
+            self._panel_client.set_value(
+                self._panel_id, value_id, value, notify=self._notify_on_set_value
+            )
+        self._fingerprinted_values.pop(value_id, None)
         self._last_values[value_id] = value
+        return error_bound
+
+    def set_values(self, values: Mapping[str, object], *, executor: Executor | None = None) -> None:
+        """Set the values for several controls on the panel.
+
+        The values are encoded together with ``encode_many()``, which can spread the work
+        across the executor's workers, and then sent one after another. If the accessor
+        notifies the panel when a value is set, it notifies it after the last value is sent
+        instead of after each one. Values that were published with a fingerprint are
+        published with a new fingerprint.
+
+        Args:
+            values: The values, keyed by value id.
+            executor: The executor to encode the values in. See ``encode_many()``.
+        """
+        values = {
+            value_id: value.value if isinstance(value, enum.Enum) else value
+            for value_id, value in values.items()
+        }
+
+        value_anys = encode_many(values.values(), executor=executor)
+        for index, (value_id, value_any) in enumerate(zip(values, value_anys)):
+            notify = self._notify_on_set_value and index == len(value_anys) - 1
+            if value_id in self._fingerprinted_value_ids:
+                self._set_fingerprinted_value_any(value_id, value_any, True, notify)
+            else:
+                self._panel_client.set_value_any(self._panel_id, value_id, value_any, notify=notify)
+            self._fingerprinted_values.pop(value_id, None)
+            self._last_values[value_id] = values[value_id]
+
+    def encode(self, value: object) -> EncodedValue:
+        """Convert a value to the form that is sent to the panel.
+
+        Pass the returned EncodedValue to ``set_encoded()`` to send the same value to several
+        value ids, or to the accessors for several panels, while converting it only once.
+        Encoding the same immutable object again, such as a tuple of channel names, returns
+        the EncodedValue from the first call.
+
+        Args:
+            value: The value to encode.
+
+        Returns:
+            The encoded value.
+        """
+        if isinstance(value, enum.Enum):
+            value = value.value
+        return encode(value)
+
+    def set_encoded(
+        self, value_id: str, encoded_value: EncodedValue, *, fingerprint: bool = False
+    ) -> None:
+        """Set the value for a control on the panel to a value returned by ``encode()``.
+
+        Args:
+            value_id: The id of the value
+            encoded_value: The encoded value
+            fingerprint: If True, also publish a fingerprint of the value. See set_value().
+        """
+        self._set_value_any(value_id, encoded_value._protobuf_any, fingerprint)
+        self._fingerprinted_values.pop(value_id, None)
+        # The decoded value is not known, so the next set_value_if_changed() always sets it.
+        self._last_values.pop(value_id, None)
 
-    def set_value_if_changed(self, value_id: str, value: object) -> None:
+    def set_value_if_changed(
+        self,
+        value_id: str,
+        value: object,
+        *,
+        fingerprint: bool = False,
+        metadata_once: bool = False,
+        delta: bool = False,
+        quantize: bool = False,
+    ) -> float | None:
         """Set the value for a control on the panel only if it has changed since the last call.
 
         This method helps reduce unnecessary updates when the value hasn't changed.
@@ -128,6 +403,177 @@ class PanelValueAccessor(ABC):
         Args:
             value_id: The id of the value
             value: The value to set
+            fingerprint: If True, also publish a fingerprint of the value. See set_value().
+            metadata_once: If True, publish the waveform's metadata only when it changes.
+                See set_value().
+            delta: If True, send only the elements of the array that differ from a keyframe.
+                See set_value().
+            quantize: If True, send the samples of float64 AnalogWaveforms as 16-bit
+                integers. See set_value().
+
+        Returns:
+            If quantize is True and the value has changed, the error bound. See set_value().
+            Otherwise, None.
         """
-        if value != self._last_values[value_id]:
-            self.set_value(value_id, value)
+        if not self._has_value_changed(value_id, value):
+            return None
+        return self.set_value(
+            value_id,
+            value,
+            fingerprint=fingerprint,
+            metadata_once=metadata_once,
+            delta=delta,
+            quantize=quantize,
+        )
+
+    def _has_value_changed(self, value_id: str, value: object) -> bool:
+        """Check whether a value differs from the last value set for value_id."""
+        if isinstance(value, enum.Enum):
+            value = value.value
+        last_value = self._last_values[value_id]
+        if value is last_value:
+            return False
+        # Comparing arrays with != is elementwise, so compare the dtype and contents instead.
+        if isinstance(value, np.ndarray) and isinstance(last_value, np.ndarray):
+            return value.dtype != last_value.dtype or not np.array_equal(value, last_value)
+        if isinstance(value, np.ndarray) or isinstance(last_value, np.ndarray):
+            return True
+        try:
+            return bool(value != last_value)
+        except ValueError:
+            # Comparing containers of arrays, such as dicts, is ambiguous as a bool.
+            return True
+
+    def _set_value_any(self, value_id: str, value_any: any_pb2.Any, fingerprint: bool) -> None:
+        if fingerprint or value_id in self._fingerprinted_value_ids:
+            self._set_fingerprinted_value_any(
+                value_id, value_any, fingerprint, self._notify_on_set_value
+            )
+        else:
+            self._panel_client.set_value_any(
+                self._panel_id, value_id, value_any, notify=self._notify_on_set_value
+            )
+
+    def _set_fingerprinted_value(self, value_id: str, value: object, fingerprint: bool) -> None:
+        self._set_fingerprinted_value_any(
+            value_id, to_any(value), fingerprint, self._notify_on_set_value
+        )
+
+    def _set_fingerprinted_value_any(
+        self, value_id: str, value_any: any_pb2.Any, fingerprint: bool, notify: bool
+    ) -> None:
+        # An empty fingerprint tells readers that a previously published fingerprint is stale.
+        new_fingerprint = get_fingerprint(value_any) if fingerprint else ""
+
+        # Set the value before its fingerprint, so a reader that sees the new fingerprint
+        # never pairs it with the old value. Only the second call notifies the panel.
+        self._panel_client.set_value_any(self._panel_id, value_id, value_any, notify=False)
+        self._panel_client.set_value(
+            self._panel_id,
+            _get_fingerprint_value_id(value_id),
+            new_fingerprint,
+            notify=notify,
+        )
+        if fingerprint:
+            self._fingerprinted_value_ids.add(value_id)
+        else:
+            self._fingerprinted_value_ids.discard(value_id)
+
+    def _try_get_fingerprinted_value(
+        self, value_id: str, as_numpy: bool, lazy: bool
+    ) -> object | None:
+        current_fingerprint = self._panel_client.try_get_value(
+            self._panel_id, _get_fingerprint_value_id(value_id)
+        )
+        if not isinstance(current_fingerprint, str) or not current_fingerprint:
+            self._fingerprinted_values.pop(value_id, None)
+            return self._try_get_value(value_id, as_numpy, lazy)
+
+        # Keep the Any instead of the value and decode it again, so that mutating a returned
+        # value does not affect the next one.
+        cached_entry = self._fingerprinted_values.get(value_id)
+        if cached_entry is not None and cached_entry[0] == current_fingerprint:
+            return self._decode_value_any(value_id, cached_entry[1], as_numpy, lazy)
+
+        value_any = self._panel_client.try_get_value_any(self._panel_id, value_id)
+        if value_any is None:
+            return None
+        self._fingerprinted_values[value_id] = (current_fingerprint, value_any)
+        return self._decode_value_any(value_id, value_any, as_numpy, lazy)
+
+    def _set_value_with_companion(
+        self,
+        value_id: str,
+        value_any: any_pb2.Any,
+        companion_value_id: str,
+        companion_any: any_pb2.Any | None,
+        fingerprint: bool,
+    ) -> None:
+        # Set the companion value before the value, so a reader that sees the new value can
+        # always get the companion value that goes with it.
+        if companion_any is not None:
+            self._panel_client.set_value_any(
+                self._panel_id, companion_value_id, companion_any, notify=False
+            )
+        self._set_value_any(value_id, value_any, fingerprint)
+
+    def _try_get_value(self, value_id: str, as_numpy: bool, lazy: bool) -> object | None:
+        value_any = self._panel_client.try_get_value_any(self._panel_id, value_id)
+        if value_any is None:
+            return None
+        return self._decode_value_any(value_id, value_any, as_numpy, lazy)
+
+    def _decode_value_any(
+        self, value_id: str, value_any: any_pb2.Any, as_numpy: bool, lazy: bool
+    ) -> object | None:
+        companion = _COMPANION_FOR_TYPE_URL.get(value_any.type_url)
+        if companion is not None:
+            return self._get_value_with_companion(value_id, value_any, companion, as_numpy, lazy)
+        return from_any(value_any, as_numpy=as_numpy, lazy=lazy)
+
+    def _get_value_with_companion(
+        self,
+        value_id: str,
+        value_any: any_pb2.Any,
+        companion: _Companion,
+        as_numpy: bool,
+        lazy: bool,
+    ) -> object | None:
+        """Combine a value with its companion value, fetching the companion if it changed."""
+        companion_value_id = value_id + companion.value_id_suffix
+        for _ in range(_MAX_COMPANION_ATTEMPTS):
+            generation = _read_varint_field(value_any.value, companion.generation_field_number)
+            # Every companion message type has a generation field.
+            companion_message: Any = self._companion_messages.get(companion_value_id)
+            if companion_message is None or companion_message.generation != generation:
+                companion_any = self._panel_client.try_get_value_any(
+                    self._panel_id, companion_value_id
+                )
+                if companion_any is None:
+                    raise ValueError(
+                        f"Value with id '{companion_value_id}', which value '{value_id}' is "
+                        f"relative to, not found on panel '{self._panel_id}'."
+                    )
+                companion_message = companion.message_type()
+                companion_any.Unpack(companion_message)
+                self._companion_messages[companion_value_id] = companion_message
+            if companion_message.generation == generation:
+                return companion.combine(companion_message, value_any)
+
+            # The companion value changed after the value was read, so read the value that goes
+            # with the new companion value.
+            new_value_any = self._panel_client.try_get_value_any(self._panel_id, value_id)
+            if new_value_any is None:
+                return None
+            if new_value_any.type_url != value_any.type_url:
+                return from_any(new_value_any, as_numpy=as_numpy, lazy=lazy)
+            value_any = new_value_any
+
+        raise RuntimeError(
+            f"Value with id '{companion_value_id}' on panel '{self._panel_id}' changed "
+            f"{_MAX_COMPANION_ATTEMPTS} times while reading value '{value_id}'."
+        )
+
+
+def _get_fingerprint_value_id(value_id: str) -> str:
+    return value_id + _FINGERPRINT_VALUE_ID_SUFFIX
@@ -0,0 +1,10 @@
+"""Protobuf messages for values that the ni.protobuf.types messages do not represent.
+
+To regenerate the Python modules after editing a .proto file, install mypy-protobuf and run
+this from the src directory:
+
+    protoc -I . --python_out=. --mypy_out=. nipanel/_protos/<name>.proto
+
+For a .proto file that imports ni/protobuf/types messages, also pass the directory of an
+ni-apis checkout that contains them with another -I option.
+"""
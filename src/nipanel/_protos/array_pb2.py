@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: nipanel/_protos/array.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bnipanel/_protos/array.proto\x12\x16nipanel.protobuf.types\"5\n\x07NDArray\x12\r\n\x05\x64type\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x04\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"=\n\x0eTimestampArray\x12\x0f\n\x07seconds\x18\x01 \x01(\x0c\x12\x1a\n\x12\x66ractional_seconds\x18\x02 \x01(\x0c\"S\n\rArrayKeyframe\x12\x12\n\ngeneration\x18\x01 \x01(\x04\x12.\n\x05\x61rray\x18\x02 \x01(\x0b\x32\x1f.nipanel.protobuf.types.NDArray\"r\n\nArrayDelta\x12\x1b\n\x13keyframe_generation\x18\x01 \x01(\x04\x12\x17\n\x0f\x63hanged_indices\x18\x02 \x01(\x0c\x12\x16\n\x0e\x63hanged_values\x18\x03 \x01(\x0c\x12\x16\n\x0e\x63ompressed_xor\x18\x04 \x01(\x0c\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nipanel._protos.array_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _NDARRAY._serialized_start=55
+  _NDARRAY._serialized_end=108
+  _TIMESTAMPARRAY._serialized_start=110
+  _TIMESTAMPARRAY._serialized_end=171
+  _ARRAYKEYFRAME._serialized_start=173
+  _ARRAYKEYFRAME._serialized_end=256
+  _ARRAYDELTA._serialized_start=258
+  _ARRAYDELTA._serialized_end=372
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,129 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import collections.abc
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class NDArray(google.protobuf.message.Message):
+    """An N-dimensional array that preserves the element type and shape of a numpy array."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DTYPE_FIELD_NUMBER: builtins.int
+    SHAPE_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    dtype: builtins.str
+    """The numpy array-protocol type string of the elements, such as "<f4" or "|u1".
+    Multi-byte elements are always little-endian.
+    """
+    data: builtins.bytes
+    """The elements in C (row major) order."""
+    @property
+    def shape(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]:
+        """The length of each dimension. An empty shape is a 0-dimensional array."""
+
+    def __init__(
+        self,
+        *,
+        dtype: builtins.str = ...,
+        shape: collections.abc.Iterable[builtins.int] | None = ...,
+        data: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["data", b"data", "dtype", b"dtype", "shape", b"shape"]) -> None: ...
+
+global___NDArray = NDArray
+
+@typing.final
+class TimestampArray(google.protobuf.message.Message):
+    """An array of timestamps, with the same epoch and resolution as ni.protobuf.types.PrecisionTimestamp."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SECONDS_FIELD_NUMBER: builtins.int
+    FRACTIONAL_SECONDS_FIELD_NUMBER: builtins.int
+    seconds: builtins.bytes
+    """The whole seconds since the NI epoch, 1904-01-01 00:00:00 UTC, as little-endian int64 values."""
+    fractional_seconds: builtins.bytes
+    """The fractions of a second after seconds, in units of 2^-64 seconds, as little-endian uint64
+    values.
+    """
+    def __init__(
+        self,
+        *,
+        seconds: builtins.bytes = ...,
+        fractional_seconds: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["fractional_seconds", b"fractional_seconds", "seconds", b"seconds"]) -> None: ...
+
+global___TimestampArray = TimestampArray
+
+@typing.final
+class ArrayKeyframe(google.protobuf.message.Message):
+    """A numpy array that later ArrayDelta values are relative to, published separately from them."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    GENERATION_FIELD_NUMBER: builtins.int
+    ARRAY_FIELD_NUMBER: builtins.int
+    generation: builtins.int
+    """Identifies this keyframe. It changes with every keyframe."""
+    @property
+    def array(self) -> global___NDArray: ...
+    def __init__(
+        self,
+        *,
+        generation: builtins.int = ...,
+        array: global___NDArray | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["array", b"array"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["array", b"array", "generation", b"generation"]) -> None: ...
+
+global___ArrayKeyframe = ArrayKeyframe
+
+@typing.final
+class ArrayDelta(google.protobuf.message.Message):
+    """A numpy array, as the elements that differ from its keyframe. Either changed_indices and
+    changed_values or compressed_xor are set, whichever is smaller. If neither is set, the array
+    equals its keyframe.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    KEYFRAME_GENERATION_FIELD_NUMBER: builtins.int
+    CHANGED_INDICES_FIELD_NUMBER: builtins.int
+    CHANGED_VALUES_FIELD_NUMBER: builtins.int
+    COMPRESSED_XOR_FIELD_NUMBER: builtins.int
+    keyframe_generation: builtins.int
+    """The generation of the ArrayKeyframe that the array differs from."""
+    changed_indices: builtins.bytes
+    """The flat indices, in C (row major) order, of the elements that differ from the keyframe, as
+    increasing little-endian uint32 values.
+    """
+    changed_values: builtins.bytes
+    """The new values of those elements, with the keyframe's dtype."""
+    compressed_xor: builtins.bytes
+    """The bytes of every element XORed with the bytes of the keyframe's element, compressed with
+    zlib. The first byte of every element comes first, then the second byte of every element,
+    and so on, so the bytes that rarely change, such as the sign and exponent of a float, are
+    compressed together.
+    """
+    def __init__(
+        self,
+        *,
+        keyframe_generation: builtins.int = ...,
+        changed_indices: builtins.bytes = ...,
+        changed_values: builtins.bytes = ...,
+        compressed_xor: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["changed_indices", b"changed_indices", "changed_values", b"changed_values", "compressed_xor", b"compressed_xor", "keyframe_generation", b"keyframe_generation"]) -> None: ...
+
+global___ArrayDelta = ArrayDelta
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: nipanel/_protos/arrow.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bnipanel/_protos/arrow.proto\x12\x16nipanel.protobuf.types\" \n\nArrowTable\x12\x12\n\nipc_stream\x18\x01 \x01(\x0c\"&\n\x10\x41rrowRecordBatch\x12\x12\n\nipc_stream\x18\x01 \x01(\x0c\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nipanel._protos.arrow_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ARROWTABLE._serialized_start=55
+  _ARROWTABLE._serialized_end=87
+  _ARROWRECORDBATCH._serialized_start=89
+  _ARROWRECORDBATCH._serialized_end=127
+# @@protoc_insertion_point(module_scope)
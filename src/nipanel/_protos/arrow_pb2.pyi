@@ -0,0 +1,47 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import google.protobuf.descriptor
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class ArrowTable(google.protobuf.message.Message):
+    """An Apache Arrow table."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IPC_STREAM_FIELD_NUMBER: builtins.int
+    ipc_stream: builtins.bytes
+    """The table's schema and record batches, in the Arrow IPC streaming format."""
+    def __init__(
+        self,
+        *,
+        ipc_stream: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["ipc_stream", b"ipc_stream"]) -> None: ...
+
+global___ArrowTable = ArrowTable
+
+@typing.final
+class ArrowRecordBatch(google.protobuf.message.Message):
+    """An Apache Arrow record batch."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IPC_STREAM_FIELD_NUMBER: builtins.int
+    ipc_stream: builtins.bytes
+    """The record batch's schema and data, in the Arrow IPC streaming format."""
+    def __init__(
+        self,
+        *,
+        ipc_stream: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["ipc_stream", b"ipc_stream"]) -> None: ...
+
+global___ArrowRecordBatch = ArrowRecordBatch
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: nipanel/_protos/composite.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1fnipanel/_protos/composite.proto\x12\x16nipanel.protobuf.types\x1a\x19google/protobuf/any.proto\"\x80\x01\n\tComposite\x12\x37\n\x06\x66ields\x18\x01 \x03(\x0b\x32\'.nipanel.protobuf.types.Composite.Field\x1a:\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Anyb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nipanel._protos.composite_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _COMPOSITE._serialized_start=87
+  _COMPOSITE._serialized_end=215
+  _COMPOSITE_FIELD._serialized_start=157
+  _COMPOSITE_FIELD._serialized_end=215
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: nipanel/_protos/image.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bnipanel/_protos/image.proto\x12\x16nipanel.protobuf.types\"l\n\x05Image\x12\r\n\x05\x64type\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x04\x12\x37\n\x08\x65ncoding\x18\x03 \x01(\x0e\x32%.nipanel.protobuf.types.ImageEncoding\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c*X\n\rImageEncoding\x12\x16\n\x12IMAGE_ENCODING_RAW\x10\x00\x12\x16\n\x12IMAGE_ENCODING_PNG\x10\x01\x12\x17\n\x13IMAGE_ENCODING_JPEG\x10\x02\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nipanel._protos.image_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _IMAGEENCODING._serialized_start=165
+  _IMAGEENCODING._serialized_end=253
+  _IMAGE._serialized_start=55
+  _IMAGE._serialized_end=163
+# @@protoc_insertion_point(module_scope)
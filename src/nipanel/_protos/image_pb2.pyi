@@ -0,0 +1,78 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import collections.abc
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
+import google.protobuf.message
+import sys
+import typing
+
+if sys.version_info >= (3, 10):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class _ImageEncoding:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _ImageEncodingEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ImageEncoding.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    IMAGE_ENCODING_RAW: _ImageEncoding.ValueType  # 0
+    """The pixels in C (row major) order, with multi-byte channels in little-endian byte order."""
+    IMAGE_ENCODING_PNG: _ImageEncoding.ValueType  # 1
+    """A PNG file."""
+    IMAGE_ENCODING_JPEG: _ImageEncoding.ValueType  # 2
+    """A JPEG file."""
+
+class ImageEncoding(_ImageEncoding, metaclass=_ImageEncodingEnumTypeWrapper):
+    """How the pixels of an Image are stored."""
+
+IMAGE_ENCODING_RAW: ImageEncoding.ValueType  # 0
+"""The pixels in C (row major) order, with multi-byte channels in little-endian byte order."""
+IMAGE_ENCODING_PNG: ImageEncoding.ValueType  # 1
+"""A PNG file."""
+IMAGE_ENCODING_JPEG: ImageEncoding.ValueType  # 2
+"""A JPEG file."""
+global___ImageEncoding = ImageEncoding
+
+@typing.final
+class Image(google.protobuf.message.Message):
+    """A grayscale or color image with 8-bit or 16-bit channels."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DTYPE_FIELD_NUMBER: builtins.int
+    SHAPE_FIELD_NUMBER: builtins.int
+    ENCODING_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    dtype: builtins.str
+    """The numpy array-protocol type string of the channels, which is "|u1" or "<u2"."""
+    encoding: global___ImageEncoding.ValueType
+    """How the pixels are stored in data."""
+    data: builtins.bytes
+    """The pixels."""
+    @property
+    def shape(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]:
+        """The height and width of the image, followed by the number of channels for an image
+        with a channel dimension.
+        """
+
+    def __init__(
+        self,
+        *,
+        dtype: builtins.str = ...,
+        shape: collections.abc.Iterable[builtins.int] | None = ...,
+        encoding: global___ImageEncoding.ValueType = ...,
+        data: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["data", b"data", "dtype", b"dtype", "encoding", b"encoding", "shape", b"shape"]) -> None: ...
+
+global___Image = Image
@@ -0,0 +1,51 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import google.protobuf.descriptor
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class PandasDataFrame(google.protobuf.message.Message):
+    """A pandas DataFrame."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IPC_STREAM_FIELD_NUMBER: builtins.int
+    ipc_stream: builtins.bytes
+    """The DataFrame as an Apache Arrow table in the Arrow IPC streaming format. The table's
+    pandas schema metadata describes the index, the column names, and the column dtypes.
+    """
+    def __init__(
+        self,
+        *,
+        ipc_stream: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["ipc_stream", b"ipc_stream"]) -> None: ...
+
+global___PandasDataFrame = PandasDataFrame
+
+@typing.final
+class PandasSeries(google.protobuf.message.Message):
+    """A pandas Series."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IPC_STREAM_FIELD_NUMBER: builtins.int
+    ipc_stream: builtins.bytes
+    """The Series as a one-column Apache Arrow table in the Arrow IPC streaming format. The
+    Series name is stored as JSON in the schema metadata.
+    """
+    def __init__(
+        self,
+        *,
+        ipc_stream: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["ipc_stream", b"ipc_stream"]) -> None: ...
+
+global___PandasSeries = PandasSeries
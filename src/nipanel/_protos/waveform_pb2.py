@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: nipanel/_protos/waveform.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ni.protobuf.types import precision_timestamp_pb2 as ni_dot_protobuf_dot_types_dot_precision__timestamp__pb2
+from ni.protobuf.types import waveform_pb2 as ni_dot_protobuf_dot_types_dot_waveform__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1enipanel/_protos/waveform.proto\x12\x16nipanel.protobuf.types\x1a+ni/protobuf/types/precision_timestamp.proto\x1a ni/protobuf/types/waveform.proto\"\xc0\x03\n\x10I8AnalogWaveform\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\n\n\x02\x64t\x18\x02 \x01(\x01\x12\x0e\n\x06y_data\x18\x03 \x01(\x0c\x12L\n\nattributes\x18\x04 \x03(\x0b\x32\x38.nipanel.protobuf.types.I8AnalogWaveform.AttributesEntry\x12\'\n\x05scale\x18\x05 \x01(\x0b\x32\x18.ni.protobuf.types.Scale\x12\x38\n\ttimestamp\x18\x06 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x13\n\x0btime_offset\x18\x07 \x01(\x01\x12\x39\n\ntimestamps\x18\x08 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x1a\\\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).ni.protobuf.types.WaveformAttributeValue:\x02\x38\x01\"\xc2\x03\n\x11I32AnalogWaveform\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\n\n\x02\x64t\x18\x02 \x01(\x01\x12\x0e\n\x06y_data\x18\x03 \x01(\x0c\x12M\n\nattributes\x18\x04 \x03(\x0b\x32\x39.nipanel.protobuf.types.I32AnalogWaveform.AttributesEntry\x12\'\n\x05scale\x18\x05 \x01(\x0b\x32\x18.ni.protobuf.types.Scale\x12\x38\n\ttimestamp\x18\x06 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x13\n\x0btime_offset\x18\x07 \x01(\x01\x12\x39\n\ntimestamps\x18\x08 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x1a\\\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).ni.protobuf.types.WaveformAttributeValue:\x02\x38\x01\"\xce\x03\n\x17QuantizedAnalogWaveform\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\n\n\x02\x64t\x18\x02 \x01(\x01\x12\x0e\n\x06y_data\x18\x03 \x01(\x0c\x12S\n\nattributes\x18\x04 \x03(\x0b\x32?.nipanel.protobuf.types.QuantizedAnalogWaveform.AttributesEntry\x12\'\n\x05scale\x18\x05 \x01(\x0b\x32\x18.ni.protobuf.types.Scale\x12\x38\n\ttimestamp\x18\x06 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x13\n\x0btime_offset\x18\x07 \x01(\x01\x12\x39\n\ntimestamps\x18\x08 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x1a\\\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).ni.protobuf.types.WaveformAttributeValue:\x02\x38\x01\"\xb7\x03\n\x15PackedDigitalWaveform\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\n\n\x02\x64t\x18\x02 \x01(\x01\x12\x14\n\x0csignal_count\x18\x03 \x01(\r\x12\x0e\n\x06y_data\x18\x04 \x01(\x0c\x12Q\n\nattributes\x18\x05 \x03(\x0b\x32=.nipanel.protobuf.types.PackedDigitalWaveform.AttributesEntry\x12\x38\n\ttimestamp\x18\x06 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x13\n\x0btime_offset\x18\x07 \x01(\x01\x12\x39\n\ntimestamps\x18\x08 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x1a\\\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).ni.protobuf.types.WaveformAttributeValue:\x02\x38\x01\"\xd9\x01\n\x0eWaveformTiming\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\n\n\x02\x64t\x18\x02 \x01(\x01\x12\x38\n\ttimestamp\x18\x03 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x13\n\x0btime_offset\x18\x04 \x01(\x01\x12\x39\n\ntimestamps\x18\x05 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\"\x94\x01\n\x1e\x44oubleAnalogWaveformCollection\x12\x36\n\x06timing\x18\x01 \x01(\x0b\x32&.nipanel.protobuf.types.WaveformTiming\x12:\n\twaveforms\x18\x02 \x03(\x0b\x32\'.ni.protobuf.types.DoubleAnalogWaveform\"\x96\x01\n\x1f\x44oubleComplexWaveformCollection\x12\x36\n\x06timing\x18\x01 \x01(\x0b\x32&.nipanel.protobuf.types.WaveformTiming\x12;\n\twaveforms\x18\x02 \x03(\x0b\x32(.ni.protobuf.types.DoubleComplexWaveform\"\x9f\x01\n!QuantizedAnalogWaveformCollection\x12\x36\n\x06timing\x18\x01 \x01(\x0b\x32&.nipanel.protobuf.types.WaveformTiming\x12\x42\n\twaveforms\x18\x02 \x03(\x0b\x32/.nipanel.protobuf.types.QuantizedAnalogWaveform\"K\n\x13SpectrumFrequencies\x12\x17\n\x0fstart_frequency\x18\x01 \x01(\x01\x12\x1b\n\x13\x66requency_increment\x18\x02 \x01(\x01\"\x90\x01\n\x18\x44oubleSpectrumCollection\x12@\n\x0b\x66requencies\x18\x01 \x01(\x0b\x32+.nipanel.protobuf.types.SpectrumFrequencies\x12\x32\n\x07spectra\x18\x02 \x03(\x0b\x32!.ni.protobuf.types.DoubleSpectrum\"m\n\x1c\x44oubleAnalogWaveformMetadata\x12\x12\n\ngeneration\x18\x01 \x01(\x04\x12\x39\n\x08waveform\x18\x02 \x01(\x0b\x32\'.ni.protobuf.types.DoubleAnalogWaveform\"\xf2\x01\n\x1b\x44oubleAnalogWaveformSamples\x12\x31\n\x02t0\x18\x01 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x0e\n\x06y_data\x18\x03 \x03(\x01\x12\x38\n\ttimestamp\x18\x05 \x01(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x39\n\ntimestamps\x18\x07 \x03(\x0b\x32%.ni.protobuf.types.PrecisionTimestamp\x12\x1b\n\x13metadata_generation\x18\x10 \x01(\x04\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'nipanel._protos.waveform_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _I8ANALOGWAVEFORM_ATTRIBUTESENTRY._options = None
+  _I8ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_options = b'8\001'
+  _I32ANALOGWAVEFORM_ATTRIBUTESENTRY._options = None
+  _I32ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_options = b'8\001'
+  _QUANTIZEDANALOGWAVEFORM_ATTRIBUTESENTRY._options = None
+  _QUANTIZEDANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_options = b'8\001'
+  _PACKEDDIGITALWAVEFORM_ATTRIBUTESENTRY._options = None
+  _PACKEDDIGITALWAVEFORM_ATTRIBUTESENTRY._serialized_options = b'8\001'
+  _I8ANALOGWAVEFORM._serialized_start=138
+  _I8ANALOGWAVEFORM._serialized_end=586
+  _I8ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_start=494
+  _I8ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_end=586
+  _I32ANALOGWAVEFORM._serialized_start=589
+  _I32ANALOGWAVEFORM._serialized_end=1039
+  _I32ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_start=494
+  _I32ANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_end=586
+  _QUANTIZEDANALOGWAVEFORM._serialized_start=1042
+  _QUANTIZEDANALOGWAVEFORM._serialized_end=1504
+  _QUANTIZEDANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_start=494
+  _QUANTIZEDANALOGWAVEFORM_ATTRIBUTESENTRY._serialized_end=586
+  _PACKEDDIGITALWAVEFORM._serialized_start=1507
+  _PACKEDDIGITALWAVEFORM._serialized_end=1946
+  _PACKEDDIGITALWAVEFORM_ATTRIBUTESENTRY._serialized_start=494
+  _PACKEDDIGITALWAVEFORM_ATTRIBUTESENTRY._serialized_end=586
+  _WAVEFORMTIMING._serialized_start=1949
+  _WAVEFORMTIMING._serialized_end=2166
+  _DOUBLEANALOGWAVEFORMCOLLECTION._serialized_start=2169
+  _DOUBLEANALOGWAVEFORMCOLLECTION._serialized_end=2317
+  _DOUBLECOMPLEXWAVEFORMCOLLECTION._serialized_start=2320
+  _DOUBLECOMPLEXWAVEFORMCOLLECTION._serialized_end=2470
+  _QUANTIZEDANALOGWAVEFORMCOLLECTION._serialized_start=2473
+  _QUANTIZEDANALOGWAVEFORMCOLLECTION._serialized_end=2632
+  _SPECTRUMFREQUENCIES._serialized_start=2634
+  _SPECTRUMFREQUENCIES._serialized_end=2709
+  _DOUBLESPECTRUMCOLLECTION._serialized_start=2712
+  _DOUBLESPECTRUMCOLLECTION._serialized_end=2856
+  _DOUBLEANALOGWAVEFORMMETADATA._serialized_start=2858
+  _DOUBLEANALOGWAVEFORMMETADATA._serialized_end=2967
+  _DOUBLEANALOGWAVEFORMSAMPLES._serialized_start=2970
+  _DOUBLEANALOGWAVEFORMSAMPLES._serialized_end=3212
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,501 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import collections.abc
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import ni.protobuf.types.precision_timestamp_pb2
+import ni.protobuf.types.waveform_pb2
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class I8AnalogWaveform(google.protobuf.message.Message):
+    """An analog waveform with signed 8-bit integer samples, such as raw digitizer data, and the
+    scale that converts them to physical units. Apart from y_data, the fields match
+    ni.protobuf.types.I16AnalogWaveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing.final
+    class AttributesEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> ni.protobuf.types.waveform_pb2.WaveformAttributeValue: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: ni.protobuf.types.waveform_pb2.WaveformAttributeValue | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    T0_FIELD_NUMBER: builtins.int
+    DT_FIELD_NUMBER: builtins.int
+    Y_DATA_FIELD_NUMBER: builtins.int
+    ATTRIBUTES_FIELD_NUMBER: builtins.int
+    SCALE_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIME_OFFSET_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    dt: builtins.float
+    y_data: builtins.bytes
+    """The raw samples, one byte each."""
+    time_offset: builtins.float
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def attributes(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue]: ...
+    @property
+    def scale(self) -> ni.protobuf.types.waveform_pb2.Scale: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        dt: builtins.float = ...,
+        y_data: builtins.bytes = ...,
+        attributes: collections.abc.Mapping[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue] | None = ...,
+        scale: ni.protobuf.types.waveform_pb2.Scale | None = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        time_offset: builtins.float = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["scale", b"scale", "t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["attributes", b"attributes", "dt", b"dt", "scale", b"scale", "t0", b"t0", "time_offset", b"time_offset", "timestamp", b"timestamp", "timestamps", b"timestamps", "y_data", b"y_data"]) -> None: ...
+
+global___I8AnalogWaveform = I8AnalogWaveform
+
+@typing.final
+class I32AnalogWaveform(google.protobuf.message.Message):
+    """An analog waveform with signed 32-bit integer samples, such as raw digitizer data, and the
+    scale that converts them to physical units. Apart from y_data, the fields match
+    ni.protobuf.types.I16AnalogWaveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing.final
+    class AttributesEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> ni.protobuf.types.waveform_pb2.WaveformAttributeValue: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: ni.protobuf.types.waveform_pb2.WaveformAttributeValue | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    T0_FIELD_NUMBER: builtins.int
+    DT_FIELD_NUMBER: builtins.int
+    Y_DATA_FIELD_NUMBER: builtins.int
+    ATTRIBUTES_FIELD_NUMBER: builtins.int
+    SCALE_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIME_OFFSET_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    dt: builtins.float
+    y_data: builtins.bytes
+    """The raw samples, four little-endian bytes each."""
+    time_offset: builtins.float
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def attributes(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue]: ...
+    @property
+    def scale(self) -> ni.protobuf.types.waveform_pb2.Scale: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        dt: builtins.float = ...,
+        y_data: builtins.bytes = ...,
+        attributes: collections.abc.Mapping[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue] | None = ...,
+        scale: ni.protobuf.types.waveform_pb2.Scale | None = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        time_offset: builtins.float = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["scale", b"scale", "t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["attributes", b"attributes", "dt", b"dt", "scale", b"scale", "t0", b"t0", "time_offset", b"time_offset", "timestamp", b"timestamp", "timestamps", b"timestamps", "y_data", b"y_data"]) -> None: ...
+
+global___I32AnalogWaveform = I32AnalogWaveform
+
+@typing.final
+class QuantizedAnalogWaveform(google.protobuf.message.Message):
+    """A double-precision analog waveform quantized to signed 16-bit integer samples, and the scale
+    that converts them back to approximately the original values. Apart from y_data, the fields
+    match ni.protobuf.types.I16AnalogWaveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing.final
+    class AttributesEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> ni.protobuf.types.waveform_pb2.WaveformAttributeValue: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: ni.protobuf.types.waveform_pb2.WaveformAttributeValue | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    T0_FIELD_NUMBER: builtins.int
+    DT_FIELD_NUMBER: builtins.int
+    Y_DATA_FIELD_NUMBER: builtins.int
+    ATTRIBUTES_FIELD_NUMBER: builtins.int
+    SCALE_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIME_OFFSET_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    dt: builtins.float
+    y_data: builtins.bytes
+    """The quantized samples, two little-endian bytes each."""
+    time_offset: builtins.float
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def attributes(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue]: ...
+    @property
+    def scale(self) -> ni.protobuf.types.waveform_pb2.Scale: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        dt: builtins.float = ...,
+        y_data: builtins.bytes = ...,
+        attributes: collections.abc.Mapping[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue] | None = ...,
+        scale: ni.protobuf.types.waveform_pb2.Scale | None = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        time_offset: builtins.float = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["scale", b"scale", "t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["attributes", b"attributes", "dt", b"dt", "scale", b"scale", "t0", b"t0", "time_offset", b"time_offset", "timestamp", b"timestamp", "timestamps", b"timestamps", "y_data", b"y_data"]) -> None: ...
+
+global___QuantizedAnalogWaveform = QuantizedAnalogWaveform
+
+@typing.final
+class PackedDigitalWaveform(google.protobuf.message.Message):
+    """A digital waveform whose line states are packed 8 lines per byte. Every line state must be
+    0 or 1. Apart from y_data, the fields match ni.protobuf.types.DigitalWaveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    @typing.final
+    class AttributesEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        @property
+        def value(self) -> ni.protobuf.types.waveform_pb2.WaveformAttributeValue: ...
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: ni.protobuf.types.waveform_pb2.WaveformAttributeValue | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing.Literal["value", b"value"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    T0_FIELD_NUMBER: builtins.int
+    DT_FIELD_NUMBER: builtins.int
+    SIGNAL_COUNT_FIELD_NUMBER: builtins.int
+    Y_DATA_FIELD_NUMBER: builtins.int
+    ATTRIBUTES_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIME_OFFSET_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    dt: builtins.float
+    signal_count: builtins.int
+    y_data: builtins.bytes
+    """The line states, one sample after another. Each sample takes (signal_count + 7) / 8
+    bytes, with the state of line i in bit (i % 8) of byte (i / 8), counting from the least
+    significant bit.
+    """
+    time_offset: builtins.float
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def attributes(self) -> google.protobuf.internal.containers.MessageMap[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue]: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        dt: builtins.float = ...,
+        signal_count: builtins.int = ...,
+        y_data: builtins.bytes = ...,
+        attributes: collections.abc.Mapping[builtins.str, ni.protobuf.types.waveform_pb2.WaveformAttributeValue] | None = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        time_offset: builtins.float = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["attributes", b"attributes", "dt", b"dt", "signal_count", b"signal_count", "t0", b"t0", "time_offset", b"time_offset", "timestamp", b"timestamp", "timestamps", b"timestamps", "y_data", b"y_data"]) -> None: ...
+
+global___PackedDigitalWaveform = PackedDigitalWaveform
+
+@typing.final
+class WaveformTiming(google.protobuf.message.Message):
+    """The timing of a waveform. The fields match the timing fields of
+    ni.protobuf.types.DoubleAnalogWaveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    T0_FIELD_NUMBER: builtins.int
+    DT_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIME_OFFSET_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    dt: builtins.float
+    time_offset: builtins.float
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        dt: builtins.float = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        time_offset: builtins.float = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["dt", b"dt", "t0", b"t0", "time_offset", b"time_offset", "timestamp", b"timestamp", "timestamps", b"timestamps"]) -> None: ...
+
+global___WaveformTiming = WaveformTiming
+
+@typing.final
+class DoubleAnalogWaveformCollection(google.protobuf.message.Message):
+    """Double-precision analog waveforms, such as the channels of one DAQ read. If timing is set, it
+    is the timing of every waveform, and the waveforms' own timing fields are not set.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TIMING_FIELD_NUMBER: builtins.int
+    WAVEFORMS_FIELD_NUMBER: builtins.int
+    @property
+    def timing(self) -> global___WaveformTiming: ...
+    @property
+    def waveforms(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.waveform_pb2.DoubleAnalogWaveform]: ...
+    def __init__(
+        self,
+        *,
+        timing: global___WaveformTiming | None = ...,
+        waveforms: collections.abc.Iterable[ni.protobuf.types.waveform_pb2.DoubleAnalogWaveform] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["timing", b"timing"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["timing", b"timing", "waveforms", b"waveforms"]) -> None: ...
+
+global___DoubleAnalogWaveformCollection = DoubleAnalogWaveformCollection
+
+@typing.final
+class DoubleComplexWaveformCollection(google.protobuf.message.Message):
+    """Double-precision complex waveforms. If timing is set, it is the timing of every waveform, and
+    the waveforms' own timing fields are not set.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TIMING_FIELD_NUMBER: builtins.int
+    WAVEFORMS_FIELD_NUMBER: builtins.int
+    @property
+    def timing(self) -> global___WaveformTiming: ...
+    @property
+    def waveforms(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.waveform_pb2.DoubleComplexWaveform]: ...
+    def __init__(
+        self,
+        *,
+        timing: global___WaveformTiming | None = ...,
+        waveforms: collections.abc.Iterable[ni.protobuf.types.waveform_pb2.DoubleComplexWaveform] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["timing", b"timing"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["timing", b"timing", "waveforms", b"waveforms"]) -> None: ...
+
+global___DoubleComplexWaveformCollection = DoubleComplexWaveformCollection
+
+@typing.final
+class QuantizedAnalogWaveformCollection(google.protobuf.message.Message):
+    """Analog waveforms whose samples are quantized to 16 bits, each with its own scale. If timing is
+    set, it is the timing of every waveform, and the waveforms' own timing fields are not set.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TIMING_FIELD_NUMBER: builtins.int
+    WAVEFORMS_FIELD_NUMBER: builtins.int
+    @property
+    def timing(self) -> global___WaveformTiming: ...
+    @property
+    def waveforms(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___QuantizedAnalogWaveform]: ...
+    def __init__(
+        self,
+        *,
+        timing: global___WaveformTiming | None = ...,
+        waveforms: collections.abc.Iterable[global___QuantizedAnalogWaveform] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["timing", b"timing"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["timing", b"timing", "waveforms", b"waveforms"]) -> None: ...
+
+global___QuantizedAnalogWaveformCollection = QuantizedAnalogWaveformCollection
+
+@typing.final
+class SpectrumFrequencies(google.protobuf.message.Message):
+    """The frequencies of a spectrum. The fields match those of ni.protobuf.types.DoubleSpectrum."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    START_FREQUENCY_FIELD_NUMBER: builtins.int
+    FREQUENCY_INCREMENT_FIELD_NUMBER: builtins.int
+    start_frequency: builtins.float
+    frequency_increment: builtins.float
+    def __init__(
+        self,
+        *,
+        start_frequency: builtins.float = ...,
+        frequency_increment: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["frequency_increment", b"frequency_increment", "start_frequency", b"start_frequency"]) -> None: ...
+
+global___SpectrumFrequencies = SpectrumFrequencies
+
+@typing.final
+class DoubleSpectrumCollection(google.protobuf.message.Message):
+    """Double-precision spectra. If frequencies is set, it is the frequencies of every spectrum, and
+    the spectra's own frequency fields are not set.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FREQUENCIES_FIELD_NUMBER: builtins.int
+    SPECTRA_FIELD_NUMBER: builtins.int
+    @property
+    def frequencies(self) -> global___SpectrumFrequencies: ...
+    @property
+    def spectra(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.waveform_pb2.DoubleSpectrum]: ...
+    def __init__(
+        self,
+        *,
+        frequencies: global___SpectrumFrequencies | None = ...,
+        spectra: collections.abc.Iterable[ni.protobuf.types.waveform_pb2.DoubleSpectrum] | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["frequencies", b"frequencies"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["frequencies", b"frequencies", "spectra", b"spectra"]) -> None: ...
+
+global___DoubleSpectrumCollection = DoubleSpectrumCollection
+
+@typing.final
+class DoubleAnalogWaveformMetadata(google.protobuf.message.Message):
+    """The fields of a double-precision analog waveform that rarely change from one read to the
+    next, published once and then again only when they change.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    GENERATION_FIELD_NUMBER: builtins.int
+    WAVEFORM_FIELD_NUMBER: builtins.int
+    generation: builtins.int
+    """Identifies this metadata. It changes whenever the metadata changes."""
+    @property
+    def waveform(self) -> ni.protobuf.types.waveform_pb2.DoubleAnalogWaveform:
+        """The waveform's attributes, dt, and time_offset. Its other fields are not set."""
+
+    def __init__(
+        self,
+        *,
+        generation: builtins.int = ...,
+        waveform: ni.protobuf.types.waveform_pb2.DoubleAnalogWaveform | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["waveform", b"waveform"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["generation", b"generation", "waveform", b"waveform"]) -> None: ...
+
+global___DoubleAnalogWaveformMetadata = DoubleAnalogWaveformMetadata
+
+@typing.final
+class DoubleAnalogWaveformSamples(google.protobuf.message.Message):
+    """The samples and start time of a double-precision analog waveform whose other fields are
+    published separately as a DoubleAnalogWaveformMetadata. Apart from metadata_generation, the
+    fields match ni.protobuf.types.DoubleAnalogWaveform, so merging these samples into the
+    metadata's waveform gives the whole waveform.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    T0_FIELD_NUMBER: builtins.int
+    Y_DATA_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    TIMESTAMPS_FIELD_NUMBER: builtins.int
+    METADATA_GENERATION_FIELD_NUMBER: builtins.int
+    metadata_generation: builtins.int
+    """The generation of the metadata that the samples go with."""
+    @property
+    def t0(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def y_data(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def timestamp(self) -> ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp: ...
+    @property
+    def timestamps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp]: ...
+    def __init__(
+        self,
+        *,
+        t0: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        y_data: collections.abc.Iterable[builtins.float] | None = ...,
+        timestamp: ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp | None = ...,
+        timestamps: collections.abc.Iterable[ni.protobuf.types.precision_timestamp_pb2.PrecisionTimestamp] | None = ...,
+        metadata_generation: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["t0", b"t0", "timestamp", b"timestamp"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["metadata_generation", b"metadata_generation", "t0", b"t0", "timestamp", b"timestamp", "timestamps", b"timestamps", "y_data", b"y_data"]) -> None: ...
+
+global___DoubleAnalogWaveformSamples = DoubleAnalogWaveformSamples
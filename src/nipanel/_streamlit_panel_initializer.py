@@ -88,8 +88,13 @@ def _initialize_panel_from_base_path() -> PanelValueAccessor:
 
 
 def _sync_session_state(panel: PanelValueAccessor) -> None:
-    """Automatically read keyed control values from the session state."""
+    """Automatically read keyed control values from the session state.
+
+    Values that are unchanged since the previous rerun are skipped before checking whether
+    their type is supported, so the cost of each rerun scales with the number of changes.
+    """
     for key in st.session_state.keys():
+        value_id = str(key)
         value = st.session_state[key]
-        if is_supported_type(value):
-            panel.set_value_if_changed(str(key), value)
+        if panel._has_value_changed(value_id, value) and is_supported_type(value):
+            panel.set_value(value_id, value)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+from google.protobuf.message import Message
+from ni.panels.v1.panel_service_pb2 import SetValueRequest
+
+from nipanel._convert import _get_best_matching_converter, to_any
+from nipanel.converters import Converter
+from nipanel.converters.builtin import (
+    BoolConverter,
+    DTDateTimeConverter,
+    DTTimeDeltaConverter,
+    FloatConverter,
+    IntConverter,
+    StrConverter,
+)
+from nipanel.converters.protobuf_types import (
+    BTDateTimeConverter,
+    BTTimeDeltaConverter,
+    HTDateTimeConverter,
+    HTTimeDeltaConverter,
+    ScalarConverter,
+)
+
+# The converters for scalars, whose messages are small enough that refilling one is faster
+# than creating one. Other converters create their Any with to_protobuf_any(), which
+# converters for large values override to copy the data only once.
+_SCALAR_CONVERTER_TYPES = frozenset(
+    {
+        BoolConverter,
+        BTDateTimeConverter,
+        BTTimeDeltaConverter,
+        DTDateTimeConverter,
+        DTTimeDeltaConverter,
+        FloatConverter,
+        HTDateTimeConverter,
+        HTTimeDeltaConverter,
+        IntConverter,
+        ScalarConverter,
+        StrConverter,
+    }
+)
+
+
+class _ValueEncoder:
+    """Encodes the values set for one value ID into a reused SetValueRequest.
+
+    Setting the same scalar value ID repeatedly, as a loop that publishes a reading does, would
+    otherwise create a new type-specific message, Any, and SetValueRequest for every value.
+    The encoder keeps one of each, refills them in place, and only looks up the type URL
+    again when the value's converter changes. The payload is cleared after each send, so the
+    encoder does not hold on to a long string between values. Other values are encoded into a
+    new SetValueRequest.
+    """
+
+    __slots__ = ["_lock", "_panel_id", "_value_id", "_request", "_converter", "_message"]
+
+    def __init__(self, panel_id: str, value_id: str) -> None:
+        """Initialize the encoder.
+
+        Args:
+            panel_id: The ID of the panel that the values are set on.
+            value_id: The ID of the value.
+        """
+        self._lock = threading.Lock()
+        self._panel_id = panel_id
+        self._value_id = value_id
+        self._request = SetValueRequest(panel_id=panel_id, value_id=value_id)
+        self._converter: Converter[Any, Any] | None = None
+        self._message: Message | None = None
+
+    def encode_and_send(
+        self, value: object, notify: bool, send: Callable[[SetValueRequest], object]
+    ) -> None:
+        """Encode a value into a SetValueRequest and pass it to send.
+
+        The request is only valid until send returns. If another thread is using the encoder,
+        the value is encoded into a new request instead of waiting for it.
+        """
+        if not self._lock.acquire(blocking=False):
+            send(
+                SetValueRequest(
+                    panel_id=self._panel_id,
+                    value_id=self._value_id,
+                    value=to_any(value),
+                    notify=notify,
+                )
+            )
+            return
+
+        try:
+            converter = _get_best_matching_converter(value)
+            if type(converter) not in _SCALAR_CONVERTER_TYPES:
+                send(
+                    SetValueRequest(
+                        panel_id=self._panel_id,
+                        value_id=self._value_id,
+                        value=converter.to_protobuf_any(value),
+                        notify=notify,
+                    )
+                )
+                return
+
+            if converter is not self._converter or self._message is None:
+                self._message = converter.protobuf_message()
+                self._request.value.type_url = f"type.googleapis.com/{converter.protobuf_typename}"
+                self._converter = converter
+            try:
+                converter.fill_protobuf_message(self._message, value)
+                self._request.value.value = self._message.SerializeToString()
+                self._request.notify = notify
+                send(self._request)
+            finally:
+                self._message.Clear()
+                self._request.value.value = b""
+        finally:
+            self._lock.release()
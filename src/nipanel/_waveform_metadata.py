@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+from google.protobuf import any_pb2
+from ni.protobuf.types import waveform_pb2
+from nitypes.waveform import AnalogWaveform
+
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel.converters._wire_format import _encode_length_delimited_header
+from nipanel.converters.protobuf_types import DoubleAnalogWaveformConverter
+from nipanel.converters.waveform_types import _get_attributes, _get_timing_fields
+
+_METADATA_VALUE_ID_SUFFIX = ".__metadata__"
+
+# The timing fields that change with every read, so they are sent with the samples.
+_SAMPLES_TIMING_FIELDS = frozenset({"t0", "timestamp", "timestamps"})
+
+_SAMPLES_TYPE_URL = (
+    f"type.googleapis.com/{waveform_pb2_nipanel.DoubleAnalogWaveformSamples.DESCRIPTOR.full_name}"
+)
+
+
+class _WaveformMetadataEncoder:
+    """Encodes the float64 AnalogWaveforms set for one value ID as metadata and samples.
+
+    The attributes, dt, and time_offset of a waveform rarely change from one read to the next,
+    so they are encoded as a DoubleAnalogWaveformMetadata only when they change. Each waveform
+    is encoded as a DoubleAnalogWaveformSamples that refers to its metadata by generation.
+    """
+
+    __slots__ = ["_generation", "_metadata_key"]
+
+    def __init__(self) -> None:
+        """Initialize the encoder."""
+        # Start from a random generation, so a reader never mistakes metadata that an earlier
+        # producer published for the metadata of this one.
+        self._generation = random.getrandbits(64)
+        self._metadata_key: tuple[object, ...] | None = None
+
+    def encode(self, waveform: object) -> tuple[any_pb2.Any | None, any_pb2.Any]:
+        """Encode a waveform as its metadata and samples.
+
+        Returns:
+            A tuple of the metadata, or None if it has not changed since the last waveform,
+            and the samples.
+
+        Raises:
+            TypeError: If the value is not an AnalogWaveform with float64 samples.
+        """
+        if not isinstance(waveform, AnalogWaveform) or waveform.dtype != np.float64:
+            raise TypeError(
+                f"Only AnalogWaveform[float64] values can be sent with their metadata once, "
+                f"not {type(waveform).__name__}."
+            )
+
+        timing_fields = _get_timing_fields(waveform)
+        metadata_fields = {
+            name: value
+            for name, value in timing_fields.items()
+            if name not in _SAMPLES_TIMING_FIELDS
+        }
+        # Comparing the extended properties is cheaper than converting them to attributes, so
+        # the metadata message is only created when it changes.
+        metadata_key = (dict(waveform.extended_properties), *sorted(metadata_fields.items()))
+        metadata_any: any_pb2.Any | None = None
+        if metadata_key != self._metadata_key:
+            metadata = waveform_pb2.DoubleAnalogWaveform(
+                attributes=_get_attributes(waveform.extended_properties), **metadata_fields
+            )
+            self._generation = (self._generation + 1) % 2**64
+            self._metadata_key = metadata_key
+            metadata_any = any_pb2.Any()
+            metadata_any.Pack(
+                waveform_pb2_nipanel.DoubleAnalogWaveformMetadata(
+                    generation=self._generation, waveform=metadata
+                )
+            )
+
+        samples = waveform_pb2_nipanel.DoubleAnalogWaveformSamples(
+            metadata_generation=self._generation,
+            **{
+                name: value
+                for name, value in timing_fields.items()
+                if name in _SAMPLES_TIMING_FIELDS
+            },
+        )
+        y_data = np.ascontiguousarray(waveform.scaled_data, dtype="<f8")
+        samples_any = any_pb2.Any(
+            type_url=_SAMPLES_TYPE_URL,
+            value=b"".join(
+                (
+                    samples.SerializeToString(),
+                    _encode_length_delimited_header(
+                        waveform_pb2_nipanel.DoubleAnalogWaveformSamples.Y_DATA_FIELD_NUMBER,
+                        y_data.nbytes,
+                    ),
+                    y_data.data,
+                )
+            ),
+        )
+        return metadata_any, samples_any
+
+
+def _join_waveform(
+    metadata: waveform_pb2_nipanel.DoubleAnalogWaveformMetadata, samples_any: any_pb2.Any
+) -> AnalogWaveform[np.float64]:
+    """Combine a DoubleAnalogWaveformSamples with its metadata into an AnalogWaveform."""
+    message = waveform_pb2.DoubleAnalogWaveform()
+    message.CopyFrom(metadata.waveform)
+    # Apart from the metadata generation, which is skipped as an unknown field, the samples
+    # have the same field numbers as a DoubleAnalogWaveform.
+    message.MergeFromString(samples_any.value)
+    return DoubleAnalogWaveformConverter().to_python_value(message)
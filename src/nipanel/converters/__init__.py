@@ -48,18 +48,44 @@ class Converter(Generic[_TPythonType, _TProtobufType], ABC):
     def to_protobuf_message(self, python_value: _TPythonType) -> _TProtobufType:
         """Convert the Python object to its type-specific message."""
 
+    def fill_protobuf_message(
+        self, protobuf_message: _TProtobufType, python_value: _TPythonType
+    ) -> None:
+        """Replace the contents of an existing type-specific message with the Python object.
+
+        Encoders call this to reuse one message for every value they send. By default, this
+        copies the message returned by to_protobuf_message(). Converters override this to
+        write the fields in place.
+        """
+        protobuf_message.CopyFrom(self.to_protobuf_message(python_value))
+
     def to_python(self, protobuf_value: any_pb2.Any) -> _TPythonType:
         """Convert the protobuf Any message to its matching Python type."""
-        protobuf_message = self.protobuf_message()
-        did_unpack = protobuf_value.Unpack(protobuf_message)
-        if not did_unpack:
-            raise ValueError(f"Failed to unpack Any with type '{protobuf_value.TypeName()}'")
-        return self.to_python_value(protobuf_message)
+        return self.to_python_value(self._unpack(protobuf_value))
 
     @abstractmethod
     def to_python_value(self, protobuf_message: _TProtobufType) -> _TPythonType:
         """Convert the protobuf wrapper message to its matching Python type."""
 
+    def to_python_numpy(self, protobuf_value: any_pb2.Any) -> object:
+        """Convert the protobuf Any message to a Python object that uses numpy arrays."""
+        return self.to_numpy_value(self._unpack(protobuf_value))
+
+    def to_numpy_value(self, protobuf_message: _TProtobufType) -> object:
+        """Convert the protobuf wrapper message to a Python object that uses numpy arrays.
+
+        Converters for array messages override this to decode straight into an ndarray. By
+        default, this returns the same object as to_python_value().
+        """
+        return self.to_python_value(protobuf_message)
+
+    def _unpack(self, protobuf_value: any_pb2.Any) -> _TProtobufType:
+        protobuf_message = self.protobuf_message()
+        did_unpack = protobuf_value.Unpack(protobuf_message)
+        if not did_unpack:
+            raise ValueError(f"Failed to unpack Any with type '{protobuf_value.TypeName()}'")
+        return protobuf_message
+
 
 class CollectionConverter(
     Generic[_TItemType, _TProtobufType],
@@ -0,0 +1,98 @@
+"""Helpers for reading and writing protobuf wire format around raw buffers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import NamedTuple
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_FIXED64 = 1
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+_WIRE_TYPE_FIXED32 = 5
+
+
+class _WireField(NamedTuple):
+    """The location of one field in a serialized message."""
+
+    field_number: int
+    wire_type: int
+    start: int
+    """The offset of the field's tag."""
+    value_start: int
+    """The offset of the field's value, after any length prefix."""
+    end: int
+
+
+def _encode_length_delimited_header(field_number: int, length: int) -> bytes:
+    """Encode the tag and length that precede a length-delimited field.
+
+    Bytes fields and packed repeated fields are length-delimited. Writing the header followed
+    by a raw buffer lets a large field be serialized with a single copy.
+    """
+    return _encode_varint((field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED) + _encode_varint(
+        length
+    )
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data: bytes | memoryview, position: int) -> tuple[int, int]:
+    """Decode the varint at position and return its value and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated varint in serialized message.")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+
+def _iter_wire_fields(data: bytes | memoryview) -> Iterator[_WireField]:
+    """Iterate over the top-level fields of a serialized message without decoding them.
+
+    Length-delimited values are skipped over, so a large bytes or packed repeated field costs
+    no more than a small one.
+    """
+    position = 0
+    while position < len(data):
+        start = position
+        tag, position = _decode_varint(data, position)
+        field_number, wire_type = tag >> 3, tag & 0x7
+        if wire_type == _WIRE_TYPE_VARINT:
+            _, end = _decode_varint(data, position)
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            end = position + 8
+        elif wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = _decode_varint(data, position)
+            end = position + length
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            end = position + 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in serialized message.")
+        if end > len(data):
+            raise ValueError("Truncated field in serialized message.")
+        yield _WireField(field_number, wire_type, start, position, end)
+        position = end
+
+
+def _read_varint_field(data: bytes | memoryview, field_number: int) -> int:
+    """Read a top-level varint field of a serialized message without decoding the others.
+
+    Returns 0, the proto3 default, if the field is not set.
+    """
+    for field in _iter_wire_fields(data):
+        if field.field_number == field_number and field.wire_type == _WIRE_TYPE_VARINT:
+            value, _ = _decode_varint(data, field.value_start)
+            return value
+    return 0
@@ -0,0 +1,167 @@
+"""Classes to convert between Apache Arrow tables and nipanel protobuf types.
+
+pyarrow is an optional dependency. It is imported the first time an Arrow value is converted,
+so these converters can be registered without it.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Type, TypeVar, Union
+
+from google.protobuf import any_pb2
+from typing_extensions import TypeAlias
+
+from nipanel._protos import arrow_pb2, pandas_pb2
+from nipanel.converters import Converter
+from nipanel.converters._wire_format import (
+    _WIRE_TYPE_LENGTH_DELIMITED,
+    _encode_length_delimited_header,
+    _iter_wire_fields,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_ArrowMessage: TypeAlias = Union[
+    arrow_pb2.ArrowTable,
+    arrow_pb2.ArrowRecordBatch,
+    pandas_pb2.PandasDataFrame,
+    pandas_pb2.PandasSeries,
+]
+_TArrowValue = TypeVar("_TArrowValue")
+
+# All of the messages store the IPC stream in field 1.
+_IPC_STREAM_FIELD_NUMBER = arrow_pb2.ArrowTable.IPC_STREAM_FIELD_NUMBER
+
+
+class _ArrowConverter(Converter[_TArrowValue, _ArrowMessage]):
+    """A base converter for values that are sent in the Arrow IPC streaming format.
+
+    The decoded value's buffers point into the received bytes instead of being copied out of
+    them, so it can be passed straight to ``st.dataframe``.
+    """
+
+    _python_typename: str
+
+    @property
+    def python_typename(self) -> str:
+        """The Python type name that this converter handles."""
+        # This is the full name of python_type, without importing its package.
+        return self._python_typename
+
+    def to_protobuf_any(self, python_value: _TArrowValue) -> any_pb2.Any:
+        """Convert the Arrow value to its protobuf message and pack it as any_pb2.Any.
+
+        The IPC stream is copied straight into the serialized message, instead of into a
+        message that is then serialized.
+        """
+        ipc_stream = _write_ipc_stream(self._to_arrow(python_value))
+        ipc_stream_header = _encode_length_delimited_header(
+            _IPC_STREAM_FIELD_NUMBER, ipc_stream.size
+        )
+        return any_pb2.Any(
+            type_url=f"type.googleapis.com/{self.protobuf_typename}",
+            value=b"".join((ipc_stream_header, memoryview(ipc_stream))),
+        )
+
+    def to_protobuf_message(self, python_value: _TArrowValue) -> _ArrowMessage:
+        """Convert the Arrow value to its protobuf message."""
+        return self.protobuf_message(
+            ipc_stream=_write_ipc_stream(self._to_arrow(python_value)).to_pybytes()
+        )
+
+    def to_python(self, protobuf_value: any_pb2.Any) -> _TArrowValue:
+        """Convert the protobuf Any message to an Arrow value.
+
+        The IPC stream is read straight out of the Any's payload, instead of out of a copy of
+        it in an unpacked message.
+        """
+        if protobuf_value.TypeName() != self.protobuf_typename:
+            raise ValueError(f"Failed to unpack Any with type '{protobuf_value.TypeName()}'")
+        payload = memoryview(protobuf_value.value)
+        ipc_stream = payload[0:0]
+        for field in _iter_wire_fields(payload):
+            if (
+                field.field_number == _IPC_STREAM_FIELD_NUMBER
+                and field.wire_type == _WIRE_TYPE_LENGTH_DELIMITED
+            ):
+                ipc_stream = payload[field.value_start : field.end]
+        return self._read_ipc_stream(ipc_stream)
+
+    def to_python_value(self, protobuf_message: _ArrowMessage) -> _TArrowValue:
+        """Convert the protobuf message to an Arrow value."""
+        return self._read_ipc_stream(memoryview(protobuf_message.ipc_stream))
+
+    def _to_arrow(self, python_value: _TArrowValue) -> pa.Table | pa.RecordBatch:
+        return python_value
+
+    @abstractmethod
+    def _read_ipc_stream(self, ipc_stream: memoryview) -> _TArrowValue: ...
+
+
+class ArrowTableConverter(_ArrowConverter["pa.Table"]):
+    """A converter for pyarrow.Table."""
+
+    _python_typename = "pyarrow.lib.Table"
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        import pyarrow as pa
+
+        python_type: type = pa.Table
+        return python_type
+
+    @property
+    def protobuf_message(self) -> Type[arrow_pb2.ArrowTable]:
+        """The type-specific protobuf message for the Python type."""
+        return arrow_pb2.ArrowTable
+
+    def _read_ipc_stream(self, ipc_stream: memoryview) -> pa.Table:
+        return _read_table(ipc_stream)
+
+
+class ArrowRecordBatchConverter(_ArrowConverter["pa.RecordBatch"]):
+    """A converter for pyarrow.RecordBatch."""
+
+    _python_typename = "pyarrow.lib.RecordBatch"
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        import pyarrow as pa
+
+        python_type: type = pa.RecordBatch
+        return python_type
+
+    @property
+    def protobuf_message(self) -> Type[arrow_pb2.ArrowRecordBatch]:
+        """The type-specific protobuf message for the Python type."""
+        return arrow_pb2.ArrowRecordBatch
+
+    def _read_ipc_stream(self, ipc_stream: memoryview) -> pa.RecordBatch:
+        import pyarrow as pa
+
+        if not ipc_stream:
+            return pa.record_batch({})
+        with pa.ipc.open_stream(pa.py_buffer(ipc_stream)) as reader:
+            return reader.read_next_batch()
+
+
+def _write_ipc_stream(python_value: pa.Table | pa.RecordBatch) -> pa.Buffer:
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, python_value.schema) as writer:
+        writer.write(python_value)
+    return sink.getvalue()
+
+
+def _read_table(ipc_stream: memoryview) -> pa.Table:
+    import pyarrow as pa
+
+    if not ipc_stream:
+        return pa.table({})
+    with pa.ipc.open_stream(pa.py_buffer(ipc_stream)) as reader:
+        return reader.read_all()
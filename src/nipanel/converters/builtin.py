@@ -3,9 +3,11 @@
 import datetime as dt
 from typing import Type
 
-from google.protobuf import duration_pb2, timestamp_pb2, wrappers_pb2
+from google.protobuf import any_pb2, duration_pb2, timestamp_pb2, wrappers_pb2
+from typing_extensions import Buffer
 
 from nipanel.converters import Converter
+from nipanel.converters._wire_format import _encode_length_delimited_header
 
 
 class BoolConverter(Converter[bool, wrappers_pb2.BoolValue]):
@@ -25,13 +27,24 @@ class BoolConverter(Converter[bool, wrappers_pb2.BoolValue]):
         """Convert the Python bool to a protobuf wrappers_pb2.BoolValue."""
         return self.protobuf_message(value=python_value)
 
+    def fill_protobuf_message(
+        self, protobuf_message: wrappers_pb2.BoolValue, python_value: bool
+    ) -> None:
+        """Set the value of an existing protobuf wrappers_pb2.BoolValue."""
+        protobuf_message.value = python_value
+
     def to_python_value(self, protobuf_message: wrappers_pb2.BoolValue) -> bool:
         """Convert the protobuf message to a Python bool."""
         return protobuf_message.value
 
 
-class BytesConverter(Converter[bytes, wrappers_pb2.BytesValue]):
-    """A converter for byte string types."""
+class BytesConverter(Converter[Buffer, wrappers_pb2.BytesValue]):
+    """A converter for byte string types.
+
+    Besides bytes, this converts bytearray, memoryview, mmap, and other objects that support
+    the buffer protocol, such as a slice of a DMA buffer. Their bytes are sent in C order, and
+    they are decoded as bytes.
+    """
 
     @property
     def python_type(self) -> type:
@@ -43,9 +56,28 @@ class BytesConverter(Converter[bytes, wrappers_pb2.BytesValue]):
         """The type-specific protobuf message for the Python type."""
         return wrappers_pb2.BytesValue
 
-    def to_protobuf_message(self, python_value: bytes) -> wrappers_pb2.BytesValue:
+    def to_protobuf_any(self, python_value: Buffer) -> any_pb2.Any:
+        """Convert the Python bytes string to a protobuf BytesValue and pack it as any_pb2.Any.
+
+        The bytes are copied straight from the buffer into the serialized message, instead of
+        into a bytes object and then into a BytesValue message that is then serialized.
+        """
+        data = memoryview(python_value)
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        # proto3 does not serialize an empty value.
+        value = b""
+        if data.nbytes:
+            value_header = _encode_length_delimited_header(
+                wrappers_pb2.BytesValue.VALUE_FIELD_NUMBER, data.nbytes
+            )
+            value = b"".join((value_header, data))
+        return any_pb2.Any(type_url=f"type.googleapis.com/{self.protobuf_typename}", value=value)
+
+    def to_protobuf_message(self, python_value: Buffer) -> wrappers_pb2.BytesValue:
         """Convert the Python bytes string to a protobuf wrappers_pb2.BytesValue."""
-        return self.protobuf_message(value=python_value)
+        # bytes() returns a bytes object as is, and copies other buffers in C order.
+        return self.protobuf_message(value=bytes(python_value))
 
     def to_python_value(self, protobuf_message: wrappers_pb2.BytesValue) -> bytes:
         """Convert the protobuf message to a Python bytes string."""
@@ -69,6 +101,12 @@ class FloatConverter(Converter[float, wrappers_pb2.DoubleValue]):
         """Convert the Python float to a protobuf wrappers_pb2.DoubleValue."""
         return self.protobuf_message(value=python_value)
 
+    def fill_protobuf_message(
+        self, protobuf_message: wrappers_pb2.DoubleValue, python_value: float
+    ) -> None:
+        """Set the value of an existing protobuf wrappers_pb2.DoubleValue."""
+        protobuf_message.value = python_value
+
     def to_python_value(self, protobuf_message: wrappers_pb2.DoubleValue) -> float:
         """Convert the protobuf message to a Python float."""
         return protobuf_message.value
@@ -91,6 +129,12 @@ class IntConverter(Converter[int, wrappers_pb2.Int64Value]):
         """Convert the Python int to a protobuf wrappers_pb2.Int64Value."""
         return self.protobuf_message(value=python_value)
 
+    def fill_protobuf_message(
+        self, protobuf_message: wrappers_pb2.Int64Value, python_value: int
+    ) -> None:
+        """Set the value of an existing protobuf wrappers_pb2.Int64Value."""
+        protobuf_message.value = python_value
+
     def to_python_value(self, protobuf_message: wrappers_pb2.Int64Value) -> int:
         """Convert the protobuf message to a Python int."""
         return protobuf_message.value
@@ -113,6 +157,12 @@ class StrConverter(Converter[str, wrappers_pb2.StringValue]):
         """Convert the Python str to a protobuf wrappers_pb2.StringValue."""
         return self.protobuf_message(value=python_value)
 
+    def fill_protobuf_message(
+        self, protobuf_message: wrappers_pb2.StringValue, python_value: str
+    ) -> None:
+        """Set the value of an existing protobuf wrappers_pb2.StringValue."""
+        protobuf_message.value = python_value
+
     def to_python_value(self, protobuf_message: wrappers_pb2.StringValue) -> str:
         """Convert the protobuf message to a Python string."""
         return protobuf_message.value
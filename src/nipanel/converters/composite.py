@@ -0,0 +1,93 @@
+"""Classes to convert between composite Python values and protobuf types."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from typing import Any, Type
+
+from nipanel._protos import composite_pb2
+from nipanel.converters import Converter
+
+
+class CompositeConverter(Converter[Any, composite_pb2.Composite]):
+    """A converter between composite values and Composite.
+
+    A composite value is a dict with str keys, a dataclass instance, or a named tuple. Each
+    field is converted with the converter for its own type, so related values are set and read
+    together in a single message. Composite values are always read back as dicts.
+    """
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return dict
+
+    @property
+    def protobuf_message(self) -> Type[composite_pb2.Composite]:
+        """The type-specific protobuf message for the Python type."""
+        return composite_pb2.Composite
+
+    def to_protobuf_message(self, python_value: Any) -> composite_pb2.Composite:
+        """Convert the composite value to a protobuf Composite."""
+        # Imported here because nipanel._convert imports this module.
+        from nipanel._convert import to_any
+
+        return self.protobuf_message(
+            fields=[
+                composite_pb2.Composite.Field(name=name, value=to_any(value))
+                for name, value in get_fields(python_value).items()
+            ]
+        )
+
+    def to_python_value(self, protobuf_message: composite_pb2.Composite) -> dict[str, object]:
+        """Convert the protobuf Composite to a dict."""
+        return _convert_fields(protobuf_message, as_numpy=False)
+
+    def to_numpy_value(self, protobuf_message: composite_pb2.Composite) -> dict[str, object]:
+        """Convert the protobuf Composite to a dict whose arrays are numpy arrays."""
+        return _convert_fields(protobuf_message, as_numpy=True)
+
+
+def is_composite(python_value: object) -> bool:
+    """Check whether a Python value is a dict, a dataclass instance, or a named tuple."""
+    return (
+        isinstance(python_value, dict)
+        or _is_named_tuple(python_value)
+        or (dataclasses.is_dataclass(python_value) and not isinstance(python_value, type))
+    )
+
+
+def get_fields(python_value: object) -> Mapping[str, object]:
+    """Get the names and values of a composite value's fields, in order.
+
+    Raises:
+        TypeError: If the value is not a composite value, or is a dict with a key that is not
+            a str.
+    """
+    if isinstance(python_value, dict):
+        for key in python_value:
+            if not isinstance(key, str):
+                raise TypeError(f"Composite field names must be str, not {type(key).__name__}.")
+        return python_value
+    if _is_named_tuple(python_value):
+        return python_value._asdict()  # type: ignore[attr-defined,no-any-return]
+    if dataclasses.is_dataclass(python_value) and not isinstance(python_value, type):
+        # Unlike dataclasses.asdict(), this does not deep copy the field values.
+        return {
+            field.name: getattr(python_value, field.name)
+            for field in dataclasses.fields(python_value)
+        }
+    raise TypeError(f"Unsupported composite type: {type(python_value).__name__}")
+
+
+def _is_named_tuple(python_value: object) -> bool:
+    return isinstance(python_value, tuple) and hasattr(type(python_value), "_fields")
+
+
+def _convert_fields(protobuf_message: composite_pb2.Composite, as_numpy: bool) -> dict[str, object]:
+    from nipanel._convert import from_any
+
+    return {
+        field.name: from_any(field.value, as_numpy=as_numpy) for field in protobuf_message.fields
+    }
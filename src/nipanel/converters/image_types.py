@@ -0,0 +1,227 @@
+"""Classes to convert between images and nipanel protobuf types.
+
+An image is a ``uint8`` or ``uint16`` numpy array with a shape of (height, width) for grayscale
+or (height, width, channels) with 1, 3 (RGB), or 4 (RGBA) channels. This is the layout that
+``st.image`` and most camera and vision libraries use. Wrap an array in an Image to send it as
+an image, since other arrays with the same dtype and shape are not necessarily images.
+
+Pillow is an optional dependency, which is only needed to send or receive PNG and JPEG images.
+It is imported the first time an image is compressed or decompressed.
+"""
+
+from __future__ import annotations
+
+import enum
+import functools
+import io
+import logging
+from typing import Any, Type
+
+import numpy as np
+from google.protobuf import any_pb2
+
+from nipanel._protos import image_pb2
+from nipanel.converters import Converter
+from nipanel.converters._wire_format import _encode_length_delimited_header
+from nipanel.converters.numpy_types import _as_bytes_view, _get_little_endian_data
+
+_logger = logging.getLogger(__name__)
+
+_IMAGE_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16))
+_IMAGE_CHANNEL_COUNTS = (1, 3, 4)
+
+
+class ImageEncoding(enum.Enum):
+    """How an ImageConverter sends the pixels of an image."""
+
+    RAW = image_pb2.IMAGE_ENCODING_RAW
+    """Send the pixels uncompressed, which is fastest but sends every byte of every pixel."""
+
+    PNG = image_pb2.IMAGE_ENCODING_PNG
+    """Send the image as a lossless PNG file."""
+
+    JPEG = image_pb2.IMAGE_ENCODING_JPEG
+    """Send the image as a lossy JPEG file, which is usually a tenth of the size of PNG."""
+
+
+class Image:
+    """A numpy image to send to a panel with a chosen encoding.
+
+    A 1080p RGB frame is about 6 MB uncompressed, but usually only a few hundred KB as JPEG::
+
+        panel.set_value("frame", Image(frame, ImageEncoding.JPEG, quality=85))
+
+    Pillow can write PNG for grayscale, RGB, and RGBA images with 8-bit channels and grayscale
+    images with 16-bit channels, and JPEG for grayscale and RGB images with 8-bit channels.
+    Images that the encoding does not support, or all images if Pillow is not installed, are
+    sent uncompressed instead.
+
+    Images are decoded to numpy arrays with the original dtype and shape, which can be passed
+    straight to ``st.image``.
+    """
+
+    __slots__ = ["_pixels", "_encoding", "_quality"]
+
+    def __init__(
+        self, pixels: np.ndarray[Any, Any], encoding: ImageEncoding, *, quality: int = 90
+    ) -> None:
+        """Initialize the image.
+
+        Args:
+            pixels: A uint8 or uint16 array with a shape of (height, width) or
+                (height, width, channels) with 1, 3, or 4 channels.
+            encoding: How to send the pixels of the image.
+            quality: The JPEG quality, from 0 to 95. Higher values send larger images with
+                fewer compression artifacts. This is ignored for other encodings.
+
+        Raises:
+            TypeError: If the array does not have the dtype and shape of an image.
+        """
+        if not _is_image(pixels):
+            raise TypeError(
+                f"Unsupported image with dtype {pixels.dtype} and shape {pixels.shape}. "
+                "Images must be uint8 or uint16 arrays with a shape of (height, width) or "
+                "(height, width, channels) with 1, 3, or 4 channels."
+            )
+        self._pixels = pixels
+        self._encoding = encoding
+        self._quality = quality
+
+    @property
+    def pixels(self) -> np.ndarray[Any, Any]:
+        """The pixels of the image."""
+        return self._pixels
+
+    @property
+    def encoding(self) -> ImageEncoding:
+        """How to send the pixels of the image."""
+        return self._encoding
+
+    @property
+    def quality(self) -> int:
+        """The JPEG quality."""
+        return self._quality
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__name__}"
+            f"(<{self._pixels.dtype} array with shape {self._pixels.shape}>, "
+            f"{self._encoding}, quality={self._quality})"
+        )
+
+
+class ImageConverter(Converter[Any, image_pb2.Image]):
+    """A converter between Image and the Image protobuf message.
+
+    Images are decoded to numpy arrays, which can be passed straight to ``st.image``.
+    """
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return Image
+
+    @property
+    def protobuf_message(self) -> Type[image_pb2.Image]:
+        """The type-specific protobuf message for the Python type."""
+        return image_pb2.Image
+
+    def to_protobuf_any(self, python_value: Image) -> any_pb2.Any:
+        """Convert the image to a protobuf Image and pack it as any_pb2.Any.
+
+        The pixels are copied straight into the serialized message, instead of into an Image
+        message that is then serialized.
+        """
+        return any_pb2.Any(
+            type_url=f"type.googleapis.com/{self.protobuf_typename}",
+            value=self._serialize(python_value),
+        )
+
+    def to_protobuf_message(self, python_value: Image) -> image_pb2.Image:
+        """Convert the image to a protobuf Image."""
+        return self.protobuf_message.FromString(self._serialize(python_value))
+
+    def to_python_value(self, protobuf_message: image_pb2.Image) -> np.ndarray[Any, Any]:
+        """Convert the protobuf Image to a numpy image."""
+        dtype = np.dtype(protobuf_message.dtype)
+        if dtype not in _IMAGE_DTYPES:
+            raise TypeError(
+                f"Unsupported image dtype: {dtype}. Supported dtypes are uint8 and uint16."
+            )
+        shape = tuple(protobuf_message.shape)
+        if protobuf_message.encoding == image_pb2.IMAGE_ENCODING_RAW:
+            pixels = np.frombuffer(protobuf_message.data, dtype=dtype)
+            # Copy out of the read-only message bytes, so the image is writable like the original.
+            return pixels.reshape(shape).copy()
+
+        from PIL import Image as PILImage
+
+        with PILImage.open(io.BytesIO(protobuf_message.data)) as image:
+            pixels = np.array(image)
+        return pixels.astype(dtype, copy=False).reshape(shape)
+
+    def _serialize(self, python_value: Image) -> bytes:
+        image = python_value.pixels
+        encoding = _get_supported_encoding(image, python_value.encoding)
+        if encoding == ImageEncoding.RAW:
+            pixels = _get_little_endian_data(image)
+        else:
+            compressed = _compress(image, encoding, python_value.quality)
+            pixels = np.frombuffer(compressed, dtype=np.uint8)
+        message = self.protobuf_message(
+            dtype=image.dtype.newbyteorder("<").str,
+            shape=image.shape,
+            encoding=encoding.value,
+        )
+        data_header = _encode_length_delimited_header(
+            image_pb2.Image.DATA_FIELD_NUMBER, pixels.nbytes
+        )
+        return b"".join((message.SerializeToString(), data_header, _as_bytes_view(pixels)))
+
+
+def _is_image(python_value: np.ndarray[Any, Any]) -> bool:
+    if python_value.dtype.newbyteorder("=") not in _IMAGE_DTYPES:
+        return False
+    if python_value.ndim == 2:
+        return True
+    return python_value.ndim == 3 and python_value.shape[2] in _IMAGE_CHANNEL_COUNTS
+
+
+def _get_supported_encoding(image: np.ndarray[Any, Any], encoding: ImageEncoding) -> ImageEncoding:
+    if encoding == ImageEncoding.RAW or image.size == 0 or not _has_pillow():
+        return ImageEncoding.RAW
+    channel_count = image.shape[2] if image.ndim == 3 else 1
+    is_8_bit = image.dtype.itemsize == 1
+    if encoding == ImageEncoding.JPEG and is_8_bit and channel_count in (1, 3):
+        return ImageEncoding.JPEG
+    # PNG also supports the images that JPEG does not, other than 16-bit color images.
+    if is_8_bit or channel_count == 1:
+        return ImageEncoding.PNG
+    return ImageEncoding.RAW
+
+
+def _compress(image: np.ndarray[Any, Any], encoding: ImageEncoding, quality: int) -> bytes:
+    from PIL import Image as PILImage
+
+    if image.ndim == 3 and image.shape[2] == 1:
+        image = image[:, :, 0]
+    pil_image = PILImage.fromarray(np.ascontiguousarray(image, image.dtype.newbyteorder("=")))
+    output = io.BytesIO()
+    if encoding == ImageEncoding.JPEG:
+        pil_image.save(output, format="JPEG", quality=quality)
+    else:
+        # The fastest compression level is several times faster than the default and
+        # usually only a little larger.
+        pil_image.save(output, format="PNG", compress_level=1)
+    return output.getvalue()
+
+
+@functools.cache
+def _has_pillow() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        _logger.warning("Pillow is not installed, so images are sent uncompressed.")
+        return False
+    return True
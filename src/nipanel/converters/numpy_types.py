@@ -0,0 +1,86 @@
+"""Classes to convert between numpy arrays and protobuf types."""
+
+from __future__ import annotations
+
+from typing import Any, Type
+
+import numpy as np
+from google.protobuf import any_pb2
+
+from nipanel._protos import array_pb2
+from nipanel.converters import Converter
+from nipanel.converters._wire_format import _encode_length_delimited_header
+
+NDARRAY_DTYPE_KINDS = "biufcmM"
+"""The numpy dtype kinds that NDArrayConverter handles.
+
+These are bool, signed and unsigned integer, floating point, complex, timedelta64, and
+datetime64. Their elements are fixed-size values that can be copied as raw bytes.
+"""
+
+
+class NDArrayConverter(Converter[np.ndarray[Any, Any], array_pb2.NDArray]):
+    """A converter between numpy arrays of any shape and NDArray.
+
+    The array's dtype and shape are preserved. Multi-byte elements are sent in little-endian
+    byte order, so a big-endian array comes back as an equal little-endian array.
+    """
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return np.ndarray
+
+    @property
+    def protobuf_message(self) -> Type[array_pb2.NDArray]:
+        """The type-specific protobuf message for the Python type."""
+        return array_pb2.NDArray
+
+    def to_protobuf_any(self, python_value: np.ndarray[Any, Any]) -> any_pb2.Any:
+        """Convert the numpy array to a protobuf NDArray and pack it as any_pb2.Any.
+
+        The array's buffer is copied straight into the serialized message, instead of into an
+        NDArray message that is then serialized.
+        """
+        return any_pb2.Any(
+            type_url=f"type.googleapis.com/{self.protobuf_typename}",
+            value=self._serialize(python_value),
+        )
+
+    def to_protobuf_message(self, python_value: np.ndarray[Any, Any]) -> array_pb2.NDArray:
+        """Convert the numpy array to a protobuf NDArray."""
+        data = _get_little_endian_data(python_value)
+        return self.protobuf_message(
+            dtype=data.dtype.str, shape=python_value.shape, data=data.tobytes()
+        )
+
+    def to_python_value(self, protobuf_message: array_pb2.NDArray) -> np.ndarray[Any, Any]:
+        """Convert the protobuf NDArray to a numpy array."""
+        dtype = np.dtype(protobuf_message.dtype)
+        _check_dtype(dtype)
+        array = np.frombuffer(protobuf_message.data, dtype=dtype)
+        # Copy out of the read-only message bytes, so the array is writable like the original.
+        return array.reshape(tuple(protobuf_message.shape)).copy()
+
+    def _serialize(self, python_value: np.ndarray[Any, Any]) -> bytes:
+        data = _get_little_endian_data(python_value)
+        message = self.protobuf_message(dtype=data.dtype.str, shape=python_value.shape)
+        data_header = _encode_length_delimited_header(
+            array_pb2.NDArray.DATA_FIELD_NUMBER, data.nbytes
+        )
+        return b"".join((message.SerializeToString(), data_header, _as_bytes_view(data)))
+
+
+def _get_little_endian_data(python_value: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    _check_dtype(python_value.dtype)
+    return np.ascontiguousarray(python_value, dtype=python_value.dtype.newbyteorder("<"))
+
+
+def _as_bytes_view(data: np.ndarray[Any, Any]) -> memoryview:
+    # datetime64 and timedelta64 arrays do not support the buffer protocol, but uint8 does.
+    return data.reshape(-1).view(np.uint8).data
+
+
+def _check_dtype(dtype: np.dtype[Any]) -> None:
+    if dtype.kind not in NDARRAY_DTYPE_KINDS:
+        raise TypeError(f"Unsupported dtype: {dtype}. Supported kinds are: {NDARRAY_DTYPE_KINDS}")
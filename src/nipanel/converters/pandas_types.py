@@ -0,0 +1,98 @@
+"""Classes to convert between pandas objects and nipanel protobuf types.
+
+A DataFrame or Series is converted to an Apache Arrow table, one column at a time, and sent in
+the Arrow IPC streaming format. The table's pandas metadata keeps the index, the column names,
+and the column dtypes, so categorical and timezone-aware columns round trip.
+
+pandas and pyarrow are optional dependencies. They are imported the first time a pandas value
+is converted, so these converters can be registered without them.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Type
+
+from nipanel._protos import pandas_pb2
+from nipanel.converters.arrow_types import _ArrowConverter, _read_table
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# The name of the Series column in the Arrow table and the schema metadata key for the Series
+# name. The Series name can be any hashable value, so it is not used as the column name.
+_SERIES_COLUMN_NAME = "nipanel.series"
+_SERIES_NAME_METADATA_KEY = b"nipanel.series_name"
+
+
+class DataFrameConverter(_ArrowConverter["pd.DataFrame"]):
+    """A converter for pandas.DataFrame."""
+
+    _python_typename = "pandas.DataFrame"
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        import pandas as pd
+
+        python_type: type = pd.DataFrame
+        return python_type
+
+    @property
+    def protobuf_message(self) -> Type[pandas_pb2.PandasDataFrame]:
+        """The type-specific protobuf message for the Python type."""
+        return pandas_pb2.PandasDataFrame
+
+    def _to_arrow(self, python_value: pd.DataFrame) -> pa.Table:
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(python_value)
+
+    def _read_ipc_stream(self, ipc_stream: memoryview) -> pd.DataFrame:
+        import pandas as pd
+
+        if not ipc_stream:
+            return pd.DataFrame()
+        # to_pandas copies the columns out of the received bytes, so the DataFrame is writable.
+        data_frame: pd.DataFrame = _read_table(ipc_stream).to_pandas()
+        return data_frame
+
+
+class SeriesConverter(_ArrowConverter["pd.Series"]):
+    """A converter for pandas.Series."""
+
+    _python_typename = "pandas.Series"
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        import pandas as pd
+
+        python_type: type = pd.Series
+        return python_type
+
+    @property
+    def protobuf_message(self) -> Type[pandas_pb2.PandasSeries]:
+        """The type-specific protobuf message for the Python type."""
+        return pandas_pb2.PandasSeries
+
+    def _to_arrow(self, python_value: pd.Series) -> pa.Table:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(python_value.to_frame(name=_SERIES_COLUMN_NAME))
+        # Names that JSON does not support, such as timestamps, are sent as strings.
+        series_name = json.dumps(python_value.name, default=str)
+        return table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), _SERIES_NAME_METADATA_KEY: series_name}
+        )
+
+    def _read_ipc_stream(self, ipc_stream: memoryview) -> pd.Series:
+        import pandas as pd
+
+        if not ipc_stream:
+            return pd.Series()
+        table = _read_table(ipc_stream)
+        series: pd.Series = table.to_pandas()[_SERIES_COLUMN_NAME]
+        series.name = json.loads(table.schema.metadata[_SERIES_NAME_METADATA_KEY])
+        return series
@@ -8,6 +8,7 @@ from typing import Any, Type, Union
 import hightime as ht
 import nitypes.bintime as bt
 import numpy as np
+from google.protobuf.message import Message
 from ni.protobuf.types import (
     array_pb2,
     precision_duration_pb2,
@@ -28,6 +29,8 @@ from nitypes.waveform import AnalogWaveform, ComplexWaveform, DigitalWaveform, S
 from typing_extensions import TypeAlias
 
 from nipanel.converters import Converter, CollectionConverter, CollectionConverter2D
+from nipanel.converters._wire_format import _encode_length_delimited_header
+from nipanel.converters.waveform_types import _get_attributes, _get_timing_fields
 
 _AnyScalarType: TypeAlias = Union[bool, int, float, str]
 
@@ -47,12 +50,24 @@ class BoolCollectionConverter(CollectionConverter[bool, array_pb2.BoolArray]):
 
     def to_protobuf_message(self, python_value: Collection[bool]) -> array_pb2.BoolArray:
         """Convert the collection of bools to array_pb2.BoolArray."""
+        if isinstance(python_value, np.ndarray):
+            message = self.protobuf_message()
+            # numpy stores bools as single bytes of 0 or 1, which is also their varint encoding.
+            values = np.ascontiguousarray(python_value, dtype=np.bool_).view(np.uint8)
+            _merge_packed_values(message, array_pb2.BoolArray.VALUES_FIELD_NUMBER, values)
+            return message
         return self.protobuf_message(values=python_value)
 
     def to_python_value(self, protobuf_message: array_pb2.BoolArray) -> Collection[bool]:
         """Convert the protobuf message to a Python collection of bools."""
         return list(protobuf_message.values)
 
+    def to_numpy_value(
+        self, protobuf_message: array_pb2.BoolArray
+    ) -> np.ndarray[Any, np.dtype[np.bool_]]:
+        """Convert the protobuf message to a numpy array of bools."""
+        return np.asarray(protobuf_message.values, dtype=np.bool_)
+
 
 class BytesCollectionConverter(CollectionConverter[bytes, array_pb2.BytesArray]):
     """A converter for a Collection of byte strings."""
@@ -91,12 +106,23 @@ class FloatCollectionConverter(CollectionConverter[float, array_pb2.DoubleArray]
 
     def to_protobuf_message(self, python_value: Collection[float]) -> array_pb2.DoubleArray:
         """Convert the collection of floats to array_pb2.DoubleArray."""
+        if isinstance(python_value, np.ndarray):
+            message = self.protobuf_message()
+            values = np.ascontiguousarray(python_value, dtype="<f8")
+            _merge_packed_values(message, array_pb2.DoubleArray.VALUES_FIELD_NUMBER, values)
+            return message
         return self.protobuf_message(values=python_value)
 
     def to_python_value(self, protobuf_message: array_pb2.DoubleArray) -> Collection[float]:
         """Convert the protobuf message to a Python collection of floats."""
         return list(protobuf_message.values)
 
+    def to_numpy_value(
+        self, protobuf_message: array_pb2.DoubleArray
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        """Convert the protobuf message to a numpy array of floats."""
+        return np.asarray(protobuf_message.values, dtype=np.float64)
+
 
 class IntCollectionConverter(CollectionConverter[int, array_pb2.SInt64Array]):
     """A converter for a Collection of integers."""
@@ -113,12 +139,22 @@ class IntCollectionConverter(CollectionConverter[int, array_pb2.SInt64Array]):
 
     def to_protobuf_message(self, python_value: Collection[int]) -> array_pb2.SInt64Array:
         """Convert the collection of integers to array_pb2.SInt64Array."""
+        if isinstance(python_value, np.ndarray):
+            # Zigzag varints have no fixed width, so there is no buffer to copy. Converting to a
+            # list in bulk is still much faster than letting protobuf iterate over the array.
+            return self.protobuf_message(values=python_value.tolist())
         return self.protobuf_message(values=python_value)
 
     def to_python_value(self, protobuf_message: array_pb2.SInt64Array) -> Collection[int]:
         """Convert the protobuf message to a Python collection of integers."""
         return list(protobuf_message.values)
 
+    def to_numpy_value(
+        self, protobuf_message: array_pb2.SInt64Array
+    ) -> np.ndarray[Any, np.dtype[np.int64]]:
+        """Convert the protobuf message to a numpy array of integers."""
+        return np.asarray(protobuf_message.values, dtype=np.int64)
+
 
 class StrCollectionConverter(CollectionConverter[str, array_pb2.StringArray]):
     """A converter for a Collection of strings."""
@@ -159,6 +195,16 @@ class Double2DArrayConverter(CollectionConverter2D[float, array_pb2.Double2DArra
         self, python_value: Collection[Collection[float]]
     ) -> array_pb2.Double2DArray:
         """Convert the Python Collection[Collection[float]] to a protobuf Double2DArray."""
+        if isinstance(python_value, np.ndarray):
+            if python_value.ndim != 2:
+                raise ValueError(f"The array must have 2 dimensions, not {python_value.ndim}.")
+            rows, columns = python_value.shape
+            message = array_pb2.Double2DArray(rows=rows, columns=columns)
+            # A C-order buffer is the row major order that Double2DArray uses.
+            data = np.ascontiguousarray(python_value, dtype="<f8")
+            _merge_packed_values(message, array_pb2.Double2DArray.DATA_FIELD_NUMBER, data)
+            return message
+
         rows = len(python_value)
         if rows:
             visitor = iter(python_value)
@@ -190,6 +236,16 @@ class Double2DArrayConverter(CollectionConverter2D[float, array_pb2.Double2DArra
 
         return list_of_lists
 
+    def to_numpy_value(
+        self, protobuf_message: array_pb2.Double2DArray
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        """Convert the protobuf Double2DArray to a 2D numpy array of floats."""
+        rows, columns = protobuf_message.rows, protobuf_message.columns
+        if len(protobuf_message.data) != rows * columns:
+            raise ValueError("The length of the data list must equal rows times columns.")
+        # Reshaping the flat array in row major order returns a view, not a copy.
+        return np.asarray(protobuf_message.data, dtype=np.float64).reshape(rows, columns)
+
 
 class DoubleAnalogWaveformConverter(
     Converter[AnalogWaveform[np.float64], waveform_pb2.DoubleAnalogWaveform]
@@ -216,7 +272,13 @@ class DoubleAnalogWaveformConverter(
         self, python_value: AnalogWaveform[np.float64]
     ) -> waveform_pb2.DoubleAnalogWaveform:
         """Convert the Python AnalogWaveform to a protobuf DoubleAnalogWaveform."""
-        return waveform_conversion.float64_analog_waveform_to_protobuf(python_value)
+        message = self.protobuf_message(
+            attributes=_get_attributes(python_value.extended_properties),
+            **_get_timing_fields(python_value),
+        )
+        y_data = np.ascontiguousarray(python_value.scaled_data, dtype="<f8")
+        _merge_packed_values(message, waveform_pb2.DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, y_data)
+        return message
 
     def to_python_value(
         self, protobuf_message: waveform_pb2.DoubleAnalogWaveform
@@ -558,3 +620,13 @@ class VectorConverter(Converter[Vector[_AnyScalarType], vector_pb2.Vector]):
     def to_python_value(self, protobuf_message: vector_pb2.Vector) -> Vector[_AnyScalarType]:
         """Convert the protobuf message to a Python Vector."""
         return vector_conversion.vector_from_protobuf(protobuf_message)
+
+
+def _merge_packed_values(message: Message, field_number: int, values: np.ndarray[Any, Any]) -> None:
+    """Merge a contiguous little-endian array into a packed repeated field.
+
+    The array's buffer is already in the packed wire format, so protobuf parses it in bulk
+    instead of converting one element at a time.
+    """
+    header = _encode_length_delimited_header(field_number, values.nbytes)
+    message.MergeFromString(b"".join((header, values.reshape(-1).data)))
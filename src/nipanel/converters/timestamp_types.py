@@ -0,0 +1,175 @@
+"""Classes to convert between collections of timestamps and nipanel protobuf types.
+
+A collection of timestamps is sent as two arrays, the whole seconds and the fractions of a
+second of every timestamp, with the same epoch and resolution as a PrecisionTimestamp. Both
+arrays are computed and decoded with numpy, instead of one PrecisionTimestamp at a time.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Collection
+from typing import Any, Type
+
+import hightime as ht
+import numpy as np
+from google.protobuf import any_pb2
+
+from nipanel._protos import array_pb2
+from nipanel.converters import CollectionConverter
+from nipanel.converters._wire_format import _encode_length_delimited_header
+
+# The number of seconds from the NI epoch, 1904-01-01 00:00:00 UTC, to the Unix epoch.
+_NI_EPOCH_OFFSET_SECONDS = 2_082_844_800
+_UNIX_EPOCH = dt.datetime(1970, 1, 1)
+_UNIX_EPOCH_UTC = _UNIX_EPOCH.replace(tzinfo=dt.timezone.utc)
+_ONE_MICROSECOND = dt.timedelta(microseconds=1)
+
+_FEMTOSECONDS_PER_SECOND = 10**15
+_FEMTOSECONDS_PER_MICROSECOND = 10**9
+_NANOSECONDS_PER_SECOND = 10**9
+
+
+class TimestampCollectionConverter(CollectionConverter[dt.datetime, array_pb2.TimestampArray]):
+    """A converter for a Collection of datetime.datetime or hightime.datetime values.
+
+    Naive datetimes are treated as UTC, like a single datetime.datetime. The timestamps are
+    decoded as a list of UTC hightime.datetime values, accurate to the femtosecond. With
+    ``as_numpy=True``, they are decoded as a ``datetime64[ns]`` array of UTC times instead,
+    which can be used as the x-axis of a chart without converting each timestamp.
+    """
+
+    @property
+    def item_type(self) -> type:
+        """The Python type that this converter handles."""
+        return dt.datetime
+
+    @property
+    def protobuf_message(self) -> Type[array_pb2.TimestampArray]:
+        """The type-specific protobuf message for the Python type."""
+        return array_pb2.TimestampArray
+
+    def to_protobuf_any(self, python_value: Collection[dt.datetime]) -> any_pb2.Any:
+        """Convert the collection of timestamps to TimestampArray and pack it as any_pb2.Any.
+
+        The arrays are copied straight into the serialized message, instead of into a
+        TimestampArray message that is then serialized.
+        """
+        return any_pb2.Any(
+            type_url=f"type.googleapis.com/{self.protobuf_typename}",
+            value=self._serialize(python_value),
+        )
+
+    def to_protobuf_message(
+        self, python_value: Collection[dt.datetime]
+    ) -> array_pb2.TimestampArray:
+        """Convert the collection of timestamps to array_pb2.TimestampArray."""
+        return self.protobuf_message.FromString(self._serialize(python_value))
+
+    def to_python_value(self, protobuf_message: array_pb2.TimestampArray) -> list[ht.datetime]:
+        """Convert the protobuf message to a list of UTC hightime.datetime values."""
+        seconds, fractional_seconds = _read_arrays(protobuf_message)
+        femtoseconds = _round_fractional_seconds(fractional_seconds, _FEMTOSECONDS_PER_SECOND)
+        microseconds = (seconds - _NI_EPOCH_OFFSET_SECONDS) * 10**6
+        microseconds += femtoseconds // _FEMTOSECONDS_PER_MICROSECOND
+        # numpy creates the datetimes to the microsecond, which is most of the work.
+        datetimes: list[dt.datetime] = microseconds.astype("datetime64[us]").tolist()
+        return [
+            ht.datetime(
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+                femtosecond=femtosecond,
+                tzinfo=dt.timezone.utc,
+            )
+            for value, femtosecond in zip(
+                datetimes, (femtoseconds % _FEMTOSECONDS_PER_MICROSECOND).tolist()
+            )
+        ]
+
+    def to_numpy_value(
+        self, protobuf_message: array_pb2.TimestampArray
+    ) -> np.ndarray[Any, np.dtype[np.datetime64]]:
+        """Convert the protobuf message to a numpy datetime64[ns] array of UTC times."""
+        seconds, fractional_seconds = _read_arrays(protobuf_message)
+        nanoseconds = _round_fractional_seconds(fractional_seconds, _NANOSECONDS_PER_SECOND)
+        nanoseconds += (seconds - _NI_EPOCH_OFFSET_SECONDS) * _NANOSECONDS_PER_SECOND
+        return nanoseconds.view("datetime64[ns]")
+
+    def _serialize(self, python_value: Collection[dt.datetime]) -> bytes:
+        seconds, fractional_seconds = _to_arrays(python_value)
+        return b"".join(
+            (
+                _encode_length_delimited_header(
+                    array_pb2.TimestampArray.SECONDS_FIELD_NUMBER, seconds.nbytes
+                ),
+                seconds.data,
+                _encode_length_delimited_header(
+                    array_pb2.TimestampArray.FRACTIONAL_SECONDS_FIELD_NUMBER,
+                    fractional_seconds.nbytes,
+                ),
+                fractional_seconds.data,
+            )
+        )
+
+
+def _to_arrays(
+    python_value: Collection[dt.datetime],
+) -> tuple[np.ndarray[Any, np.dtype[np.int64]], np.ndarray[Any, np.dtype[np.uint64]]]:
+    """Get the whole seconds since the NI epoch and fractional seconds of the timestamps."""
+    count = len(python_value)
+    if count == 0:
+        return np.empty(0, dtype="<i8"), np.empty(0, dtype="<u8")
+    first_value = next(iter(python_value))
+    epoch = _UNIX_EPOCH if first_value.tzinfo is None else _UNIX_EPOCH_UTC
+    # datetime.datetime's subtraction skips hightime's, which is many times slower. It is only
+    # accurate to the microsecond, so hightime's femtoseconds are added separately.
+    microseconds = np.fromiter(
+        (dt.datetime.__sub__(value, epoch) // _ONE_MICROSECOND for value in python_value),
+        dtype=np.int64,
+        count=count,
+    )
+    seconds, microseconds = np.divmod(microseconds, 10**6)
+    femtoseconds = microseconds * _FEMTOSECONDS_PER_MICROSECOND
+    # Only hightime.datetime has femtoseconds, but a collection can mix it with datetime.
+    femtoseconds += np.fromiter(
+        (getattr(value, "femtosecond", 0) for value in python_value),
+        dtype=np.int64,
+        count=count,
+    )
+    # 2^64 / 10^15 is 2^49 / 5^15, so each whole multiple of 5^15 femtoseconds converts exactly
+    # and only the rest is rounded.
+    quotient, remainder = np.divmod(femtoseconds, 5**15)
+    fractional_seconds = quotient.astype(np.uint64) << np.uint64(49)
+    fractional_seconds += np.rint(remainder * (2**49 / 5**15)).astype(np.uint64)
+    seconds += _NI_EPOCH_OFFSET_SECONDS
+    return seconds.astype("<i8", copy=False), fractional_seconds.astype("<u8", copy=False)
+
+
+def _round_fractional_seconds(
+    fractional_seconds: np.ndarray[Any, np.dtype[np.uint64]], units_per_second: int
+) -> np.ndarray[Any, np.dtype[np.int64]]:
+    """Round fractional seconds to the nearest unit, such as femtoseconds."""
+    # float64 cannot hold every uint64, so the high and low 32 bits are converted separately.
+    high = (fractional_seconds >> np.uint64(32)).astype(np.float64)
+    low = (fractional_seconds & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.rint(high * (units_per_second / 2**32) + low * (units_per_second / 2**64)).astype(
+        np.int64
+    )
+
+
+def _read_arrays(
+    protobuf_message: array_pb2.TimestampArray,
+) -> tuple[np.ndarray[Any, np.dtype[np.int64]], np.ndarray[Any, np.dtype[np.uint64]]]:
+    seconds = np.frombuffer(protobuf_message.seconds, dtype="<i8")
+    fractional_seconds = np.frombuffer(protobuf_message.fractional_seconds, dtype="<u8")
+    if seconds.size != fractional_seconds.size:
+        raise ValueError(
+            f"TimestampArray has {seconds.size} seconds but {fractional_seconds.size} "
+            "fractional seconds."
+        )
+    return seconds.astype(np.int64), fractional_seconds.astype(np.uint64)
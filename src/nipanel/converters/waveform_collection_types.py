@@ -0,0 +1,333 @@
+"""Classes to convert between collections of nitypes waveforms and nipanel protobuf types.
+
+A collection of waveforms, such as the waveform of each channel that an NI-DAQmx task reads, is
+sent as one value. When every waveform has the same timing, or every spectrum has the same
+frequencies, it is sent once instead of with each waveform.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from typing import Any, Literal, Type
+
+import numpy as np
+from ni.protobuf.types import waveform_pb2
+from nitypes.waveform import AnalogWaveform, ComplexWaveform, Spectrum, Timing
+
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel.converters import CollectionConverter
+from nipanel.converters.protobuf_types import _merge_packed_values
+from nipanel.converters.waveform_types import (
+    QuantizedAnalogWaveformConverter,
+    _get_attributes,
+    _get_extended_properties,
+    _get_timing,
+    _get_timing_fields,
+)
+
+
+class DoubleAnalogWaveformCollectionConverter(
+    CollectionConverter[
+        AnalogWaveform[np.float64], waveform_pb2_nipanel.DoubleAnalogWaveformCollection
+    ]
+):
+    """A converter for a Collection of AnalogWaveform types with double-precision data.
+
+    The waveforms are decoded as a list of AnalogWaveform types, in the same order.
+    """
+
+    @property
+    def item_type(self) -> type:
+        """The Python type that this converter handles."""
+        return AnalogWaveform
+
+    @property
+    def python_typename(self) -> str:
+        """The Python type name that this converter handles."""
+        return _get_collection_typename(AnalogWaveform, "float64")
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.DoubleAnalogWaveformCollection]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.DoubleAnalogWaveformCollection
+
+    def to_protobuf_message(
+        self, python_value: Collection[AnalogWaveform[np.float64]]
+    ) -> waveform_pb2_nipanel.DoubleAnalogWaveformCollection:
+        """Convert the Python AnalogWaveforms to a DoubleAnalogWaveformCollection."""
+        waveforms = list(python_value)
+        message = self.protobuf_message()
+        has_shared_timing = _set_shared_timing(message, waveforms)
+        for waveform in waveforms:
+            item = message.waveforms.add(attributes=_get_attributes(waveform.extended_properties))
+            if not has_shared_timing:
+                item.MergeFrom(waveform_pb2.DoubleAnalogWaveform(**_get_timing_fields(waveform)))
+            y_data = np.ascontiguousarray(waveform.scaled_data, dtype="<f8")
+            _merge_packed_values(
+                item, waveform_pb2.DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, y_data
+            )
+        return message
+
+    def to_python_value(
+        self, protobuf_message: waveform_pb2_nipanel.DoubleAnalogWaveformCollection
+    ) -> list[AnalogWaveform[np.float64]]:
+        """Convert the DoubleAnalogWaveformCollection to a list of Python AnalogWaveforms."""
+        shared_timing = _get_shared_timing(protobuf_message)
+        return [
+            AnalogWaveform.from_array_1d(
+                np.asarray(item.y_data, dtype=np.float64),
+                dtype=np.float64,
+                copy=False,
+                extended_properties=_get_extended_properties(item.attributes),
+                timing=shared_timing if shared_timing is not None else _get_timing(item),
+            )
+            for item in protobuf_message.waveforms
+        ]
+
+
+class DoubleComplexWaveformCollectionConverter(
+    CollectionConverter[
+        ComplexWaveform[np.complex128], waveform_pb2_nipanel.DoubleComplexWaveformCollection
+    ]
+):
+    """A converter for a Collection of ComplexWaveform types with 64-bit real and imaginary data.
+
+    The waveforms are decoded as a list of ComplexWaveform types, in the same order.
+    """
+
+    @property
+    def item_type(self) -> type:
+        """The Python type that this converter handles."""
+        return ComplexWaveform
+
+    @property
+    def python_typename(self) -> str:
+        """The Python type name that this converter handles."""
+        return _get_collection_typename(ComplexWaveform, "complex128")
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.DoubleComplexWaveformCollection]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.DoubleComplexWaveformCollection
+
+    def to_protobuf_message(
+        self, python_value: Collection[ComplexWaveform[np.complex128]]
+    ) -> waveform_pb2_nipanel.DoubleComplexWaveformCollection:
+        """Convert the Python ComplexWaveforms to a DoubleComplexWaveformCollection."""
+        waveforms = list(python_value)
+        message = self.protobuf_message()
+        has_shared_timing = _set_shared_timing(message, waveforms)
+        for waveform in waveforms:
+            item = message.waveforms.add(attributes=_get_attributes(waveform.extended_properties))
+            if not has_shared_timing:
+                item.MergeFrom(waveform_pb2.DoubleComplexWaveform(**_get_timing_fields(waveform)))
+            # The real and imaginary parts of each sample are interleaved.
+            y_data = np.ascontiguousarray(waveform.scaled_data, dtype="<c16").view("<f8")
+            _merge_packed_values(
+                item, waveform_pb2.DoubleComplexWaveform.Y_DATA_FIELD_NUMBER, y_data
+            )
+        return message
+
+    def to_python_value(
+        self, protobuf_message: waveform_pb2_nipanel.DoubleComplexWaveformCollection
+    ) -> list[ComplexWaveform[np.complex128]]:
+        """Convert the DoubleComplexWaveformCollection to a list of Python ComplexWaveforms."""
+        shared_timing = _get_shared_timing(protobuf_message)
+        return [
+            ComplexWaveform.from_array_1d(
+                np.asarray(item.y_data, dtype=np.float64).view(np.complex128),
+                dtype=np.complex128,
+                copy=False,
+                extended_properties=_get_extended_properties(item.attributes),
+                timing=shared_timing if shared_timing is not None else _get_timing(item),
+            )
+            for item in protobuf_message.waveforms
+        ]
+
+
+class QuantizedAnalogWaveformCollectionConverter(
+    CollectionConverter[AnalogWaveform[Any], waveform_pb2_nipanel.QuantizedAnalogWaveformCollection]
+):
+    """A converter that sends a Collection of float64 AnalogWaveform types as 16-bit samples.
+
+    Each waveform is quantized with its own scale, as QuantizedAnalogWaveformConverter does.
+    The waveforms are decoded as a list of AnalogWaveform types with 16-bit samples as their
+    raw_data, in the same order.
+
+    It is registered to decode QuantizedAnalogWaveformCollection messages, but it is not used to
+    encode collections of analog waveforms by default. To send a collection this way and get
+    its error bound, pass ``quantize=True`` to ``set_value()``.
+    """
+
+    @property
+    def item_type(self) -> type:
+        """The Python type that this converter handles."""
+        return AnalogWaveform
+
+    @property
+    def python_typename(self) -> str:
+        """The Python type name that this converter handles."""
+        return _get_collection_typename(AnalogWaveform, "float64")
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.QuantizedAnalogWaveformCollection]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.QuantizedAnalogWaveformCollection
+
+    def to_protobuf_message(
+        self, python_value: Collection[AnalogWaveform[Any]]
+    ) -> waveform_pb2_nipanel.QuantizedAnalogWaveformCollection:
+        """Convert the Python AnalogWaveforms to a QuantizedAnalogWaveformCollection.
+
+        Raises:
+            ValueError: If a sample is NaN or infinite.
+        """
+        message, _ = self.to_quantized_message(python_value)
+        return message
+
+    def to_quantized_message(
+        self, python_value: Collection[AnalogWaveform[Any]]
+    ) -> tuple[waveform_pb2_nipanel.QuantizedAnalogWaveformCollection, float]:
+        """Convert the Python AnalogWaveforms to a QuantizedAnalogWaveformCollection.
+
+        Returns:
+            A tuple of the message and the largest error bound of the waveforms.
+
+        Raises:
+            ValueError: If a sample is NaN or infinite.
+        """
+        waveforms = list(python_value)
+        message = self.protobuf_message()
+        has_shared_timing = _set_shared_timing(message, waveforms)
+        item_converter = QuantizedAnalogWaveformConverter()
+        error_bound = 0.0
+        for waveform in waveforms:
+            item, item_error_bound = item_converter.to_quantized_message(waveform)
+            if has_shared_timing:
+                for field_name in _TIMING_FIELD_NAMES:
+                    item.ClearField(field_name)
+            message.waveforms.append(item)
+            error_bound = max(error_bound, item_error_bound)
+        return message, error_bound
+
+    def to_python_value(
+        self, protobuf_message: waveform_pb2_nipanel.QuantizedAnalogWaveformCollection
+    ) -> list[AnalogWaveform[Any]]:
+        """Convert the QuantizedAnalogWaveformCollection to a list of Python AnalogWaveforms."""
+        shared_timing = _get_shared_timing(protobuf_message)
+        item_converter = QuantizedAnalogWaveformConverter()
+        waveforms = []
+        for item in protobuf_message.waveforms:
+            waveform = item_converter.to_python_value(item)
+            if shared_timing is not None:
+                waveform.timing = shared_timing
+            waveforms.append(waveform)
+        return waveforms
+
+
+class DoubleSpectrumCollectionConverter(
+    CollectionConverter[Spectrum[np.float64], waveform_pb2_nipanel.DoubleSpectrumCollection]
+):
+    """A converter for a Collection of spectrums with float64 data.
+
+    The spectrums are decoded as a list of Spectrum types, in the same order.
+    """
+
+    @property
+    def item_type(self) -> type:
+        """The Python type that this converter handles."""
+        return Spectrum
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.DoubleSpectrumCollection]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.DoubleSpectrumCollection
+
+    def to_protobuf_message(
+        self, python_value: Collection[Spectrum[np.float64]]
+    ) -> waveform_pb2_nipanel.DoubleSpectrumCollection:
+        """Convert the Python Spectrums to a DoubleSpectrumCollection."""
+        spectra = list(python_value)
+        message = self.protobuf_message()
+        has_shared_frequencies = bool(spectra) and all(
+            spectrum.start_frequency == spectra[0].start_frequency
+            and spectrum.frequency_increment == spectra[0].frequency_increment
+            for spectrum in spectra[1:]
+        )
+        if has_shared_frequencies:
+            message.frequencies.SetInParent()
+            message.frequencies.start_frequency = spectra[0].start_frequency
+            message.frequencies.frequency_increment = spectra[0].frequency_increment
+        for spectrum in spectra:
+            item = message.spectra.add(attributes=_get_attributes(spectrum.extended_properties))
+            if not has_shared_frequencies:
+                item.start_frequency = spectrum.start_frequency
+                item.frequency_increment = spectrum.frequency_increment
+            data = np.ascontiguousarray(spectrum.data, dtype="<f8")
+            _merge_packed_values(item, waveform_pb2.DoubleSpectrum.DATA_FIELD_NUMBER, data)
+        return message
+
+    def to_python_value(
+        self, protobuf_message: waveform_pb2_nipanel.DoubleSpectrumCollection
+    ) -> list[Spectrum[np.float64]]:
+        """Convert the DoubleSpectrumCollection to a list of Python Spectrums."""
+        frequencies: Any = (
+            protobuf_message.frequencies if protobuf_message.HasField("frequencies") else None
+        )
+        return [
+            Spectrum.from_array_1d(
+                np.asarray(item.data, dtype=np.float64),
+                dtype=np.float64,
+                copy=False,
+                start_frequency=(frequencies or item).start_frequency,
+                frequency_increment=(frequencies or item).frequency_increment,
+                extended_properties=_get_extended_properties(item.attributes),
+            )
+            for item in protobuf_message.spectra
+        ]
+
+
+_TIMING_FIELD_NAMES: tuple[Literal["t0", "dt", "timestamp", "time_offset", "timestamps"], ...] = (
+    "t0",
+    "dt",
+    "timestamp",
+    "time_offset",
+    "timestamps",
+)
+
+
+def _get_collection_typename(item_type: type, dtype_name: str) -> str:
+    return (
+        f"{Collection.__module__}.{Collection.__name__}"
+        f"[{item_type.__module__}.{item_type.__name__}[{dtype_name}]]"
+    )
+
+
+def _set_shared_timing(
+    message: (
+        waveform_pb2_nipanel.DoubleAnalogWaveformCollection
+        | waveform_pb2_nipanel.DoubleComplexWaveformCollection
+        | waveform_pb2_nipanel.QuantizedAnalogWaveformCollection
+    ),
+    waveforms: Sequence[AnalogWaveform[Any] | ComplexWaveform[Any]],
+) -> bool:
+    """Set the timing of the collection message if every waveform has the same timing."""
+    if not waveforms:
+        return False
+    timing = waveforms[0].timing
+    if any(waveform.timing != timing for waveform in waveforms[1:]):
+        return False
+    message.timing.CopyFrom(waveform_pb2_nipanel.WaveformTiming(**_get_timing_fields(waveforms[0])))
+    return True
+
+
+def _get_shared_timing(
+    message: (
+        waveform_pb2_nipanel.DoubleAnalogWaveformCollection
+        | waveform_pb2_nipanel.DoubleComplexWaveformCollection
+        | waveform_pb2_nipanel.QuantizedAnalogWaveformCollection
+    ),
+) -> Timing[Any, Any, Any] | None:
+    if not message.HasField("timing"):
+        return None
+    return _get_timing(message.timing)
@@ -0,0 +1,386 @@
+"""Classes to convert between nitypes waveforms and nipanel protobuf types."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Type, Union
+
+import hightime as ht
+import nitypes.bintime as bt
+import numpy as np
+from ni.protobuf.types import precision_timestamp_conversion, precision_timestamp_pb2, waveform_pb2
+from nitypes.time import convert_datetime
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    NoneScaleMode,
+    SampleIntervalMode,
+    ScaleMode,
+    Timing,
+)
+from nitypes.waveform.typing import ExtendedPropertyValue
+from typing_extensions import TypeAlias
+
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel.converters import Converter
+
+_RawAnalogWaveformMessage: TypeAlias = Union[
+    waveform_pb2_nipanel.I8AnalogWaveform,
+    waveform_pb2_nipanel.I32AnalogWaveform,
+    waveform_pb2_nipanel.QuantizedAnalogWaveform,
+]
+_WaveformMessage: TypeAlias = Union[
+    _RawAnalogWaveformMessage,
+    waveform_pb2_nipanel.PackedDigitalWaveform,
+    waveform_pb2_nipanel.WaveformTiming,
+    waveform_pb2.DoubleAnalogWaveform,
+    waveform_pb2.DoubleComplexWaveform,
+]
+
+
+class _RawAnalogWaveformConverter(Converter[AnalogWaveform[Any], _RawAnalogWaveformMessage]):
+    """A base converter for AnalogWaveform types whose samples are sent as raw bytes.
+
+    The samples are sent unscaled along with the waveform's scale mode. The decoded waveform
+    keeps the raw samples, and applies the scale to all of them at once when its scaled_data
+    is read.
+    """
+
+    _dtype: np.dtype[Any]
+    _python_dtype: np.dtype[Any] | None = None
+    """The dtype of the waveforms to encode, if it differs from the dtype of the samples."""
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return AnalogWaveform
+
+    @property
+    def python_typename(self) -> str:
+        """The Python type name that this converter handles."""
+        base_typename = super().python_typename
+        return f"{base_typename}[{(self._python_dtype or self._dtype).name}]"
+
+    def to_protobuf_message(self, python_value: AnalogWaveform[Any]) -> _RawAnalogWaveformMessage:
+        """Convert the Python AnalogWaveform to a protobuf message."""
+        return self.protobuf_message(
+            y_data=python_value.raw_data.astype(
+                self._dtype.newbyteorder("<"), copy=False
+            ).tobytes(),
+            attributes=_get_attributes(python_value.extended_properties),
+            scale=_get_scale(python_value.scale_mode),
+            **_get_timing_fields(python_value),
+        )
+
+    def to_python_value(self, protobuf_message: _RawAnalogWaveformMessage) -> AnalogWaveform[Any]:
+        """Convert the protobuf message to a Python AnalogWaveform."""
+        raw_data = np.frombuffer(protobuf_message.y_data, dtype=self._dtype.newbyteorder("<"))
+        # from_array_1d copies out of the read-only message bytes.
+        return AnalogWaveform.from_array_1d(
+            raw_data,
+            dtype=self._dtype,
+            extended_properties=_get_extended_properties(protobuf_message.attributes),
+            timing=_get_timing(protobuf_message),
+            scale_mode=_get_scale_mode(protobuf_message),
+        )
+
+
+class Int8AnalogWaveformConverter(_RawAnalogWaveformConverter):
+    """A converter for AnalogWaveform types with 8-bit integer data."""
+
+    _dtype = np.dtype(np.int8)
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.I8AnalogWaveform]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.I8AnalogWaveform
+
+
+class Int32AnalogWaveformConverter(_RawAnalogWaveformConverter):
+    """A converter for AnalogWaveform types with 32-bit integer data."""
+
+    _dtype = np.dtype(np.int32)
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.I32AnalogWaveform]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.I32AnalogWaveform
+
+
+class QuantizedAnalogWaveformConverter(_RawAnalogWaveformConverter):
+    """A converter that sends float64 AnalogWaveform types as 16-bit integer samples.
+
+    The samples are quantized with quantize_analog_waveform, so this sends a quarter of the data
+    that DoubleAnalogWaveformConverter sends, and each scaled sample is off by at most half of
+    the scale's gain. This suits waveforms that are only plotted. The decoded waveform has the
+    16-bit samples as its raw_data, and scaled_data approximates the original samples.
+
+    It is registered to decode QuantizedAnalogWaveform messages, but it is not used to encode
+    analog waveforms by default. To send a waveform this way and get its error bound, pass
+    ``quantize=True`` to ``set_value()``.
+    """
+
+    _dtype = np.dtype(np.int16)
+    _python_dtype = np.dtype(np.float64)
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.QuantizedAnalogWaveform]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.QuantizedAnalogWaveform
+
+    def to_protobuf_message(self, python_value: AnalogWaveform[Any]) -> _RawAnalogWaveformMessage:
+        """Convert the Python AnalogWaveform to a protobuf QuantizedAnalogWaveform.
+
+        Raises:
+            ValueError: If a sample is NaN or infinite.
+        """
+        message, _ = self.to_quantized_message(python_value)
+        return message
+
+    def to_quantized_message(
+        self, python_value: AnalogWaveform[Any]
+    ) -> tuple[waveform_pb2_nipanel.QuantizedAnalogWaveform, float]:
+        """Convert the Python AnalogWaveform to a protobuf QuantizedAnalogWaveform.
+
+        Returns:
+            A tuple of the message and the error bound returned by quantize_analog_waveform.
+
+        Raises:
+            ValueError: If a sample is NaN or infinite.
+        """
+        quantized_waveform, error_bound = quantize_analog_waveform(python_value)
+        message = super().to_protobuf_message(quantized_waveform)
+        assert isinstance(message, waveform_pb2_nipanel.QuantizedAnalogWaveform)
+        return message, error_bound
+
+
+def quantize_analog_waveform(
+    waveform: AnalogWaveform[Any],
+) -> tuple[AnalogWaveform[np.int16], float]:
+    """Quantize an analog waveform to 16-bit integer samples with a linear scale.
+
+    The scale maps the full range of 16-bit samples onto the range of the waveform's scaled
+    data, so the quantized waveform's scaled_data approximates the original.
+
+    Args:
+        waveform: The waveform to quantize.
+
+    Returns:
+        A tuple of the quantized waveform, with the same timing and extended properties as the
+        original, and the error bound, which is the most that a sample of its scaled_data
+        differs from the original sample.
+
+    Raises:
+        ValueError: If a sample is NaN or infinite.
+    """
+    scaled_data = waveform.scaled_data
+    minimum = float(scaled_data.min()) if scaled_data.size else 0.0
+    maximum = float(scaled_data.max()) if scaled_data.size else 0.0
+    # Map the samples onto [-32767, 32767], which is symmetric around the offset.
+    offset = (maximum + minimum) / 2
+    gain = (maximum - minimum) / (2 * np.iinfo(np.int16).max) or 1.0
+    if not np.isfinite(offset) or not np.isfinite(gain):
+        raise ValueError("Cannot quantize a waveform with NaN or infinite samples.")
+
+    raw_data = np.subtract(scaled_data, offset)
+    raw_data /= gain
+    np.rint(raw_data, out=raw_data)
+    quantized_waveform = AnalogWaveform.from_array_1d(
+        raw_data.astype(np.int16),
+        dtype=np.int16,
+        copy=False,
+        extended_properties=waveform.extended_properties,
+        timing=waveform.timing,
+        scale_mode=LinearScaleMode(gain, offset),
+    )
+    return quantized_waveform, gain / 2
+
+
+class PackedDigitalWaveformConverter(
+    Converter[DigitalWaveform[Any], waveform_pb2_nipanel.PackedDigitalWaveform]
+):
+    """A converter for digital waveform types that packs 8 lines into each byte.
+
+    This sends an eighth of the data that DigitalWaveformConverter sends, but only supports
+    line states of 0 and 1. It is registered to decode PackedDigitalWaveform messages, but it
+    is not used to encode digital waveforms unless it is registered with a higher priority::
+
+        nipanel.register_converter(PackedDigitalWaveformConverter(), priority=1)
+    """
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return DigitalWaveform
+
+    @property
+    def protobuf_message(self) -> Type[waveform_pb2_nipanel.PackedDigitalWaveform]:
+        """The type-specific protobuf message for the Python type."""
+        return waveform_pb2_nipanel.PackedDigitalWaveform
+
+    def to_protobuf_message(
+        self, python_value: DigitalWaveform[Any]
+    ) -> waveform_pb2_nipanel.PackedDigitalWaveform:
+        """Convert the Python DigitalWaveform to a protobuf PackedDigitalWaveform.
+
+        Raises:
+            ValueError: If a line state is not 0 or 1.
+        """
+        data = python_value.data
+        if data.dtype != np.bool_ and data.size and data.max() > 1:
+            raise ValueError("PackedDigitalWaveformConverter only supports line states of 0 and 1.")
+        return self.protobuf_message(
+            signal_count=python_value.signal_count,
+            y_data=_pack_lines(data).tobytes(),
+            attributes=_get_attributes(python_value.extended_properties),
+            **_get_timing_fields(python_value),
+        )
+
+    def to_python_value(
+        self, protobuf_message: waveform_pb2_nipanel.PackedDigitalWaveform
+    ) -> DigitalWaveform[np.uint8]:
+        """Convert the protobuf PackedDigitalWaveform to a Python DigitalWaveform."""
+        signal_count = protobuf_message.signal_count
+        if signal_count <= 0:
+            raise ValueError("signal_count must be greater than zero.")
+        packed_data = np.frombuffer(protobuf_message.y_data, dtype=np.uint8)
+        bytes_per_sample = (signal_count + 7) // 8
+        if len(packed_data) % bytes_per_sample:
+            raise ValueError(
+                f"Data array length ({len(packed_data)}) is not a multiple of the bytes per "
+                f"sample ({bytes_per_sample})."
+            )
+        data = _unpack_lines(packed_data, signal_count)
+        return DigitalWaveform.from_lines(
+            data,
+            dtype=np.uint8,
+            copy=False,
+            signal_count=signal_count,
+            extended_properties=_get_extended_properties(protobuf_message.attributes),
+            timing=_get_timing(protobuf_message),
+        )
+
+
+def _pack_lines(data: np.ndarray[Any, Any]) -> np.ndarray[Any, np.dtype[np.uint8]]:
+    # Packing a flat array is much faster than packing along axis 1, so pad each sample to a
+    # whole number of bytes and pack the samples together.
+    sample_count, signal_count = data.shape
+    if signal_count % 8:
+        padded_data = np.zeros((sample_count, (signal_count + 7) // 8 * 8), dtype=np.uint8)
+        padded_data[:, :signal_count] = data
+        data = padded_data
+    return np.packbits(data.reshape(-1), bitorder="little")
+
+
+def _unpack_lines(
+    packed_data: np.ndarray[Any, np.dtype[np.uint8]], signal_count: int
+) -> np.ndarray[Any, np.dtype[np.uint8]]:
+    padded_signal_count = (signal_count + 7) // 8 * 8
+    data = np.unpackbits(packed_data, bitorder="little").reshape(-1, padded_signal_count)
+    if signal_count % 8:
+        data = np.ascontiguousarray(data[:, :signal_count])
+    return data
+
+
+def _get_timing_fields(
+    waveform: AnalogWaveform[Any] | ComplexWaveform[Any] | DigitalWaveform[Any],
+) -> dict[str, Any]:
+    # These match the timing fields that ni.protobuf.types sets for its waveform messages.
+    timing = waveform.timing
+    if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        timestamps = timing.get_timestamps(0, waveform.sample_count)
+        return {"timestamps": [_to_precision_timestamp(timestamp) for timestamp in timestamps]}
+    t0 = _to_precision_timestamp(timing.start_time) if timing.has_start_time else None
+    timestamp = None
+    if timing.has_timestamp:
+        # Without a time offset, the start time is the timestamp, so it is only converted once.
+        timestamp = t0 if not timing.has_time_offset else _to_precision_timestamp(timing.timestamp)
+    return {
+        "t0": t0,
+        "dt": timing.sample_interval.total_seconds() if timing.has_sample_interval else 0.0,
+        "timestamp": timestamp,
+        "time_offset": timing.time_offset.total_seconds() if timing.has_time_offset else 0.0,
+    }
+
+
+def _get_timing(message: _WaveformMessage) -> Timing[Any, Any, Any]:
+    if message.timestamps:
+        return Timing.create_with_irregular_interval(
+            [
+                precision_timestamp_conversion.bintime_datetime_from_protobuf(timestamp)
+                for timestamp in message.timestamps
+            ]
+        )
+    # As in ni.protobuf.types, timestamp takes precedence over t0.
+    timestamp: bt.DateTime | None = None
+    if message.HasField("timestamp"):
+        timestamp = precision_timestamp_conversion.bintime_datetime_from_protobuf(message.timestamp)
+    elif message.HasField("t0"):
+        timestamp = precision_timestamp_conversion.bintime_datetime_from_protobuf(message.t0)
+    time_offset = ht.timedelta(seconds=message.time_offset)
+    if not message.dt:
+        return Timing.create_with_no_interval(timestamp=timestamp, time_offset=time_offset)
+    return Timing.create_with_regular_interval(
+        sample_interval=ht.timedelta(seconds=message.dt),
+        timestamp=timestamp,
+        time_offset=time_offset,
+    )
+
+
+def _to_precision_timestamp(value: Any) -> precision_timestamp_pb2.PrecisionTimestamp:
+    return precision_timestamp_conversion.bintime_datetime_to_protobuf(
+        convert_datetime(bt.DateTime, value)
+    )
+
+
+def _get_attributes(
+    extended_properties: Mapping[str, ExtendedPropertyValue],
+) -> dict[str, waveform_pb2.WaveformAttributeValue]:
+    attributes = {}
+    for key, value in extended_properties.items():
+        # Check bool before int, because bool is a subclass of int.
+        if isinstance(value, bool):
+            attributes[key] = waveform_pb2.WaveformAttributeValue(bool_value=value)
+        elif isinstance(value, int):
+            attributes[key] = waveform_pb2.WaveformAttributeValue(integer_value=value)
+        elif isinstance(value, float):
+            attributes[key] = waveform_pb2.WaveformAttributeValue(double_value=value)
+        elif isinstance(value, str):
+            attributes[key] = waveform_pb2.WaveformAttributeValue(string_value=value)
+        else:
+            raise TypeError(f"Unexpected type for extended property value {type(value)}")
+    return attributes
+
+
+def _get_extended_properties(
+    attributes: Mapping[str, waveform_pb2.WaveformAttributeValue],
+) -> dict[str, ExtendedPropertyValue]:
+    extended_properties = {}
+    for key, value in attributes.items():
+        attribute_type = value.WhichOneof("attribute")
+        if attribute_type is None:
+            raise ValueError("Could not determine the datatype of 'attribute'.")
+        extended_properties[key] = getattr(value, attribute_type)
+    return extended_properties
+
+
+def _get_scale(scale_mode: ScaleMode) -> waveform_pb2.Scale | None:
+    if isinstance(scale_mode, LinearScaleMode):
+        return waveform_pb2.Scale(
+            linear_scale=waveform_pb2.LinearScale(gain=scale_mode.gain, offset=scale_mode.offset)
+        )
+    elif isinstance(scale_mode, NoneScaleMode):
+        return None
+    else:
+        raise ValueError(f"The waveform scale mode {scale_mode} is not supported.")
+
+
+def _get_scale_mode(message: _RawAnalogWaveformMessage) -> ScaleMode:
+    if not message.HasField("scale"):
+        return NoneScaleMode()
+    mode = message.scale.WhichOneof("mode")
+    if mode == "linear_scale":
+        return LinearScaleMode(message.scale.linear_scale.gain, message.scale.linear_scale.offset)
+    raise ValueError(f"The waveform scale mode {mode!r} is not supported.")
@@ -0,0 +1,117 @@
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+from google.protobuf import any_pb2
+from ni.protobuf.types import array_pb2
+
+import nipanel._convert
+
+_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+@pytest.mark.parametrize("size", _SIZES)
+@pytest.mark.parametrize(
+    "dtype, protobuf_message",
+    [
+        (np.float64, array_pb2.DoubleArray),
+        (np.int64, array_pb2.SInt64Array),
+        (np.bool_, array_pb2.BoolArray),
+    ],
+)
+def test___ndarray___to_any___faster_than_collection_path(
+    size: int, dtype: type, protobuf_message: Callable[..., Any]
+) -> None:
+    array_value: np.ndarray[Any, Any] = np.arange(size).astype(dtype)
+    number = max(1, 100_000 // size)
+    # The collection path takes seconds for the largest arrays, so time those only once.
+    repeat = 3 if size < 1_000_000 else 1
+
+    def convert_as_collection() -> None:
+        # What the collection converters did before they handled numpy arrays.
+        any_pb2.Any().Pack(protobuf_message(values=array_value))
+
+    ndarray_time = _time_per_call(lambda: nipanel._convert.to_any(array_value), number, repeat)
+    collection_time = _time_per_call(convert_as_collection, number, repeat)
+
+    print(
+        f"\n{np.dtype(dtype).name}[{size}]: ndarray {ndarray_time * 1e3:.3f} ms, "
+        f"collection {collection_time * 1e3:.3f} ms ({collection_time / ndarray_time:.1f}x)"
+    )
+
+
+def _time_per_call(function: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+@pytest.mark.parametrize("size", _SIZES[:-1])
+@pytest.mark.parametrize(
+    "dtype, protobuf_message",
+    [
+        (np.float64, array_pb2.DoubleArray),
+        (np.int64, array_pb2.SInt64Array),
+        (np.bool_, array_pb2.BoolArray),
+    ],
+)
+def test___array_proto___from_any_as_numpy___faster_than_list(
+    size: int, dtype: type, protobuf_message: Callable[..., Any]
+) -> None:
+    protobuf_any = any_pb2.Any()
+    protobuf_any.Pack(protobuf_message(values=np.arange(size).astype(dtype).tolist()))
+    number = max(1, 100_000 // size)
+    repeat = 3 if size < 1_000_000 else 1
+    # Bypass the decoded value cache so that every call decodes.
+    converter = nipanel._convert._CONVERTER_REGISTRY.converter_for_protobuf_type[
+        protobuf_any.TypeName()
+    ]
+
+    numpy_time = _time_per_call(lambda: converter.to_python_numpy(protobuf_any), number, repeat)
+    list_time = _time_per_call(lambda: converter.to_python(protobuf_any), number, repeat)
+
+    print(
+        f"\n{np.dtype(dtype).name}[{size}]: numpy {numpy_time * 1e3:.3f} ms, "
+        f"list {list_time * 1e3:.3f} ms ({list_time / numpy_time:.1f}x)"
+    )
+
+
+def test___2d_ndarray___round_trip___faster_than_list_of_lists() -> None:
+    array_value = np.random.default_rng(0).random((1000, 1000))
+    list_value = array_value.tolist()
+
+    def round_trip_ndarray() -> None:
+        nipanel._convert.from_any(nipanel._convert.to_any(array_value), as_numpy=True)
+
+    def round_trip_list() -> None:
+        nipanel._convert.from_any(nipanel._convert.to_any(list_value))
+
+    # Clear the decoded value cache so that every call decodes.
+    nipanel._convert._DECODED_VALUE_CACHE.clear()
+    nipanel._convert._DECODED_NUMPY_VALUE_CACHE.clear()
+    ndarray_time = _time_per_call(round_trip_ndarray, 1, 1)
+    list_time = _time_per_call(round_trip_list, 1, 1)
+
+    print(
+        f"\nfloat64[1000, 1000] round trip: ndarray {ndarray_time * 1e3:.3f} ms, "
+        f"list of lists {list_time * 1e3:.3f} ms ({list_time / ndarray_time:.1f}x)"
+    )
+
+
+@pytest.mark.parametrize("size", _SIZES)
+def test___float32_ndarray___round_trip___copies_native_element_size(size: int) -> None:
+    array_value = np.random.default_rng(0).random(size, dtype=np.float32)
+    number = max(1, 100_000 // size)
+
+    def round_trip() -> None:
+        nipanel._convert.from_any(nipanel._convert.to_any(array_value))
+
+    nipanel._convert._DECODED_VALUE_CACHE.clear()
+    round_trip_time = _time_per_call(round_trip, number, 3)
+    copy_time = _time_per_call(array_value.copy, number, 3)
+
+    print(
+        f"\nfloat32[{size}] round trip: {round_trip_time * 1e3:.3f} ms "
+        f"({array_value.nbytes / round_trip_time / 1e9:.2f} GB/s, "
+        f"{round_trip_time / copy_time:.1f}x a single copy)"
+    )
+    assert len(nipanel._convert.to_any(array_value).value) < array_value.nbytes + 64
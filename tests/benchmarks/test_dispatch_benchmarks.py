@@ -0,0 +1,26 @@
+import timeit
+
+import pytest
+
+import nipanel._convert
+
+_ITERATIONS = 1000
+
+
+@pytest.mark.parametrize("function_name", ["_get_best_matching_type", "is_supported_type"])
+def test___large_collection___dispatch___per_call_overhead_is_constant(
+    function_name: str,
+) -> None:
+    function = getattr(nipanel._convert, function_name)
+    small_value = [1.0] * 10
+    large_value = [1.0] * 1_000_000
+    function(small_value)
+    function(large_value)
+
+    small_time = timeit.timeit(lambda: function(small_value), number=_ITERATIONS) / _ITERATIONS
+    large_time = timeit.timeit(lambda: function(large_value), number=_ITERATIONS) / _ITERATIONS
+
+    print(
+        f"\n{function_name}: {small_time * 1e6:.2f} us/call (10 elements), "
+        f"{large_time * 1e6:.2f} us/call (1M elements)"
+    )
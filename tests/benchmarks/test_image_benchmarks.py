@@ -0,0 +1,50 @@
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+import pytest
+
+from nipanel.converters.image_types import Image, ImageConverter, ImageEncoding
+from nipanel.converters.protobuf_types import Double2DArrayConverter
+
+
+def _create_frame(height: int, width: int) -> np.ndarray[Any, Any]:
+    y, x = np.mgrid[0:height, 0:width]
+    frame: np.ndarray[Any, Any] = np.stack(
+        [x * 255 // width, y * 255 // height, (x + y) % 256], axis=-1
+    )
+    frame = frame + np.random.default_rng(0).integers(-2, 3, size=frame.shape)
+    frame = np.clip(frame, 0, 255).astype(np.uint8)
+    return frame
+
+
+@pytest.mark.parametrize("encoding", [ImageEncoding.RAW, ImageEncoding.PNG, ImageEncoding.JPEG])
+def test___1080p_frame___image_converter___smaller_than_double_2d_array(
+    encoding: ImageEncoding,
+) -> None:
+    frame = Image(_create_frame(1080, 1920), encoding)
+    converter = ImageConverter()
+    # What an application had to publish before images were supported: one 2D array per
+    # channel, with 8 bytes per pixel.
+    double_2d_converter = Double2DArrayConverter()
+    channels = [frame.pixels[:, :, channel].astype(np.float64) for channel in range(3)]
+
+    image_any = converter.to_protobuf_any(frame)
+    encode_time = _time_per_call(lambda: converter.to_protobuf_any(frame))
+    decode_time = _time_per_call(lambda: converter.to_python(image_any))
+    double_2d_size = sum(
+        len(double_2d_converter.to_protobuf_any(channel.tolist()).value) for channel in channels
+    )
+
+    print(
+        f"\n1080p {encoding.name}: {len(image_any.value) / 1e3:.0f} KB, encode "
+        f"{encode_time * 1e3:.1f} ms, decode {decode_time * 1e3:.1f} ms "
+        f"(Double2DArray {double_2d_size / 1e6:.1f} MB)"
+    )
+    assert len(image_any.value) * 7 < double_2d_size
+    if encoding == ImageEncoding.JPEG:
+        assert len(image_any.value) < 500_000
+
+
+def _time_per_call(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=3))
@@ -0,0 +1,79 @@
+import timeit
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+from google.protobuf import any_pb2
+
+import nipanel._convert
+
+
+def _create_data_frame(row_count: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "voltage": rng.random(row_count),
+            "current": rng.random(row_count),
+            "site": rng.integers(0, 4, row_count),
+            "passed": rng.random(row_count) > 0.1,
+        },
+        index=pd.Index(np.arange(row_count), name="serial"),
+    )
+
+
+@pytest.mark.parametrize("row_count", [10_000, 100_000, 1_000_000])
+def test___data_frame___to_any___faster_than_column_lists(row_count: int) -> None:
+    data_frame = _create_data_frame(row_count)
+    number = max(1, 100_000 // row_count)
+
+    def convert_column_lists() -> None:
+        # What an application had to publish before DataFrames were supported.
+        nipanel._convert.to_any(list(data_frame.index))
+        for column_name in data_frame.columns:
+            nipanel._convert.to_any(data_frame[column_name].tolist())
+
+    data_frame_time = _time_per_call(lambda: nipanel._convert.to_any(data_frame), number)
+    column_lists_time = _time_per_call(convert_column_lists, number)
+
+    print(
+        f"\nDataFrame[{row_count}] to_any: {data_frame_time * 1e3:.3f} ms, "
+        f"column lists {column_lists_time * 1e3:.3f} ms "
+        f"({column_lists_time / data_frame_time:.1f}x)"
+    )
+
+
+@pytest.mark.parametrize("row_count", [10_000, 100_000, 1_000_000])
+def test___data_frame___from_any___faster_than_column_lists(row_count: int) -> None:
+    data_frame = _create_data_frame(row_count)
+    protobuf_any = nipanel._convert.to_any(data_frame)
+    column_anys = [nipanel._convert.to_any(list(data_frame.index))] + [
+        nipanel._convert.to_any(data_frame[column_name].tolist())
+        for column_name in data_frame.columns
+    ]
+    number = max(1, 100_000 // row_count)
+
+    def convert_column_lists() -> None:
+        index, *columns = [_decode(column_any) for column_any in column_anys]
+        pd.DataFrame(dict(zip(data_frame.columns, columns)), index=index)
+
+    data_frame_time = _time_per_call(lambda: _decode(protobuf_any), number)
+    column_lists_time = _time_per_call(convert_column_lists, number)
+
+    print(
+        f"\nDataFrame[{row_count}] from_any: {data_frame_time * 1e3:.3f} ms, "
+        f"column lists {column_lists_time * 1e3:.3f} ms "
+        f"({column_lists_time / data_frame_time:.1f}x)"
+    )
+
+
+def _decode(protobuf_any: any_pb2.Any) -> object:
+    # Bypass the decoded value cache so that every call decodes.
+    converter = nipanel._convert._CONVERTER_REGISTRY.converter_for_protobuf_type[
+        protobuf_any.TypeName()
+    ]
+    return converter.to_python(protobuf_any)
+
+
+def _time_per_call(function: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
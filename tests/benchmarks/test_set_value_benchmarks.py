@@ -0,0 +1,56 @@
+import timeit
+import tracemalloc
+from typing import Callable
+
+import pytest
+from ni.panels.v1.panel_service_pb2 import SetValueRequest
+
+import nipanel._convert
+from nipanel._value_encoder import _ValueEncoder
+
+_ITERATIONS = 1000
+
+
+@pytest.mark.parametrize("value", [1.5, 42, "status", True])
+def test___scalar___value_encoder___fewer_allocations_and_faster_than_new_request(
+    value: object,
+) -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+
+    def encode_new_request() -> None:
+        request = SetValueRequest(
+            panel_id="panel_id", value_id="value_id", value=nipanel._convert.to_any(value)
+        )
+        request.SerializeToString()
+
+    def encode_reused_request() -> None:
+        encoder.encode_and_send(value, False, SetValueRequest.SerializeToString)
+
+    encode_new_request()
+    encode_reused_request()
+    new_bytes = _peak_traced_bytes(encode_new_request)
+    reused_bytes = _peak_traced_bytes(encode_reused_request)
+    new_time = min(timeit.repeat(encode_new_request, number=_ITERATIONS, repeat=3)) / _ITERATIONS
+    reused_time = (
+        min(timeit.repeat(encode_reused_request, number=_ITERATIONS, repeat=3)) / _ITERATIONS
+    )
+
+    print(
+        f"\n{type(value).__name__}: new request {new_time * 1e6:.2f} us/call "
+        f"{new_bytes} peak bytes, reused request {reused_time * 1e6:.2f} us/call "
+        f"{reused_bytes} peak bytes"
+    )
+    assert reused_bytes < new_bytes
+
+
+def _peak_traced_bytes(function: Callable[[], None]) -> int:
+    """Get the peak memory that Python allocates while calling the function repeatedly."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(_ITERATIONS):
+            function()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,40 @@
+import datetime as dt
+import timeit
+from typing import Callable
+
+import hightime as ht
+import pytest
+
+from nipanel.converters.protobuf_types import HTDateTimeConverter
+from nipanel.converters.timestamp_types import TimestampCollectionConverter
+
+
+@pytest.mark.parametrize("size", [100, 1_000])
+def test___timestamps___timestamp_collection_converter___faster_than_each_timestamp(
+    size: int,
+) -> None:
+    t0 = ht.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    timestamps = [t0 + ht.timedelta(microseconds=index * 100) for index in range(size)]
+    converter = TimestampCollectionConverter()
+    # What an application had to do before collections of timestamps were supported.
+    timestamp_converter = HTDateTimeConverter()
+
+    def convert_each_timestamp() -> None:
+        messages = [timestamp_converter.to_protobuf_any(value) for value in timestamps]
+        _ = [timestamp_converter.to_python(message) for message in messages]
+
+    def convert_collection() -> None:
+        _ = converter.to_python(converter.to_protobuf_any(timestamps))
+
+    collection_time = _time_per_call(convert_collection)
+    each_timestamp_time = _time_per_call(convert_each_timestamp)
+
+    print(
+        f"\ntimestamps[{size}]: collection {collection_time * 1e3:.1f} ms, "
+        f"each timestamp {each_timestamp_time * 1e3:.1f} ms "
+        f"({each_timestamp_time / collection_time:.0f}x)"
+    )
+
+
+def _time_per_call(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=3))
@@ -0,0 +1,215 @@
+import datetime as dt
+import multiprocessing
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+import hightime as ht
+import numpy as np
+import pytest
+from ni.protobuf.types import waveform_conversion
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, Timing
+
+import nipanel._convert
+from nipanel import LazyValue
+from nipanel.converters.protobuf_types import (
+    DigitalWaveformConverter,
+    DoubleAnalogWaveformConverter,
+)
+from nipanel.converters.waveform_collection_types import DoubleAnalogWaveformCollectionConverter
+from nipanel.converters.waveform_types import (
+    PackedDigitalWaveformConverter,
+    QuantizedAnalogWaveformConverter,
+    quantize_analog_waveform,
+)
+
+
+@pytest.mark.parametrize("sample_count", [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize("signal_count", [8, 32])
+def test___digital_waveform___packed_to_any___smaller_and_faster_than_unpacked(
+    sample_count: int, signal_count: int
+) -> None:
+    data: np.ndarray[Any, Any] = (
+        np.random.default_rng(0).integers(0, 2, size=(sample_count, signal_count)).astype(np.uint8)
+    )
+    digital_waveform = DigitalWaveform.from_lines(data, signal_count=signal_count)
+    packed_converter = PackedDigitalWaveformConverter()
+    unpacked_converter = DigitalWaveformConverter()
+    number = max(1, 1_000_000 // data.size)
+
+    packed_time = _time_per_call(lambda: packed_converter.to_protobuf_any(digital_waveform), number)
+    unpacked_time = _time_per_call(
+        lambda: unpacked_converter.to_protobuf_any(digital_waveform), number
+    )
+    packed_size = len(packed_converter.to_protobuf_any(digital_waveform).value)
+    unpacked_size = len(unpacked_converter.to_protobuf_any(digital_waveform).value)
+
+    print(
+        f"\n{sample_count} samples x {signal_count} lines: packed {packed_time * 1e3:.3f} ms "
+        f"{packed_size} bytes, unpacked {unpacked_time * 1e3:.3f} ms {unpacked_size} bytes"
+    )
+    assert packed_size * 7 < unpacked_size
+
+
+def _time_per_call(function: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+@pytest.mark.parametrize("sample_count", [10_000, 100_000, 1_000_000])
+def test___analog_waveform___lazy_metadata___faster_than_decode(sample_count: int) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.random.default_rng(0).random(sample_count))
+    protobuf_any = nipanel._convert.to_any(analog_waveform)
+    number = max(1, 1_000_000 // sample_count)
+
+    def read_metadata() -> None:
+        lazy_value = nipanel._convert.from_any(protobuf_any, lazy=True)
+        assert isinstance(lazy_value, LazyValue)
+        lazy_value.sample_count
+        lazy_value.t0
+
+    def decode() -> None:
+        nipanel._convert._DECODED_VALUE_CACHE.clear()
+        nipanel._convert.from_any(protobuf_any)
+
+    metadata_time = _time_per_call(read_metadata, number)
+    decode_time = _time_per_call(decode, number)
+
+    print(
+        f"\nfloat64 waveform[{sample_count}]: lazy metadata {metadata_time * 1e3:.3f} ms, "
+        f"decode {decode_time * 1e3:.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("sample_count", [10_000, 100_000, 1_000_000])
+def test___analog_waveform___from_any_again___not_slower_than_decode(sample_count: int) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.random.default_rng(0).random(sample_count))
+    protobuf_any = nipanel._convert.to_any(analog_waveform)
+    converter = DoubleAnalogWaveformConverter()
+    number = max(1, 1_000_000 // sample_count)
+    nipanel._convert._DECODED_VALUE_CACHE.clear()
+    nipanel._convert.from_any(protobuf_any)
+
+    from_any_time = _time_per_call(lambda: nipanel._convert.from_any(protobuf_any), number)
+    decode_time = _time_per_call(lambda: converter.to_python(protobuf_any), number)
+
+    print(
+        f"\nfloat64 waveform[{sample_count}]: from_any again {from_any_time * 1e3:.3f} ms, "
+        f"decode {decode_time * 1e3:.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("sample_count", [1_000, 10_000, 100_000])
+def test___float64_analog_waveform___to_protobuf_message___faster_than_per_sample_conversion(
+    sample_count: int,
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.random.default_rng(0).random(sample_count))
+    converter = DoubleAnalogWaveformConverter()
+    number = max(1, 100_000 // sample_count)
+
+    bulk_time = _time_per_call(lambda: converter.to_protobuf_message(analog_waveform), number)
+    per_sample_time = _time_per_call(
+        lambda: waveform_conversion.float64_analog_waveform_to_protobuf(analog_waveform), number
+    )
+
+    print(
+        f"\nfloat64 waveform[{sample_count}]: bulk {bulk_time * 1e3:.3f} ms, "
+        f"per sample {per_sample_time * 1e3:.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("sample_count", [1_000, 10_000, 100_000])
+def test___32_channel_waveforms___encode_many___same_as_to_any(sample_count: int) -> None:
+    rng = np.random.default_rng(0)
+    waveforms = [AnalogWaveform.from_array_1d(rng.random(sample_count)) for _ in range(32)]
+    worker_count = min(4, os.cpu_count() or 1)
+    expected = [nipanel._convert.to_any(waveform) for waveform in waveforms]
+
+    calling_thread_time = _time_per_call(lambda: nipanel._convert.encode_many(waveforms), 1)
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        assert nipanel._convert.encode_many(waveforms, executor=executor) == expected
+        thread_pool_time = _time_per_call(
+            lambda: nipanel._convert.encode_many(waveforms, executor=executor), 1
+        )
+    process_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=worker_count, mp_context=process_context) as executor:
+        assert nipanel._convert.encode_many(waveforms, executor=executor) == expected
+        process_pool_time = _time_per_call(
+            lambda: nipanel._convert.encode_many(waveforms, executor=executor), 1
+        )
+
+    print(
+        f"\n32 x float64 waveform[{sample_count}], {worker_count} workers: "
+        f"calling thread {calling_thread_time * 1e3:.3f} ms, "
+        f"thread pool {thread_pool_time * 1e3:.3f} ms, "
+        f"process pool {process_pool_time * 1e3:.3f} ms"
+    )
+
+
+@pytest.mark.parametrize("sample_count", [10_000, 100_000, 1_000_000])
+def test___float64_analog_waveform___quantized_to_any___quarter_of_float64_size(
+    sample_count: int,
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.sin(np.linspace(0.0, 100.0, sample_count)) * 10.0
+    )
+    quantized_converter = QuantizedAnalogWaveformConverter()
+    float64_converter = DoubleAnalogWaveformConverter()
+    number = max(1, 1_000_000 // sample_count)
+
+    quantized_time = _time_per_call(
+        lambda: quantized_converter.to_protobuf_any(analog_waveform), number
+    )
+    float64_time = _time_per_call(
+        lambda: float64_converter.to_protobuf_any(analog_waveform), number
+    )
+    quantized_size = len(quantized_converter.to_protobuf_any(analog_waveform).value)
+    float64_size = len(float64_converter.to_protobuf_any(analog_waveform).value)
+    _, error_bound = quantize_analog_waveform(analog_waveform)
+
+    print(
+        f"\nfloat64 waveform[{sample_count}]: quantized {quantized_time * 1e3:.3f} ms "
+        f"{quantized_size} bytes (error bound {error_bound:.2e}), "
+        f"float64 {float64_time * 1e3:.3f} ms {float64_size} bytes"
+    )
+    assert quantized_size * 4 < float64_size + 256
+
+
+@pytest.mark.parametrize("sample_count", [10, 100, 1_000])
+def test___32_channel_waveforms___collection_to_any___smaller_than_each_waveform(
+    sample_count: int,
+) -> None:
+    timing = Timing.create_with_regular_interval(
+        ht.timedelta(milliseconds=1), ht.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+    )
+    rng = np.random.default_rng(0)
+    waveforms = [
+        AnalogWaveform.from_array_1d(
+            rng.random(sample_count),
+            timing=timing,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{channel}"},
+        )
+        for channel in range(32)
+    ]
+    collection_converter = DoubleAnalogWaveformCollectionConverter()
+    waveform_converter = DoubleAnalogWaveformConverter()
+    number = 10
+
+    collection_time = _time_per_call(
+        lambda: collection_converter.to_protobuf_any(waveforms), number
+    )
+    each_waveform_time = _time_per_call(
+        lambda: [waveform_converter.to_protobuf_any(waveform) for waveform in waveforms], number
+    )
+    collection_size = len(collection_converter.to_protobuf_any(waveforms).value)
+    each_waveform_size = sum(
+        len(waveform_converter.to_protobuf_any(waveform).value) for waveform in waveforms
+    )
+
+    print(
+        f"\n32 x float64 waveform[{sample_count}]: collection {collection_time * 1e3:.3f} ms "
+        f"{collection_size} bytes, each waveform {each_waveform_time * 1e3:.3f} ms "
+        f"{each_waveform_size} bytes"
+    )
+    # The shared timing is converted and sent once instead of once per channel.
+    assert collection_size < each_waveform_size
@@ -0,0 +1,181 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from google.protobuf import any_pb2
+
+from nipanel._array_delta import _KEYFRAME_INTERVAL, _apply_delta, _ArrayDeltaEncoder
+from nipanel._protos import array_pb2
+
+
+class _Decoder:
+    """Decodes the keyframes and deltas from an _ArrayDeltaEncoder, like a panel reader."""
+
+    def __init__(self) -> None:
+        self.keyframe = array_pb2.ArrayKeyframe()
+
+    def decode(self, keyframe_any: any_pb2.Any | None, delta_any: any_pb2.Any) -> Any:
+        if keyframe_any is not None:
+            keyframe_any.Unpack(self.keyframe)
+        return _apply_delta(self.keyframe, delta_any)
+
+
+def _unpack_delta(delta_any: any_pb2.Any) -> array_pb2.ArrayDelta:
+    delta = array_pb2.ArrayDelta()
+    delta_any.Unpack(delta)
+    return delta
+
+
+def _change_every_100th_element(array: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    changed = array.copy()
+    changed.reshape(-1)[::100] += 1
+    return changed
+
+
+@pytest.mark.parametrize(
+    "first_array",
+    [
+        np.linspace(0.0, 1.0, 10_000),
+        np.linspace(0.0, 1.0, 10_000).reshape(100, 100),
+        np.arange(10_000, dtype=np.int16),
+        np.arange(10_000, dtype=">f8"),
+        np.linspace(0.0, 1.0, 10_000) * (1 + 2j),
+        np.arange(10_000).astype("datetime64[ns]"),
+    ],
+)
+def test___arrays_with_few_changes___encode_and_apply___equal_arrays(
+    first_array: np.ndarray[Any, Any],
+) -> None:
+    encoder = _ArrayDeltaEncoder()
+    decoder = _Decoder()
+    arrays = [first_array]
+    for _ in range(3):
+        arrays.append(_change_every_100th_element(arrays[-1]))
+
+    results = [decoder.decode(*encoder.encode(array)) for array in arrays]
+
+    for result, array in zip(results, arrays):
+        assert result.shape == array.shape
+        assert np.array_equal(result, array)
+
+
+def test___few_elements_changed___encode___sparse_delta() -> None:
+    encoder = _ArrayDeltaEncoder()
+    array = np.linspace(0.0, 1.0, 10_000)
+    encoder.encode(array)
+
+    keyframe_any, delta_any = encoder.encode(_change_every_100th_element(array))
+
+    delta = _unpack_delta(delta_any)
+    assert keyframe_any is None
+    assert np.frombuffer(delta.changed_indices, dtype="<u4").tolist() == list(range(0, 10_000, 100))
+    assert not delta.compressed_xor
+    assert len(delta_any.value) < array.nbytes // 50
+
+
+def test___every_element_changed_slightly___encode___compressed_xor_delta() -> None:
+    encoder = _ArrayDeltaEncoder()
+    array = np.linspace(1.0, 2.0, 10_000)
+    decoder = _Decoder()
+    decoder.decode(*encoder.encode(array))
+    changed_array = array * (1 + 1e-12)
+
+    keyframe_any, delta_any = encoder.encode(changed_array)
+    result = decoder.decode(keyframe_any, delta_any)
+
+    delta = _unpack_delta(delta_any)
+    assert keyframe_any is None
+    assert delta.compressed_xor
+    assert not delta.changed_indices
+    assert len(delta_any.value) < array.nbytes // 2
+    assert np.array_equal(result, changed_array)
+
+
+def test___unchanged_array___encode___empty_delta() -> None:
+    encoder = _ArrayDeltaEncoder()
+    array = np.linspace(0.0, 1.0, 10_000)
+    encoder.encode(array)
+
+    keyframe_any, delta_any = encoder.encode(array.copy())
+
+    assert keyframe_any is None
+    assert _unpack_delta(delta_any) == array_pb2.ArrayDelta(
+        keyframe_generation=_unpack_delta(delta_any).keyframe_generation
+    )
+
+
+@pytest.mark.parametrize(
+    "next_array",
+    [
+        np.zeros(200),
+        np.zeros(100, dtype=np.float32),
+        np.random.default_rng(0).normal(size=100),
+    ],
+)
+def test___shape_dtype_or_most_elements_changed___encode___new_keyframe(
+    next_array: np.ndarray[Any, Any],
+) -> None:
+    encoder = _ArrayDeltaEncoder()
+    decoder = _Decoder()
+    first_keyframe_any, first_delta_any = encoder.encode(np.ones(100))
+    decoder.decode(first_keyframe_any, first_delta_any)
+
+    keyframe_any, delta_any = encoder.encode(next_array)
+    result = decoder.decode(keyframe_any, delta_any)
+
+    assert keyframe_any is not None
+    assert (
+        _unpack_delta(delta_any).keyframe_generation
+        != _unpack_delta(first_delta_any).keyframe_generation
+    )
+    assert result.dtype == next_array.dtype
+    assert np.array_equal(result, next_array)
+
+
+def test___keyframe_interval_deltas___encode___new_keyframe() -> None:
+    encoder = _ArrayDeltaEncoder()
+    array = np.linspace(0.0, 1.0, 10_000)
+    encoder.encode(array)
+    keyframe_anys = [encoder.encode(array)[0] for _ in range(_KEYFRAME_INTERVAL)]
+
+    keyframe_any, _ = encoder.encode(array)
+
+    assert all(keyframe_any is None for keyframe_any in keyframe_anys)
+    assert keyframe_any is not None
+
+
+def test___array_updated_in_place___encode___delta_relative_to_original_array() -> None:
+    encoder = _ArrayDeltaEncoder()
+    decoder = _Decoder()
+    array = np.linspace(0.0, 1.0, 10_000)
+    decoder.decode(*encoder.encode(array))
+
+    array[::100] += 1
+    result = decoder.decode(*encoder.encode(array))
+
+    assert np.array_equal(result, array)
+
+
+@pytest.mark.parametrize("value", [[1.0, 2.0], np.array(["a", "b"])])
+def test___unsupported_value___encode___throws_type_error(value: object) -> None:
+    encoder = _ArrayDeltaEncoder()
+
+    with pytest.raises(TypeError):
+        encoder.encode(value)
+
+
+def test___mismatched_indices_and_values___apply_delta___throws_value_error() -> None:
+    keyframe_any, _ = _ArrayDeltaEncoder().encode(np.zeros(10))
+    assert keyframe_any is not None
+    keyframe = array_pb2.ArrayKeyframe()
+    keyframe_any.Unpack(keyframe)
+    delta_any = any_pb2.Any()
+    delta_any.Pack(
+        array_pb2.ArrayDelta(
+            changed_indices=np.array([1, 2], dtype="<u4").tobytes(),
+            changed_values=np.array([1.0], dtype="<f8").tobytes(),
+        )
+    )
+
+    with pytest.raises(ValueError):
+        _apply_delta(keyframe, delta_any)
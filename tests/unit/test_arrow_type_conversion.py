@@ -0,0 +1,142 @@
+import subprocess
+import sys
+
+import grpc
+import numpy as np
+import pyarrow as pa
+import pytest
+
+import nipanel._convert
+from nipanel import PanelValueAccessor
+from nipanel._protos import arrow_pb2
+from nipanel.converters.arrow_types import ArrowRecordBatchConverter, ArrowTableConverter
+
+
+def _create_table(row_count: int) -> pa.Table:
+    return pa.table(
+        {
+            "dut": [f"DUT{i}" for i in range(row_count)],
+            "voltage": np.linspace(0.0, 1.0, row_count),
+            "passed": [i % 3 != 0 for i in range(row_count)],
+            "site": pa.array([i % 4 if i % 5 else None for i in range(row_count)], pa.int32()),
+        }
+    )
+
+
+@pytest.mark.parametrize("row_count", [0, 1, 1000])
+def test___table___to_any_and_from_any___equal_table(row_count: int) -> None:
+    table = _create_table(row_count)
+
+    protobuf_any = nipanel._convert.to_any(table)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(arrow_pb2.ArrowTable.DESCRIPTOR)
+    assert isinstance(result, pa.Table)
+    assert result.equals(table, check_metadata=True)
+
+
+def test___chunked_table_with_metadata___to_any_and_from_any___equal_table() -> None:
+    table = pa.concat_tables([_create_table(10), _create_table(20)]).replace_schema_metadata(
+        {"station": "A"}
+    )
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(table))
+
+    assert isinstance(result, pa.Table)
+    assert result.equals(table, check_metadata=True)
+    assert result.schema.metadata == {b"station": b"A"}
+
+
+def test___record_batch___to_any_and_from_any___equal_record_batch() -> None:
+    record_batch = _create_table(100).to_batches()[0]
+
+    protobuf_any = nipanel._convert.to_any(record_batch)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(arrow_pb2.ArrowRecordBatch.DESCRIPTOR)
+    assert isinstance(result, pa.RecordBatch)
+    assert result.equals(record_batch)
+
+
+@pytest.mark.parametrize("converter", [ArrowTableConverter(), ArrowRecordBatchConverter()])
+def test___arrow_value___to_protobuf_message_and_to_python_value___round_trips(
+    converter: ArrowTableConverter | ArrowRecordBatchConverter,
+) -> None:
+    table = _create_table(10)
+    value = table if isinstance(converter, ArrowTableConverter) else table.to_batches()[0]
+
+    message = converter.to_protobuf_message(value)
+    result = converter.to_python_value(message)
+
+    assert converter.to_protobuf_any(value).value == message.SerializeToString()
+    assert result.equals(value)
+
+
+def test___large_table___from_any___does_not_copy_columns() -> None:
+    table = pa.table({"values": np.arange(1_000_000, dtype=np.float64)})
+    protobuf_any = nipanel._convert.to_any(table)
+    allocated_bytes = pa.total_allocated_bytes()
+
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert isinstance(result, pa.Table)
+    assert pa.total_allocated_bytes() - allocated_bytes < 1024
+    assert result.equals(table)
+
+
+def test___table___to_any___one_message_close_to_data_size() -> None:
+    table = pa.table({"values": np.arange(100_000, dtype=np.float64)})
+
+    protobuf_any = nipanel._convert.to_any(table)
+
+    assert table.nbytes < len(protobuf_any.value) < table.nbytes + 1024
+
+
+def test___wrong_type___to_python___raises_value_error() -> None:
+    protobuf_any = nipanel._convert.to_any(_create_table(1))
+
+    with pytest.raises(ValueError) as exc:
+        ArrowRecordBatchConverter().to_python(protobuf_any)
+
+    assert "ArrowTable" in exc.value.args[0]
+
+
+def test___arrow_types___is_supported_type___returns_true() -> None:
+    table = _create_table(1)
+
+    assert nipanel._convert.is_supported_type(table)
+    assert nipanel._convert.is_supported_type(table.to_batches()[0])
+
+
+def test___import_nipanel___does_not_import_pyarrow() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, nipanel; print('pyarrow' in sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test___table___set_value_and_get_value___equal_table(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    table = _create_table(100)
+
+    accessor.set_value("results", table)
+    result = accessor.get_value("results")
+
+    assert isinstance(result, pa.Table)
+    assert result.equals(table)
+
+
+def test___large_table___from_any_twice___returns_cached_table() -> None:
+    table = pa.table({"values": np.arange(100_000, dtype=np.float64)})
+    protobuf_any = nipanel._convert.to_any(table)
+
+    first_result = nipanel._convert.from_any(protobuf_any)
+    second_result = nipanel._convert.from_any(protobuf_any)
+
+    assert second_result is first_result
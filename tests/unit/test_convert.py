@@ -1,5 +1,11 @@
+import ctypes
+import dataclasses
 import datetime as dt
-from typing import Any, Collection, Union
+import logging
+import mmap
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Collection, NamedTuple, Union
 
 import hightime as ht
 import nitypes.bintime as bt
@@ -21,10 +27,12 @@ from nitypes.scalar import Scalar
 from nitypes.time import convert_datetime, convert_timedelta
 from nitypes.vector import Vector
 from nitypes.waveform import AnalogWaveform, ComplexWaveform, DigitalWaveform, Spectrum
+from pytest_mock import MockerFixture
 from typing_extensions import TypeAlias
 
 import nipanel._convert
 import tests.types
+from nipanel._protos import array_pb2 as array_pb2_nipanel, composite_pb2
 
 _AnyWrappersPb2: TypeAlias = Union[
     wrappers_pb2.BoolValue,
@@ -53,6 +61,8 @@ _BT_EPSILON = ht.timedelta(yoctoseconds=54210)
     [
         (False, "builtins.bool"),
         (b"mystr", "builtins.bytes"),
+        (bytearray(b"mystr"), "builtins.bytes"),
+        (memoryview(b"mystr"), "builtins.bytes"),
         (456.2, "builtins.float"),
         (123, "builtins.int"),
         ("mystr", "builtins.str"),
@@ -72,6 +82,8 @@ _BT_EPSILON = ht.timedelta(yoctoseconds=54210)
         ([456.2, 1.0], "collections.abc.Collection[builtins.float]"),
         ([123, 456], "collections.abc.Collection[builtins.int]"),
         (["mystr", "mystr"], "collections.abc.Collection[builtins.str]"),
+        ([dt.datetime.now()], "collections.abc.Collection[datetime.datetime]"),
+        ([ht.datetime.now()], "collections.abc.Collection[datetime.datetime]"),
         ((False, False), "collections.abc.Collection[builtins.bool]"),
         ((b"mystr", b"mystr"), "collections.abc.Collection[builtins.bytes]"),
         ((456.2, 1.0), "collections.abc.Collection[builtins.float]"),
@@ -149,6 +161,15 @@ _BT_EPSILON = ht.timedelta(yoctoseconds=54210)
         ),
         (DigitalWaveform(10, 2, np.bool, False), "nitypes.waveform.DigitalWaveform"),
         (Spectrum(10, np.float64), "nitypes.waveform.Spectrum"),
+        (
+            [AnalogWaveform(0, np.float64)],
+            "collections.abc.Collection[nitypes.waveform.AnalogWaveform[float64]]",
+        ),
+        (
+            [ComplexWaveform(0, np.complex128)],
+            "collections.abc.Collection[nitypes.waveform.ComplexWaveform[complex128]]",
+        ),
+        ([Spectrum(10, np.float64)], "collections.abc.Collection[nitypes.waveform.Spectrum]"),
         (Scalar("one"), "nitypes.scalar.Scalar"),
         (Vector([1, 2, 3]), "nitypes.vector.Vector"),
     ],
@@ -160,6 +181,149 @@ def test___various_python_objects___get_best_matching_type___returns_correct_typ
     assert type_string == expected_type_string
 
 
+@pytest.mark.parametrize(
+    "python_object, expected_type_string",
+    [
+        (np.array([1.0, 2.0]), "collections.abc.Collection[builtins.float]"),
+        (np.array([1.0, 2.0], ">f8"), "collections.abc.Collection[builtins.float]"),
+        (np.array([1, 2], np.int64), "collections.abc.Collection[builtins.int]"),
+        (np.array([True, False]), "collections.abc.Collection[builtins.bool]"),
+        (np.array([], np.float64), "collections.abc.Collection[builtins.float]"),
+        (
+            np.array([[1.0, 2.0], [3.0, 4.0]]),
+            "collections.abc.Collection[collections.abc.Collection[builtins.float]]",
+        ),
+        (np.array(["a", "b"]), "collections.abc.Collection[builtins.str]"),
+        (np.array([1.0, 2.0], np.float32), "numpy.ndarray"),
+        (np.array([1, 2], np.int32), "numpy.ndarray"),
+        (np.array([1, 2], np.uint64), "numpy.ndarray"),
+        (np.array([1 + 2j]), "numpy.ndarray"),
+        (np.array([[1, 2], [3, 4]]), "numpy.ndarray"),
+        (np.zeros((2, 3, 4)), "numpy.ndarray"),
+        (np.array(1.0), "numpy.ndarray"),
+    ],
+)
+def test___ndarray___get_best_matching_type___dispatches_on_dtype(
+    python_object: object, expected_type_string: str
+) -> None:
+    type_string = nipanel._convert._get_best_matching_type(python_object)
+    assert type_string == expected_type_string
+
+
+def test___same_type___get_best_matching_type_twice___resolves_once(
+    mocker: MockerFixture,
+) -> None:
+    nipanel._convert._CONVERTER_REGISTRY.converter_for_dispatch_key.clear()
+    resolve_spy = mocker.spy(nipanel._convert, "_resolve_converter")
+
+    nipanel._convert._get_best_matching_type([1.0, 2.0])
+    type_string = nipanel._convert._get_best_matching_type([3.0, 4.0, 5.0])
+
+    assert resolve_spy.call_count == 1
+    assert type_string == "collections.abc.Collection[builtins.float]"
+
+
+def test___unsupported_type___get_best_matching_type_twice___raises_type_error() -> None:
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Unsupported type"):
+            nipanel._convert._get_best_matching_type([{"key": "value"}])
+
+
+@pytest.mark.parametrize(
+    "python_object, expected_result",
+    [
+        (1.0, True),
+        ([1, 2, 3], True),
+        ([[1.0, 2.0], [3.0, 4.0]], True),
+        (None, False),
+        ({"key": "value"}, True),
+        ({"key": object()}, False),
+        ({1: "value"}, False),
+        ([object()], False),
+        ([[[1.0]]], False),
+        (np.array(1.0), True),
+        (np.array([1, 2], np.uint64), True),
+        (np.array([object()]), False),
+    ],
+)
+def test___various_python_objects___is_supported_type___returns_expected_result(
+    python_object: object, expected_result: bool
+) -> None:
+    assert nipanel._convert.is_supported_type(python_object) == expected_result
+
+
+def test___debug_logging_disabled___to_any___does_not_format_value(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger=nipanel._convert.__name__)
+    python_value = _ReprCountingList([1.0, 2.0])
+
+    nipanel._convert.to_any(python_value)
+
+    assert python_value.repr_count == 0
+
+
+def test___debug_logging_enabled___to_any___logs_value(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.DEBUG, logger=nipanel._convert.__name__)
+    python_value = _ReprCountingList([1.0, 2.0])
+
+    nipanel._convert.to_any(python_value)
+
+    assert python_value.repr_count > 0
+    assert "resolved to collections.abc.Collection[builtins.float]" in caplog.text
+
+
+_ENCODE_MANY_VALUES: list[object] = [
+    1.5,
+    "text",
+    [1, 2, 3],
+    np.arange(6, dtype=np.int16).reshape(2, 3),
+    AnalogWaveform.from_array_1d(np.arange(100.0)),
+]
+
+
+def test___values___encode_many___same_as_to_any() -> None:
+    result = nipanel._convert.encode_many(iter(_ENCODE_MANY_VALUES))
+
+    assert result == [nipanel._convert.to_any(value) for value in _ENCODE_MANY_VALUES]
+
+
+def test___values___encode_many_with_thread_pool___same_as_to_any() -> None:
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        result = nipanel._convert.encode_many(_ENCODE_MANY_VALUES, executor=executor)
+
+    assert result == [nipanel._convert.to_any(value) for value in _ENCODE_MANY_VALUES]
+
+
+def test___gil_disabled___encode_many___uses_shared_thread_pool(mocker: MockerFixture) -> None:
+    mocker.patch.object(sys, "_is_gil_enabled", lambda: False, create=True)
+    mocker.patch.object(nipanel._convert, "_ENCODE_EXECUTOR", None)
+
+    result = nipanel._convert.encode_many(_ENCODE_MANY_VALUES)
+
+    executor = nipanel._convert._ENCODE_EXECUTOR
+    assert isinstance(executor, ThreadPoolExecutor)
+    executor.shutdown()
+    assert result == [nipanel._convert.to_any(value) for value in _ENCODE_MANY_VALUES]
+
+
+def test___unsupported_value___encode_many___raises_type_error() -> None:
+    with pytest.raises(TypeError):
+        nipanel._convert.encode_many([1.0, object()])
+
+
+class _ReprCountingList(list[float]):
+    def __init__(self, values: list[float]) -> None:
+        super().__init__(values)
+        self.repr_count = 0
+
+    def __repr__(self) -> str:
+        self.repr_count += 1
+        return super().__repr__()
+
+
 # ========================================================
 # Built-in Types: Python to Protobuf
 # ========================================================
@@ -184,6 +348,90 @@ def test___python_builtin_scalar___to_any___valid_wrapperpb2_value(
     assert unpack_dest.value == expected_value
 
 
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        bytearray(b"mystr"),
+        memoryview(b"mystr"),
+        memoryview(bytearray(b"xmystrx"))[1:-1],
+        (ctypes.c_ubyte * 5).from_buffer_copy(b"mystr"),
+        bytearray(),
+    ],
+)
+def test___buffer___to_any___valid_bytes_value(python_value: Any) -> None:
+    result = nipanel._convert.to_any(python_value)
+    unpack_dest = wrappers_pb2.BytesValue()
+    _assert_any_and_unpack(result, unpack_dest)
+
+    assert unpack_dest.value == bytes(python_value)
+    assert result.value == wrappers_pb2.BytesValue(value=bytes(python_value)).SerializeToString()
+    assert nipanel._convert.is_supported_type(python_value)
+
+
+def test___mmap___to_any_and_from_any___same_bytes() -> None:
+    with mmap.mmap(-1, 4096) as python_value:
+        python_value.write(b"mystr" * 100)
+
+        result = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+        assert result == python_value[:]
+
+
+def test___large_read_only_buffer___to_any___copied_once() -> None:
+    data = np.arange(16 * 1024 * 1024, dtype=np.uint8)
+    data.flags.writeable = False
+    python_value = data.data
+
+    result = nipanel._convert.to_any(python_value)
+
+    assert python_value.readonly
+    assert len(result.value) == data.nbytes + 5
+    assert result.value[5:] == python_value
+
+
+def test___non_contiguous_buffer___to_any___bytes_in_c_order() -> None:
+    data = np.arange(24, dtype=np.uint8).reshape(4, 6)
+    python_value = data[::2, 1::2].data
+    assert not python_value.c_contiguous
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+    assert result == data[::2, 1::2].tobytes()
+
+
+def test___non_byte_buffer___to_any___raw_bytes() -> None:
+    data = np.array([1.5, -2.0])
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(data.data))
+
+    assert result == data.tobytes()
+
+
+@pytest.mark.parametrize(
+    "python_value", [np.int64(3), np.int32(3), np.float32(1.5), np.bool_(True)]
+)
+def test___numpy_scalar___to_any___not_sent_as_bytes(python_value: np.generic) -> None:
+    assert not nipanel._convert.is_supported_type(python_value)
+    with pytest.raises(TypeError):
+        nipanel._convert.to_any(python_value)
+
+
+def test___unsupported_value___is_supported_type_twice___buffer_protocol_checked_once(
+    mocker: MockerFixture,
+) -> None:
+    class _Unsupported:
+        pass
+
+    memoryview_mock = mocker.patch(
+        "nipanel._convert.memoryview", create=True, side_effect=memoryview
+    )
+
+    assert not nipanel._convert.is_supported_type(_Unsupported())
+    assert not nipanel._convert.is_supported_type(_Unsupported())
+
+    memoryview_mock.assert_called_once()
+
+
 def test___python_datetime_datetime___to_any___valid_timestamppb2_value() -> None:
     expected_value = dt.datetime.now()
     result = nipanel._convert.to_any(expected_value)
@@ -345,6 +593,123 @@ def test___python_int16_complex_waveform___to_any___valid_i16_complex_waveform_p
     assert list(unpack_dest.y_data) == [0, 0, 0, 0]
 
 
+@pytest.mark.parametrize(
+    "python_value, proto_type",
+    [
+        (np.array([1.5, -2.25, 3.0]), array_pb2.DoubleArray),
+        (np.array([1.5, -2.25, 3.0], ">f8"), array_pb2.DoubleArray),
+        (np.arange(10.0)[::3], array_pb2.DoubleArray),
+        (np.array([], np.float64), array_pb2.DoubleArray),
+        (np.array([1, -2, 2**40]), array_pb2.SInt64Array),
+        (np.array([True, False, True]), array_pb2.BoolArray),
+        (np.array([True, False, True, False])[::2], array_pb2.BoolArray),
+    ],
+)
+def test___ndarray___to_any___valid_array_proto(
+    python_value: np.ndarray[Any, Any], proto_type: type[_AnyPanelPbTypes]
+) -> None:
+    result = nipanel._convert.to_any(python_value)
+    unpack_dest = proto_type()
+    _assert_any_and_unpack(result, unpack_dest)
+
+    assert list(unpack_dest.values) == python_value.tolist()
+
+
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        np.array([1.5, -2.25, 3.0], np.float32),
+        np.array([1, -2, 3], np.int8),
+        np.array([1, 2, 2**32 - 1], np.uint32),
+        np.array([0, 2**64 - 1], np.uint64),
+        np.array([1 + 2j, -3.5j]),
+        np.arange(24, dtype=np.int16).reshape(2, 3, 4),
+        np.arange(24, dtype=np.float32).reshape(2, 3, 4).transpose(2, 0, 1),
+        np.arange(6, dtype=">i4").reshape(2, 3),
+        np.zeros((0, 3), np.float32),
+        np.array(1.5),
+        np.array(["2025-01-01T00:00:00"], "datetime64[ns]"),
+    ],
+)
+def test___ndarray___to_any_and_from_any___identical_ndarray(
+    python_value: np.ndarray[Any, Any],
+) -> None:
+    result = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == python_value.dtype.newbyteorder("<")
+    assert result.shape == python_value.shape
+    assert np.array_equal(result, python_value)
+    assert result.flags.writeable
+
+
+def test___float32_ndarray___to_any___sends_four_bytes_per_element() -> None:
+    python_value = np.arange(1000, dtype=np.float32)
+
+    result = nipanel._convert.to_any(python_value)
+
+    unpack_dest = array_pb2_nipanel.NDArray()
+    _assert_any_and_unpack(result, unpack_dest)
+    assert unpack_dest.dtype == "<f4"
+    assert list(unpack_dest.shape) == [1000]
+    assert unpack_dest.data == python_value.tobytes()
+
+
+@dataclasses.dataclass
+class _Frame:
+    time_points: list[float]
+    sine_values: np.ndarray[Any, np.dtype[np.float64]]
+    amplitude: float
+
+
+class _Point(NamedTuple):
+    x: float
+    y: float
+
+
+@pytest.mark.parametrize(
+    "python_value, expected_value",
+    [
+        ({"a": 1, "b": "two", "c": [3.0]}, {"a": 1, "b": "two", "c": [3.0]}),
+        ({"outer": {"inner": True}}, {"outer": {"inner": True}}),
+        (
+            _Frame([0.0, 1.0], np.array([0.5, 1.5]), 2.0),
+            {"time_points": [0.0, 1.0], "sine_values": [0.5, 1.5], "amplitude": 2.0},
+        ),
+        (_Point(1.0, 2.0), {"x": 1.0, "y": 2.0}),
+        ({}, {}),
+    ],
+)
+def test___composite_value___to_any_and_from_any___valid_dict(
+    python_value: object, expected_value: dict[str, object]
+) -> None:
+    result = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+    assert result == expected_value
+    assert isinstance(result, dict)
+    assert list(result.keys()) == list(expected_value.keys())
+
+
+def test___composite_value___to_any___single_composite_proto() -> None:
+    result = nipanel._convert.to_any({"amplitude": 2.0, "samples": [1.0, 2.0]})
+
+    unpack_dest = composite_pb2.Composite()
+    _assert_any_and_unpack(result, unpack_dest)
+    assert [field.name for field in unpack_dest.fields] == ["amplitude", "samples"]
+    assert unpack_dest.fields[0].value.Is(wrappers_pb2.DoubleValue.DESCRIPTOR)
+    assert unpack_dest.fields[1].value.Is(array_pb2.DoubleArray.DESCRIPTOR)
+
+
+def test___composite_value___from_any_as_numpy___fields_are_ndarrays() -> None:
+    packed_any = nipanel._convert.to_any({"samples": [1.0, 2.0], "name": "sine"})
+
+    result = nipanel._convert.from_any(packed_any, as_numpy=True)
+
+    assert isinstance(result, dict)
+    assert isinstance(result["samples"], np.ndarray)
+    assert result["name"] == "sine"
+
+
 def test___python_bool_digital_waveform___to_any___valid_digital_waveform_proto() -> None:
     data = np.array([[0, 1, 0], [1, 0, 1]], dtype=np.bool)
     wfm_obj = DigitalWaveform.from_lines(data, signal_count=3)
@@ -518,6 +883,54 @@ def test___array_proto___from_any___valid_python_collection(
     assert result == expected_value
 
 
+@pytest.mark.parametrize(
+    "proto_type, values, expected_dtype",
+    [
+        (array_pb2.BoolArray, [True, False, True], np.bool_),
+        (array_pb2.DoubleArray, [1.0, -2.5, 3.0], np.float64),
+        (array_pb2.SInt64Array, [1, -2, 2**40], np.int64),
+        (array_pb2.DoubleArray, [], np.float64),
+    ],
+)
+def test___numeric_array_proto___from_any_as_numpy___valid_ndarray(
+    proto_type: type[_AnyPanelPbTypes], values: list[Any], expected_dtype: type
+) -> None:
+    packed_any = _pack_into_any(proto_type(values=values))
+
+    result = nipanel._convert.from_any(packed_any, as_numpy=True)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == expected_dtype
+    assert result.tolist() == values
+
+
+@pytest.mark.parametrize(
+    "proto_value, expected_value",
+    [
+        (array_pb2.StringArray(values=["a", "b"]), ["a", "b"]),
+        (wrappers_pb2.DoubleValue(value=1.5), 1.5),
+    ],
+)
+def test___other_proto___from_any_as_numpy___same_as_default(
+    proto_value: Message, expected_value: object
+) -> None:
+    packed_any = _pack_into_any(proto_value)
+
+    result = nipanel._convert.from_any(packed_any, as_numpy=True)
+
+    assert result == expected_value
+
+
+def test___large_array_proto___from_any_with_and_without_numpy___cached_separately() -> None:
+    packed_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0] * 1024))
+
+    numpy_result = nipanel._convert.from_any(packed_any, as_numpy=True)
+    list_result = nipanel._convert.from_any(packed_any)
+
+    assert isinstance(numpy_result, np.ndarray)
+    assert isinstance(list_result, list)
+
+
 def test___scalar_proto___from_any___valid_python_scalar() -> None:
     attrs = {"NI_UnitDescription": attribute_value_pb2.AttributeValue(string_value="amps")}
     pb_value = scalar_pb2.Scalar(attributes=attrs, double_value=1.0)
@@ -674,6 +1087,37 @@ def test___double2darray___from_any___valid_python_2dcollection() -> None:
     assert result == expected_value
 
 
+# ========================================================
+# get_fingerprint() tests
+# ========================================================
+def test___equal_values___get_fingerprint___returns_same_fingerprint() -> None:
+    first_any = nipanel._convert.to_any([1.0, 2.0, 3.0])
+    second_any = nipanel._convert.to_any((1.0, 2.0, 3.0))
+
+    assert nipanel._convert.get_fingerprint(first_any) == nipanel._convert.get_fingerprint(
+        second_any
+    )
+
+
+@pytest.mark.parametrize(
+    "first_value, second_value",
+    [
+        ([1.0, 2.0, 3.0], [1.0, 2.0, 4.0]),
+        (1, 1.0),
+        ("", b""),
+    ],
+)
+def test___different_values___get_fingerprint___returns_different_fingerprints(
+    first_value: object, second_value: object
+) -> None:
+    first_any = nipanel._convert.to_any(first_value)
+    second_any = nipanel._convert.to_any(second_value)
+
+    assert nipanel._convert.get_fingerprint(first_any) != nipanel._convert.get_fingerprint(
+        second_any
+    )
+
+
 # ========================================================
 # Pack/Unpack Helpers
 # ========================================================
@@ -0,0 +1,214 @@
+import logging
+from collections.abc import Collection, Generator
+from dataclasses import dataclass
+from typing import Type
+from unittest.mock import Mock
+
+import pytest
+from google.protobuf import any_pb2
+from ni.protobuf.types import array_pb2
+from pytest_mock import MockerFixture
+
+import nipanel
+import nipanel._convert
+from nipanel._converter_registry import _ConverterRegistry
+from nipanel.converters import Converter
+from nipanel.converters.protobuf_types import FloatCollectionConverter
+
+
+@dataclass(frozen=True)
+class _Point:
+    x: int
+    y: int
+
+
+class _PointConverter(Converter[_Point, array_pb2.SInt32Array]):
+    """A converter for _Point, which is not supported by default."""
+
+    @property
+    def python_type(self) -> type:
+        """The Python type that this converter handles."""
+        return _Point
+
+    @property
+    def protobuf_message(self) -> Type[array_pb2.SInt32Array]:
+        """The type-specific protobuf message for the Python type."""
+        return array_pb2.SInt32Array
+
+    def to_protobuf_message(self, python_value: _Point) -> array_pb2.SInt32Array:
+        """Convert the Python _Point to a protobuf SInt32Array."""
+        return self.protobuf_message(values=[python_value.x, python_value.y])
+
+    def to_python_value(self, protobuf_message: array_pb2.SInt32Array) -> _Point:
+        """Convert the protobuf message to a Python _Point."""
+        return _Point(*protobuf_message.values)
+
+
+class _FastFloatCollectionConverter(FloatCollectionConverter):
+    """A replacement for the built-in float collection converter."""
+
+    def to_protobuf_message(self, python_value: Collection[float]) -> array_pb2.DoubleArray:
+        """Convert the collection of floats to DoubleArray."""
+        return super().to_protobuf_message(python_value)
+
+    def to_python_value(self, protobuf_message: array_pb2.DoubleArray) -> Collection[float]:
+        """Convert the protobuf DoubleArray to a Python collection of floats."""
+        return tuple(protobuf_message.values)
+
+
+@pytest.fixture
+def converter_registry(mocker: MockerFixture) -> Generator[_ConverterRegistry]:
+    """Fixture to isolate converter registrations to a single test."""
+    registry = nipanel._convert._create_converter_registry()
+    mocker.patch.object(nipanel._convert, "_CONVERTER_REGISTRY", registry)
+    nipanel._convert._DECODED_VALUE_CACHE.clear()
+    yield registry
+    nipanel._convert._DECODED_VALUE_CACHE.clear()
+
+
+def test___dataclass___register_converter___overrides_composite_conversion(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    assert nipanel._convert.from_any(nipanel._convert.to_any(_Point(1, 2))) == {"x": 1, "y": 2}
+
+    nipanel.register_converter(_PointConverter())
+    result = nipanel._convert.to_any(_Point(1, 2))
+
+    assert nipanel._convert.is_supported_type(_Point(1, 2))
+    assert nipanel._convert.from_any(result) == _Point(1, 2)
+
+
+def test___builtin_type___register_converter_with_higher_priority___overrides_builtin(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    assert nipanel._convert.from_any(nipanel._convert.to_any([1.0, 2.0])) == [1.0, 2.0]
+
+    nipanel.register_converter(_FastFloatCollectionConverter(), priority=1)
+    result = nipanel._convert.from_any(nipanel._convert.to_any([1.0, 2.0]))
+
+    assert result == (1.0, 2.0)
+
+
+def test___builtin_type___register_converter_with_lower_priority___keeps_builtin(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    nipanel.register_converter(_FastFloatCollectionConverter(), priority=-1)
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any([1.0, 2.0]))
+
+    assert result == [1.0, 2.0]
+
+
+def test___builtin_type___register_converter_with_same_priority___raises_value_error(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    with pytest.raises(ValueError) as exc:
+        nipanel.register_converter(_FastFloatCollectionConverter())
+
+    assert exc.value.args[0].startswith(
+        "_FastFloatCollectionConverter conflicts with FloatCollectionConverter"
+    )
+    assert nipanel._convert.from_any(nipanel._convert.to_any([1.0, 2.0])) == [1.0, 2.0]
+
+
+def test___registry___register___updates_only_affected_entries() -> None:
+    registry = nipanel._convert._create_converter_registry()
+    converter_for_python_type = dict(registry.converter_for_python_type)
+    converter_for_protobuf_type = dict(registry.converter_for_protobuf_type)
+    converter = _PointConverter()
+
+    registry.register(converter, priority=0)
+
+    assert registry.converter_for_python_type == {
+        **converter_for_python_type,
+        converter.python_typename: converter,
+    }
+    assert registry.converter_for_protobuf_type == {
+        **converter_for_protobuf_type,
+        converter.protobuf_typename: converter,
+    }
+
+
+def test___cached_dispatch___register_converter___dispatch_cache_cleared(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    nipanel._convert.to_any([1.0, 2.0])
+    assert converter_registry.converter_for_dispatch_key
+
+    nipanel.register_converter(_PointConverter())
+
+    assert not converter_registry.converter_for_dispatch_key
+
+
+def test___entry_point_returns_converter___load_entry_points___converter_registered(
+    mocker: MockerFixture,
+) -> None:
+    registry = _ConverterRegistry()
+    entry_point = Mock()
+    entry_point.name = "point"
+    entry_point.load.return_value = _PointConverter
+    entry_points = mocker.patch("importlib.metadata.entry_points", return_value=[entry_point])
+
+    registry.load_entry_points()
+    registry.load_entry_points()
+
+    entry_points.assert_called_once_with(group="nipanel.converters")
+    assert isinstance(
+        registry.converter_for_protobuf_type["ni.protobuf.types.SInt32Array"], _PointConverter
+    )
+
+
+def test___entry_point_raises___load_entry_points___logs_warning_and_continues(
+    mocker: MockerFixture, caplog: pytest.LogCaptureFixture
+) -> None:
+    registry = _ConverterRegistry()
+    broken_entry_point = Mock()
+    broken_entry_point.name = "broken"
+    broken_entry_point.load.side_effect = ImportError("missing dependency")
+    entry_point = Mock()
+    entry_point.name = "point"
+    entry_point.load.return_value = _PointConverter
+    mocker.patch("importlib.metadata.entry_points", return_value=[broken_entry_point, entry_point])
+
+    with caplog.at_level(logging.WARNING, logger="nipanel._converter_registry"):
+        registry.load_entry_points()
+
+    assert "Failed to register converters from entry point 'broken'." in caplog.messages
+    assert "ni.protobuf.types.SInt32Array" in registry.converter_for_protobuf_type
+
+
+def test___dataclass_entry_point___first_to_any___uses_entry_point_converter(
+    converter_registry: _ConverterRegistry, mocker: MockerFixture
+) -> None:
+    entry_point = Mock()
+    entry_point.name = "point"
+    entry_point.load.return_value = _PointConverter
+    mocker.patch("importlib.metadata.entry_points", return_value=[entry_point])
+
+    protobuf_any = nipanel._convert.to_any(_Point(1, 2))
+
+    assert protobuf_any.TypeName() == "ni.protobuf.types.SInt32Array"
+
+
+def test___dataclass_entry_point___is_supported_type___uses_entry_point_converter(
+    converter_registry: _ConverterRegistry, mocker: MockerFixture
+) -> None:
+    entry_point = Mock()
+    entry_point.name = "point"
+    entry_point.load.return_value = _PointConverter
+    mocker.patch("importlib.metadata.entry_points", return_value=[entry_point])
+
+    assert nipanel._convert.is_supported_type(_Point(1, 2))
+    assert isinstance(
+        converter_registry.converter_for_dispatch_key[(_Point, _Point, 0, "")], _PointConverter
+    )
+
+
+def test___registered_converter___from_any___uses_registered_converter(
+    converter_registry: _ConverterRegistry,
+) -> None:
+    nipanel.register_converter(_PointConverter())
+    protobuf_any = any_pb2.Any()
+    protobuf_any.Pack(array_pb2.SInt32Array(values=[3, 4]))
+
+    assert nipanel._convert.from_any(protobuf_any) == _Point(3, 4)
@@ -0,0 +1,164 @@
+from unittest.mock import Mock
+
+import numpy as np
+from google.protobuf import any_pb2
+from google.protobuf.message import Message
+from ni.protobuf.types import array_pb2, waveform_pb2
+from nitypes.waveform import AnalogWaveform
+
+import nipanel._convert
+from nipanel._decoded_value_cache import _DecodedValueCache
+
+
+def test___same_any___get_or_decode_twice___decodes_once() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    protobuf_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0, 2.0, 3.0]))
+
+    first_value = cache.get_or_decode(protobuf_any, decode)
+    second_value = cache.get_or_decode(protobuf_any, decode)
+
+    assert decode.call_count == 1
+    assert first_value == second_value == [1.0, 2.0, 3.0]
+
+
+def test___cached_list___mutate_returned_value___cached_value_unchanged() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    protobuf_any = _pack_into_any(
+        array_pb2.Double2DArray(rows=2, columns=2, data=[1.0, 2.0, 3.0, 4.0])
+    )
+    first_value = cache.get_or_decode(protobuf_any, nipanel._convert.from_any)
+    assert isinstance(first_value, list)
+
+    first_value[0][0] = 100.0
+    first_value.append([5.0, 6.0])
+
+    assert cache.get_or_decode(protobuf_any, Mock()) == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test___waveform___mutate_returned_value___next_value_unchanged() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    protobuf_any = _pack_into_any(waveform_pb2.DoubleAnalogWaveform(y_data=[1.0, 2.0, 3.0]))
+    first_value = cache.get_or_decode(protobuf_any, nipanel._convert.from_any)
+    assert isinstance(first_value, AnalogWaveform)
+
+    first_value.raw_data[0] = 100.0
+
+    second_value = cache.get_or_decode(protobuf_any, nipanel._convert.from_any)
+    assert isinstance(second_value, AnalogWaveform)
+    assert np.array_equal(second_value.raw_data, [1.0, 2.0, 3.0])
+
+
+def test___cached_waveform_collection___mutate_returned_waveform___next_value_unchanged() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024 * 1024, min_bytes=0)
+    waveforms = [AnalogWaveform.from_array_1d([1.0, 2.0, 3.0], dtype=np.float64) for _ in range(2)]
+    waveforms[0].extended_properties["NI_ChannelName"] = "Dev1/ai0"
+    protobuf_any = nipanel._convert.to_any(waveforms)
+    first_value = cache.get_or_decode(protobuf_any, nipanel._convert.from_any)
+    assert isinstance(first_value, list)
+
+    first_value[0].raw_data[0] = 100.0
+    first_value[0].extended_properties["NI_ChannelName"] = "Dev1/ai1"
+
+    second_value = cache.get_or_decode(protobuf_any, nipanel._convert.from_any)
+    assert isinstance(second_value, list)
+    assert second_value[0] is not first_value[0]
+    assert np.array_equal(second_value[0].raw_data, [1.0, 2.0, 3.0])
+    assert second_value[0].extended_properties["NI_ChannelName"] == "Dev1/ai0"
+
+
+def test___waveform___get_or_decode_twice___decodes_twice() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    protobuf_any = _pack_into_any(waveform_pb2.DoubleAnalogWaveform(y_data=[1.0, 2.0, 3.0]))
+
+    cache.get_or_decode(protobuf_any, decode)
+    cache.get_or_decode(protobuf_any, decode)
+
+    assert decode.call_count == 2
+
+
+def test___decoded_list_larger_than_max_bytes___get_or_decode_twice___decodes_twice() -> None:
+    # The payload of 100 doubles is about 800 bytes, but the decoded list is about 3200 bytes.
+    cache = _DecodedValueCache(max_entries=4, max_bytes=2048, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    protobuf_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0] * 100))
+
+    cache.get_or_decode(protobuf_any, decode)
+    cache.get_or_decode(protobuf_any, decode)
+
+    assert decode.call_count == 2
+
+
+def test___payload_smaller_than_min_bytes___get_or_decode_twice___decodes_twice() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=1024)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    protobuf_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0, 2.0, 3.0]))
+
+    cache.get_or_decode(protobuf_any, decode)
+    cache.get_or_decode(protobuf_any, decode)
+
+    assert decode.call_count == 2
+
+
+def test___same_payload_with_different_type_urls___get_or_decode___decodes_each() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    double_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0]))
+    spectrum_any = any_pb2.Any(
+        type_url="type.googleapis.com/ni.protobuf.types.DoubleSpectrum", value=double_any.value
+    )
+
+    cache.get_or_decode(double_any, decode)
+    cache.get_or_decode(spectrum_any, decode)
+
+    assert decode.call_count == 2
+
+
+def test___more_values_than_max_entries___get_or_decode___evicts_least_recently_used() -> None:
+    cache = _DecodedValueCache(max_entries=2, max_bytes=1024, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    first_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0]))
+    second_any = _pack_into_any(array_pb2.DoubleArray(values=[2.0]))
+    third_any = _pack_into_any(array_pb2.DoubleArray(values=[3.0]))
+    cache.get_or_decode(first_any, decode)
+    cache.get_or_decode(second_any, decode)
+    cache.get_or_decode(first_any, decode)
+
+    cache.get_or_decode(third_any, decode)
+    cache.get_or_decode(first_any, decode)
+    cache.get_or_decode(second_any, decode)
+
+    assert decode.call_count == 4
+
+
+def test___values_larger_than_max_bytes___get_or_decode___evicts_oldest() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=500, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    first_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0] * 8))
+    second_any = _pack_into_any(array_pb2.DoubleArray(values=[2.0] * 8))
+    cache.get_or_decode(first_any, decode)
+
+    cache.get_or_decode(second_any, decode)
+    cache.get_or_decode(second_any, decode)
+    cache.get_or_decode(first_any, decode)
+
+    assert decode.call_count == 3
+
+
+def test___cached_value___clear___decodes_again() -> None:
+    cache = _DecodedValueCache(max_entries=4, max_bytes=1024, min_bytes=0)
+    decode = Mock(side_effect=nipanel._convert.from_any)
+    protobuf_any = _pack_into_any(array_pb2.DoubleArray(values=[1.0, 2.0, 3.0]))
+    cache.get_or_decode(protobuf_any, decode)
+
+    cache.clear()
+    cache.get_or_decode(protobuf_any, decode)
+
+    assert decode.call_count == 2
+
+
+def _pack_into_any(proto_value: Message) -> any_pb2.Any:
+    as_any = any_pb2.Any()
+    as_any.Pack(proto_value)
+    return as_any
@@ -0,0 +1,199 @@
+import dataclasses
+from typing import NamedTuple
+from unittest.mock import Mock
+
+import grpc
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+import nipanel
+import nipanel._convert
+from nipanel import EncodedValue, PanelValueAccessor
+from nipanel._encoded_value import _EncodedValueMemo
+from nipanel.converters.waveform_types import PackedDigitalWaveformConverter
+from tests.types import MyIntEnum
+
+
+@dataclasses.dataclass(frozen=True)
+class _FrozenPoint:
+    x: float
+    y: float
+
+
+@dataclasses.dataclass
+class _MutablePoint:
+    x: float
+    y: float
+
+
+class _Channel(NamedTuple):
+    name: str
+    gain: float
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Dev1/ai0",
+        b"bytes",
+        1.5,
+        ("Dev1/ai0", "Dev1/ai1", "Dev1/ai2"),
+        _FrozenPoint(1.0, 2.0),
+        _Channel("Dev1/ai0", 2.0),
+    ],
+)
+def test___immutable_value___get_or_encode_twice___encodes_once(value: object) -> None:
+    memo = _EncodedValueMemo(max_entries=4, max_bytes=1024)
+    encode = Mock(side_effect=nipanel._convert._encode)
+
+    first_value = memo.get_or_encode(value, 0, encode)
+    second_value = memo.get_or_encode(value, 0, encode)
+
+    assert encode.call_count == 1
+    assert first_value is second_value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["Dev1/ai0", "Dev1/ai1"],
+        ([1.0, 2.0], [3.0, 4.0]),
+        np.arange(3.0),
+        _MutablePoint(1.0, 2.0),
+        {"key": 1.0},
+    ],
+)
+def test___mutable_value___get_or_encode_twice___encodes_twice(value: object) -> None:
+    memo = _EncodedValueMemo(max_entries=4, max_bytes=1024)
+    encode = Mock(side_effect=nipanel._convert._encode)
+
+    memo.get_or_encode(value, 0, encode)
+    memo.get_or_encode(value, 0, encode)
+
+    assert encode.call_count == 2
+
+
+def test___equal_but_different_object___get_or_encode___encodes_again() -> None:
+    memo = _EncodedValueMemo(max_entries=4, max_bytes=1024)
+    encode = Mock(side_effect=nipanel._convert._encode)
+
+    memo.get_or_encode(("a", "b"), 0, encode)
+    memo.get_or_encode(tuple(["a", "b"]), 0, encode)
+
+    assert encode.call_count == 2
+
+
+def test___different_version___get_or_encode___encodes_again() -> None:
+    memo = _EncodedValueMemo(max_entries=4, max_bytes=1024)
+    encode = Mock(side_effect=nipanel._convert._encode)
+    value = ("a", "b")
+
+    memo.get_or_encode(value, 0, encode)
+    memo.get_or_encode(value, 1, encode)
+    memo.get_or_encode(value, 1, encode)
+
+    assert encode.call_count == 2
+
+
+def test___full_memo___get_or_encode___evicts_least_recently_used() -> None:
+    memo = _EncodedValueMemo(max_entries=2, max_bytes=1024)
+    encode = Mock(side_effect=nipanel._convert._encode)
+    first, second, third = ("first",), ("second",), ("third",)
+
+    memo.get_or_encode(first, 0, encode)
+    memo.get_or_encode(second, 0, encode)
+    memo.get_or_encode(first, 0, encode)
+    memo.get_or_encode(third, 0, encode)
+    memo.get_or_encode(first, 0, encode)
+    memo.get_or_encode(second, 0, encode)
+
+    assert encode.call_count == 4
+
+
+def test___large_value___get_or_encode___not_remembered() -> None:
+    memo = _EncodedValueMemo(max_entries=4, max_bytes=100)
+    encode = Mock(side_effect=nipanel._convert._encode)
+    value = "x" * 1000
+
+    memo.get_or_encode(value, 0, encode)
+    memo.get_or_encode(value, 0, encode)
+
+    assert encode.call_count == 2
+
+
+def test___converter_registered___encode___encodes_again(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        nipanel._convert, "_CONVERTER_REGISTRY", nipanel._convert._create_converter_registry()
+    )
+    value = ("Dev1/ai0", "Dev1/ai1")
+    first_value = nipanel._convert.encode(value)
+
+    nipanel.register_converter(PackedDigitalWaveformConverter(), priority=1)
+    second_value = nipanel._convert.encode(value)
+
+    assert nipanel._convert.encode(value) is second_value
+    assert second_value is not first_value
+
+
+def test___encoded_value___properties___describe_serialized_value() -> None:
+    encoded_value = nipanel._convert.encode([1.0, 2.0, 3.0])
+
+    assert isinstance(encoded_value, EncodedValue)
+    assert encoded_value.typename == "ni.protobuf.types.DoubleArray"
+    assert encoded_value.nbytes > 24
+    assert repr(encoded_value).startswith("nipanel.EncodedValue('ni.protobuf.types.DoubleArray'")
+
+
+def test___encoded_value___set_encoded_to_several_ids_and_panels___gets_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    first_accessor = PanelValueAccessor(panel_id="panel1", grpc_channel=fake_panel_channel)
+    second_accessor = PanelValueAccessor(panel_id="panel2", grpc_channel=fake_panel_channel)
+    encoded_value = first_accessor.encode(np.arange(5.0))
+
+    first_accessor.set_encoded("reference", encoded_value)
+    first_accessor.set_encoded("other_reference", encoded_value)
+    second_accessor.set_encoded("reference", encoded_value)
+
+    for accessor, value_id in [
+        (first_accessor, "reference"),
+        (first_accessor, "other_reference"),
+        (second_accessor, "reference"),
+    ]:
+        assert accessor.get_value(value_id) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test___enum_value___encode_and_set_encoded___gets_enum_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    accessor.set_encoded("test_id", accessor.encode(MyIntEnum.VALUE20))
+
+    assert accessor.get_value("test_id", MyIntEnum.VALUE10) == MyIntEnum.VALUE20
+
+
+def test___set_encoded_with_fingerprint___get_value_with_fingerprint___gets_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    accessor.set_encoded("test_id", accessor.encode("first"), fingerprint=True)
+    first_value = accessor.get_value("test_id", fingerprint=True)
+    accessor.set_encoded("test_id", accessor.encode("second"))
+
+    assert first_value == "first"
+    assert accessor.get_value("test_id", fingerprint=True) == "second"
+
+
+def test___set_encoded___set_value_if_changed_with_same_value___sets_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", "value")
+
+    accessor.set_encoded("test_id", accessor.encode("other"))
+    accessor.set_value_if_changed("test_id", "value")
+
+    assert accessor.get_value("test_id") == "value"
@@ -0,0 +1,225 @@
+from typing import Any
+
+import grpc
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+import nipanel
+import nipanel._convert
+from nipanel import LazyValue, PanelValueAccessor
+from nipanel._protos import array_pb2, image_pb2
+from nipanel.converters.image_types import Image, ImageConverter, ImageEncoding
+
+
+def _create_frame(height: int, width: int, channel_count: int | None = 3) -> np.ndarray[Any, Any]:
+    # A smooth gradient with a little noise, which compresses like a camera frame.
+    y, x = np.mgrid[0:height, 0:width]
+    channels = [x * 255 // max(width, 1), y * 255 // max(height, 1), (x + y) % 256, x % 256]
+    frame: np.ndarray[Any, Any] = np.stack(channels[: channel_count or 1], axis=-1)
+    frame = frame + np.random.default_rng(0).integers(-2, 3, size=frame.shape)
+    frame = np.clip(frame, 0, 255).astype(np.uint8)
+    return frame[:, :, 0] if channel_count is None else frame
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        _create_frame(48, 64, None),
+        _create_frame(48, 64, 1),
+        _create_frame(48, 64, 3),
+        _create_frame(48, 64, 4),
+        (_create_frame(48, 64, None).astype(np.uint16) * 257),
+        (_create_frame(48, 64, 3).astype(np.uint16) * 257),
+        np.zeros((0, 64, 3), dtype=np.uint8),
+    ],
+)
+@pytest.mark.parametrize("encoding", [ImageEncoding.RAW, ImageEncoding.PNG])
+def test___image___to_any_and_from_any___equal_image(
+    image: np.ndarray[Any, Any], encoding: ImageEncoding
+) -> None:
+    protobuf_any = nipanel._convert.to_any(Image(image, encoding))
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(image_pb2.Image.DESCRIPTOR)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == image.dtype
+    assert result.shape == image.shape
+    assert np.array_equal(result, image)
+    assert result.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        np.zeros((4, 5), dtype=np.uint8),
+        np.zeros((4, 5, 3), dtype=np.uint8),
+        np.zeros((4, 5), dtype=">u2"),
+    ],
+)
+def test___image___to_any___image_proto(python_value: np.ndarray[Any, Any]) -> None:
+    result = nipanel._convert.to_any(Image(python_value, ImageEncoding.RAW))
+
+    assert result.Is(image_pb2.Image.DESCRIPTOR)
+
+
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        np.zeros((4, 5), dtype=np.uint8),
+        np.zeros((4, 5, 3), dtype=np.uint8),
+        np.zeros((4, 5), dtype=np.uint16),
+    ],
+)
+def test___array_shaped_like_image___to_any___ndarray_proto(
+    python_value: np.ndarray[Any, Any],
+) -> None:
+    result = nipanel._convert.to_any(python_value)
+
+    assert result.Is(array_pb2.NDArray.DESCRIPTOR)
+
+
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        np.zeros(5, dtype=np.uint8),
+        np.zeros((4, 5, 2), dtype=np.uint8),
+        np.zeros((4, 5), dtype=np.int16),
+        np.zeros((4, 5), dtype=np.float32),
+        np.zeros((2, 4, 5, 3), dtype=np.uint8),
+    ],
+)
+def test___array_not_shaped_like_image___to_any___ndarray_proto(
+    python_value: np.ndarray[Any, Any],
+) -> None:
+    result = nipanel._convert.to_any(python_value)
+
+    assert result.Is(array_pb2.NDArray.DESCRIPTOR)
+
+
+def test___big_endian_image___convert___little_endian_image_proto() -> None:
+    converter = ImageConverter()
+
+    result = converter.to_protobuf_message(
+        Image(np.array([[1, 2], [3, 4]], ">u2"), ImageEncoding.RAW)
+    )
+
+    assert result.dtype == "<u2"
+    assert list(result.shape) == [2, 2]
+    assert result.encoding == image_pb2.IMAGE_ENCODING_RAW
+    assert result.data == b"\x01\x00\x02\x00\x03\x00\x04\x00"
+
+
+@pytest.mark.parametrize("encoding", [ImageEncoding.RAW, ImageEncoding.PNG, ImageEncoding.JPEG])
+def test___image___convert_to_any___same_as_packed_message(encoding: ImageEncoding) -> None:
+    converter = ImageConverter()
+    image = Image(_create_frame(16, 16), encoding)
+
+    result = converter.to_protobuf_any(image)
+
+    assert result.value == converter.to_protobuf_message(image).SerializeToString()
+
+
+@pytest.mark.parametrize("channel_count", [None, 3])
+def test___1080p_frame___convert_to_jpeg___small_and_close_to_original(
+    channel_count: int | None,
+) -> None:
+    converter = ImageConverter()
+    frame = _create_frame(1080, 1920, channel_count)
+
+    protobuf_any = converter.to_protobuf_any(Image(frame, ImageEncoding.JPEG, quality=85))
+    result = converter.to_python(protobuf_any)
+
+    assert len(protobuf_any.value) < 500_000
+    assert len(protobuf_any.value) < frame.nbytes // 10
+    assert result.dtype == np.uint8
+    assert result.shape == frame.shape
+    assert np.abs(result.astype(np.int16) - frame).mean() < 4
+
+
+@pytest.mark.parametrize(
+    "image, expected_encoding",
+    [
+        (_create_frame(8, 8, 3), image_pb2.IMAGE_ENCODING_JPEG),
+        (_create_frame(8, 8, 1), image_pb2.IMAGE_ENCODING_JPEG),
+        (_create_frame(8, 8, 4), image_pb2.IMAGE_ENCODING_PNG),
+        (_create_frame(8, 8, None).astype(np.uint16), image_pb2.IMAGE_ENCODING_PNG),
+        (_create_frame(8, 8, 3).astype(np.uint16), image_pb2.IMAGE_ENCODING_RAW),
+        (np.zeros((0, 0), dtype=np.uint8), image_pb2.IMAGE_ENCODING_RAW),
+    ],
+)
+def test___image_jpeg_does_not_support___convert_to_jpeg___falls_back_to_supported_encoding(
+    image: np.ndarray[Any, Any], expected_encoding: int
+) -> None:
+    converter = ImageConverter()
+
+    result = converter.to_protobuf_message(Image(image, ImageEncoding.JPEG))
+
+    assert result.encoding == expected_encoding
+    assert converter.to_python_value(result).shape == image.shape
+
+
+def test___pillow_not_installed___convert_to_png___sends_raw(mocker: MockerFixture) -> None:
+    mocker.patch("nipanel.converters.image_types._has_pillow", return_value=False)
+    converter = ImageConverter()
+    image = _create_frame(8, 8)
+
+    result = converter.to_protobuf_message(Image(image, ImageEncoding.PNG))
+
+    assert result.encoding == image_pb2.IMAGE_ENCODING_RAW
+    assert np.array_equal(converter.to_python_value(result), image)
+
+
+def test___array_not_shaped_like_image___create_image___throws_type_error() -> None:
+    with pytest.raises(TypeError):
+        _ = Image(np.zeros((4, 5), dtype=np.float64), ImageEncoding.RAW)
+
+
+def test___image_proto_with_unsupported_dtype___convert___throws_type_error() -> None:
+    image = image_pb2.Image(dtype="<f8", shape=[1, 1], data=b"\x00" * 8)
+    converter = ImageConverter()
+
+    with pytest.raises(TypeError):
+        _ = converter.to_python_value(image)
+
+
+def test___jpeg_image_and_array___to_any___only_image_is_jpeg() -> None:
+    frame = _create_frame(480, 640)
+
+    image_result = nipanel._convert.to_any(Image(frame, ImageEncoding.JPEG))
+    array_result = nipanel._convert.to_any(frame)
+
+    unpacked = image_pb2.Image()
+    assert image_result.Unpack(unpacked)
+    assert unpacked.encoding == image_pb2.IMAGE_ENCODING_JPEG
+    assert array_result.Is(array_pb2.NDArray.DESCRIPTOR)
+    array_value = nipanel._convert.from_any(array_result)
+    assert isinstance(array_value, np.ndarray)
+    assert np.array_equal(array_value, frame)
+
+
+def test___image___from_any_lazy___shape_without_decoding() -> None:
+    frame = _create_frame(48, 64)
+    protobuf_any = ImageConverter().to_protobuf_any(Image(frame, ImageEncoding.PNG))
+
+    result = nipanel._convert.from_any(protobuf_any, lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == 48 * 64 * 3
+    assert result.dtype == np.uint8
+    assert not result.is_decoded
+    assert result.shape == (48, 64, 3)
+
+
+def test___image___set_value_and_get_value___equal_image(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    frames = [_create_frame(48, 64), _create_frame(48, 64, 4)]
+
+    for frame in frames:
+        accessor.set_value("frame", Image(frame, ImageEncoding.PNG))
+        result = accessor.get_value("frame")
+
+        assert isinstance(result, np.ndarray)
+        assert np.array_equal(result, frame)
@@ -0,0 +1,216 @@
+import copy
+import datetime as dt
+from typing import Any
+
+import grpc
+import numpy as np
+import pytest
+from nitypes.complex import ComplexInt32DType
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    Spectrum,
+    Timing,
+)
+from pytest_mock import MockerFixture
+
+import nipanel._convert
+from nipanel import LazyValue, PanelValueAccessor
+from nipanel._convert import from_any, to_any
+from nipanel.converters.waveform_types import (
+    PackedDigitalWaveformConverter,
+    QuantizedAnalogWaveformConverter,
+)
+
+EXPECTED_T0_DT = dt.datetime(2000, 12, 1, tzinfo=dt.timezone.utc)
+
+
+def test___analog_waveform___from_any_lazy___metadata_without_decoding() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(1000, dtype=np.float64))
+    analog_waveform.timing = Timing.create_with_regular_interval(
+        dt.timedelta(milliseconds=1), EXPECTED_T0_DT
+    )
+
+    result = from_any(to_any(analog_waveform), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.typename == "ni.protobuf.types.DoubleAnalogWaveform"
+    assert result.sample_count == 1000
+    assert result.dtype == np.float64
+    assert result.t0 == EXPECTED_T0_DT
+    assert not result.is_decoded
+
+
+def test___analog_waveform___from_any_lazy___attribute_access_decodes(
+    mocker: MockerFixture,
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1.0, 2.0, 3.0]))
+    result = from_any(to_any(analog_waveform), lazy=True)
+    assert isinstance(result, LazyValue)
+    from_any_spy = mocker.spy(nipanel._convert, "from_any")
+
+    scaled_data = result.scaled_data
+    result.sample_count
+
+    assert result.is_decoded
+    assert list(scaled_data) == [1.0, 2.0, 3.0]
+    assert isinstance(result.value, AnalogWaveform)
+    assert from_any_spy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "python_value, expected_sample_count, expected_dtype",
+    [
+        ([1.0, 2.0, 3.0], 3, np.float64),
+        ([1, -200, 3_000_000_000], 3, np.int64),
+        ([True, False], 2, np.bool_),
+        ([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], 6, np.float64),
+        (np.zeros((4, 5), dtype=np.float32), 20, np.float32),
+        (AnalogWaveform.from_array_1d(np.array([1, -2, 3], dtype=np.int16)), 3, np.int16),
+        (AnalogWaveform.from_array_1d(np.array([1, -2, 3], dtype=np.int8)), 3, np.int8),
+        (AnalogWaveform.from_array_1d(np.array([1, -2, 3], dtype=np.int32)), 3, np.int32),
+        (ComplexWaveform.from_array_1d([1 + 2j, 3 + 4j], np.complex128), 2, np.complex128),
+        (ComplexWaveform.from_array_1d([(1, 2), (3, 4)], ComplexInt32DType), 2, ComplexInt32DType),
+        (Spectrum.from_array_1d(np.array([1.0, 2.0]), np.float64), 2, np.float64),
+        (DigitalWaveform.from_lines(np.zeros((5, 3), dtype=np.uint8)), 5, np.uint8),
+    ],
+)
+def test___array_or_waveform___from_any_lazy___sample_count_and_dtype(
+    python_value: object, expected_sample_count: int, expected_dtype: Any
+) -> None:
+    result = from_any(to_any(python_value), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == expected_sample_count
+    assert result.dtype == np.dtype(expected_dtype)
+    assert not result.is_decoded
+
+
+def test___packed_digital_waveform___from_any_lazy___sample_count() -> None:
+    digital_waveform = DigitalWaveform.from_lines(np.zeros((7, 12), dtype=np.uint8))
+    protobuf_any = PackedDigitalWaveformConverter().to_protobuf_any(digital_waveform)
+
+    result = from_any(protobuf_any, lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == 7
+    assert result.dtype == np.uint8
+
+
+def test___quantized_analog_waveform___from_any_lazy___sample_count() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.linspace(-1.0, 1.0, 9))
+    protobuf_any = QuantizedAnalogWaveformConverter().to_protobuf_any(analog_waveform)
+
+    result = from_any(protobuf_any, lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == 9
+    assert result.dtype == np.int16
+
+
+def test___irregular_waveform___from_any_lazy___t0_is_first_timestamp() -> None:
+    timestamps = [EXPECTED_T0_DT + dt.timedelta(seconds=i * i) for i in range(3)]
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1, 2, 3], dtype=np.int8),
+        scale_mode=LinearScaleMode(2.0, 0.0),
+        timing=Timing.create_with_irregular_interval(timestamps),
+    )
+
+    result = from_any(to_any(analog_waveform), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.t0 == EXPECTED_T0_DT
+    assert result.sample_count == 3
+
+
+def test___scalar___from_any_lazy___no_metadata_and_compares_equal() -> None:
+    result = from_any(to_any(42), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count is None
+    assert result.dtype is None
+    assert result.t0 is None
+    assert not result.is_decoded
+    assert result == 42
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (False, False),
+        (True, True),
+        (0, False),
+        (42, True),
+        (0.0, False),
+        ("", False),
+        ("text", True),
+        ([1.0], True),
+    ],
+)
+def test___value___from_any_lazy___truth_value_matches_value(value: object, expected: bool) -> None:
+    result = from_any(to_any(value), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert bool(result) is expected
+
+
+def test___list___from_any_lazy___supports_sequence_and_array_protocols() -> None:
+    result = from_any(to_any([1.0, 2.0, 3.0]), lazy=True, as_numpy=True)
+
+    assert isinstance(result, LazyValue)
+    assert len(result) == 3
+    assert list(result) == [1.0, 2.0, 3.0]
+    assert result[1] == 2.0
+    assert np.array_equal(np.asarray(result), [1.0, 2.0, 3.0])
+    assert isinstance(result.value, np.ndarray)
+
+
+def test___ndarray___from_any_lazy___compares_elementwise() -> None:
+    result = from_any(to_any([1.0, 2.0, 3.0]), lazy=True, as_numpy=True)
+
+    assert isinstance(result, LazyValue)
+    assert np.array_equal(result == np.array([1.0, 0.0, 3.0]), [True, False, True])
+    assert np.array_equal(result != np.array([1.0, 0.0, 3.0]), [False, True, False])
+
+
+def test___ndarray___from_any_lazy___array_copy_matches_request() -> None:
+    result = from_any(to_any([1.0, 2.0, 3.0]), lazy=True, as_numpy=True)
+
+    assert isinstance(result, LazyValue)
+    assert not np.shares_memory(result.__array__(copy=True), result.value)
+    assert result.__array__(copy=False) is result.value
+    with pytest.raises(ValueError):
+        _ = result.__array__(np.float32, copy=False)
+
+
+def test___list___from_any_lazy___array_without_copy___throws_value_error() -> None:
+    result = from_any(to_any([1.0, 2.0, 3.0]), lazy=True)
+
+    assert isinstance(result, LazyValue)
+    with pytest.raises(ValueError):
+        _ = result.__array__(copy=False)
+
+
+def test___lazy_value___copy___does_not_decode() -> None:
+    result = from_any(to_any([1.0, 2.0]), lazy=True)
+
+    copied = copy.copy(result)
+
+    assert isinstance(copied, LazyValue)
+    assert not copied.is_decoded
+    assert "not decoded" in repr(result)
+
+
+def test___lazy_get_value_with_default___get_value___returns_lazy_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("samples", [1.0, 2.0])
+
+    result = accessor.get_value("samples", [0.0], lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == 2
+    assert result == [1.0, 2.0]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from nipanel._protos import array_pb2
+from nipanel.converters.numpy_types import NDArrayConverter
+
+
+# ========================================================
+# np.ndarray to NDArray
+# Round trips are tested in test_convert.py
+# ========================================================
+def test___big_endian_ndarray___convert___little_endian_ndarray_proto() -> None:
+    converter = NDArrayConverter()
+
+    result = converter.to_protobuf_message(np.array([[1, 2], [3, 4]], ">i2"))
+
+    assert result.dtype == "<i2"
+    assert list(result.shape) == [2, 2]
+    assert result.data == b"\x01\x00\x02\x00\x03\x00\x04\x00"
+
+
+def test___object_ndarray___convert___throws_type_error() -> None:
+    converter = NDArrayConverter()
+
+    with pytest.raises(TypeError):
+        _ = converter.to_protobuf_message(np.array([object()]))
+
+
+def test___ndarray___convert_to_any___same_as_packed_message() -> None:
+    converter = NDArrayConverter()
+    python_value = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    result = converter.to_protobuf_any(python_value)
+
+    unpacked = array_pb2.NDArray()
+    assert result.Unpack(unpacked)
+    assert unpacked == converter.to_protobuf_message(python_value)
+
+
+# ========================================================
+# NDArray to np.ndarray
+# ========================================================
+def test___ndarray_proto___convert___writable_ndarray() -> None:
+    ndarray = array_pb2.NDArray(dtype="<u2", shape=[2, 1], data=b"\x01\x00\xff\xff")
+    converter = NDArrayConverter()
+
+    result = converter.to_python_value(ndarray)
+
+    assert result.dtype == np.uint16
+    assert result.tolist() == [[1], [65535]]
+    assert result.flags.writeable
+
+
+@pytest.mark.parametrize("dtype", ["|O", "<U1", "|V2"])
+def test___ndarray_proto_with_unsupported_dtype___convert___throws_type_error(
+    dtype: str,
+) -> None:
+    ndarray = array_pb2.NDArray(dtype=dtype, shape=[1], data=b"\x00" * 8)
+    converter = NDArrayConverter()
+
+    with pytest.raises(TypeError):
+        _ = converter.to_python_value(ndarray)
+
+
+def test___ndarray_proto_with_mismatched_shape___convert___throws_value_error() -> None:
+    ndarray = array_pb2.NDArray(dtype="<f8", shape=[2], data=b"\x00" * 8)
+    converter = NDArrayConverter()
+
+    with pytest.raises(ValueError):
+        _ = converter.to_python_value(ndarray)
@@ -0,0 +1,171 @@
+import dataclasses
+import subprocess
+import sys
+
+import grpc
+import numpy as np
+import pandas as pd
+import pytest
+
+import nipanel._convert
+from nipanel import PanelValueAccessor
+from nipanel._protos import pandas_pb2
+from nipanel.converters.pandas_types import DataFrameConverter, SeriesConverter
+
+
+def _create_data_frame(row_count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "dut": [f"DUT{i}" for i in range(row_count)],
+            "voltage": np.linspace(0.0, 1.0, row_count),
+            "passed": [i % 3 != 0 for i in range(row_count)],
+            "bin": pd.Categorical([f"bin{i % 4}" for i in range(row_count)]),
+            "time": pd.date_range("2024-01-01", periods=row_count, freq="s", tz="UTC"),
+        },
+        index=pd.Index(np.arange(row_count) * 10, name="serial"),
+    )
+
+
+@pytest.mark.parametrize("row_count", [0, 1, 1000])
+def test___data_frame___to_any_and_from_any___equal_data_frame(row_count: int) -> None:
+    data_frame = _create_data_frame(row_count)
+
+    protobuf_any = nipanel._convert.to_any(data_frame)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(pandas_pb2.PandasDataFrame.DESCRIPTOR)
+    assert isinstance(result, pd.DataFrame)
+    pd.testing.assert_frame_equal(result, data_frame)
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.RangeIndex(5, 15, 2),
+        pd.Index(["a", "b", "c", "d", "e"], name="site"),
+        pd.MultiIndex.from_product([["x"], [1, 2, 3, 4, 5]], names=["lot", "wafer"]),
+        pd.DatetimeIndex(pd.date_range("2024-01-01", periods=5, tz="US/Central"), name="time"),
+    ],
+)
+def test___data_frame_with_index___to_any_and_from_any___index_preserved(
+    index: pd.Index,
+) -> None:
+    data_frame = pd.DataFrame({"value": np.arange(5.0)}, index=index)
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(data_frame))
+
+    assert isinstance(result, pd.DataFrame)
+    # Arrow does not keep the frequency of a DatetimeIndex.
+    pd.testing.assert_frame_equal(result, data_frame, check_freq=False)
+
+
+def test___data_frame_with_column_names___to_any_and_from_any___column_names_preserved() -> None:
+    data_frame = pd.DataFrame(np.ones((2, 3)), columns=pd.Index([10, 20, 30], name="channel"))
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(data_frame))
+
+    assert isinstance(result, pd.DataFrame)
+    pd.testing.assert_frame_equal(result, data_frame)
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1.0, 2.0, 3.0], name="voltage"),
+        pd.Series(["a", None, "c"]),
+        pd.Series([1, 2], name=7, index=pd.Index(["x", "y"], name="site")),
+        pd.Series(pd.Categorical(["lo", "hi", "lo"]), name="range"),
+        pd.Series([], dtype=np.int32, name="empty"),
+    ],
+)
+def test___series___to_any_and_from_any___equal_series(series: pd.Series) -> None:
+    protobuf_any = nipanel._convert.to_any(series)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(pandas_pb2.PandasSeries.DESCRIPTOR)
+    assert isinstance(result, pd.Series)
+    pd.testing.assert_series_equal(result, series)
+
+
+@pytest.mark.parametrize("converter", [DataFrameConverter(), SeriesConverter()])
+def test___pandas_value___to_protobuf_message_and_to_python_value___round_trips(
+    converter: DataFrameConverter | SeriesConverter,
+) -> None:
+    data_frame = _create_data_frame(10)
+    value = data_frame if isinstance(converter, DataFrameConverter) else data_frame["voltage"]
+
+    message = converter.to_protobuf_message(value)
+    result = converter.to_python_value(message)
+
+    assert converter.to_protobuf_any(value).value == message.SerializeToString()
+    assert result.equals(value)
+
+
+def test___data_frame___from_any___result_is_writable() -> None:
+    data_frame = pd.DataFrame({"value": np.arange(10.0)})
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(data_frame))
+
+    assert isinstance(result, pd.DataFrame)
+    result.loc[0, "value"] = 100.0
+    assert result["value"][0] == 100.0
+
+
+class _SubFrame(pd.DataFrame):  # type: ignore[misc]
+    pass
+
+
+def test___data_frame_subclass___to_any_and_from_any___equal_data_frame() -> None:
+    data_frame = _SubFrame({"a": [1.0, 2.0]})
+
+    protobuf_any = nipanel._convert.to_any(data_frame)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(pandas_pb2.PandasDataFrame.DESCRIPTOR)
+    assert isinstance(result, pd.DataFrame)
+    pd.testing.assert_frame_equal(result, pd.DataFrame({"a": [1.0, 2.0]}))
+
+
+def test___pandas_types___is_supported_type___returns_true() -> None:
+    data_frame = _create_data_frame(1)
+
+    assert nipanel._convert.is_supported_type(data_frame)
+    assert nipanel._convert.is_supported_type(data_frame["voltage"])
+
+
+def test___import_nipanel___does_not_import_pandas() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, nipanel; print('pandas' in sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test___data_frame___set_value_and_get_value___equal_data_frame(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    data_frame = _create_data_frame(100)
+
+    accessor.set_value("results", data_frame)
+    result = accessor.get_value("results")
+
+    assert isinstance(result, pd.DataFrame)
+    pd.testing.assert_frame_equal(result, data_frame)
+
+
+@dataclasses.dataclass
+class _Measurement:
+    name: str
+    value: float
+
+
+def test___dataclass___to_any___still_converted_as_composite() -> None:
+    measurement = _Measurement("voltage", 1.5)
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(measurement))
+
+    assert result == {"name": "voltage", "value": 1.5}
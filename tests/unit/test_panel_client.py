@@ -86,3 +86,15 @@ def test___set_value___gets_value(fake_panel_channel: grpc.Channel) -> None:
     client.set_value("panel1", "val1", "value1", notify=False)
 
     assert client.try_get_value("panel1", "val1") == "value1"
+
+
+def test___set_value_with_different_types___gets_latest_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    client = _PanelClient(grpc_channel=fake_panel_channel)
+
+    client.set_value("panel1", "val1", 1.5, notify=False)
+    client.set_value("panel1", "val1", [1, 2, 3], notify=False)
+    client.set_value("panel1", "val1", "value1", notify=False)
+
+    assert client.try_get_value("panel1", "val1") == "value1"
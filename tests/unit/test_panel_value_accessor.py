@@ -1,6 +1,18 @@
+import dataclasses
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
 import grpc
+import hightime as ht
+import numpy as np
+import pytest
+from google.protobuf import any_pb2
+from nitypes.waveform import AnalogWaveform, Timing
 
+import nipanel._convert
 from nipanel import PanelValueAccessor
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
 from tests.types import MyIntEnum
 from tests.utils._fake_python_panel_service import FakePythonPanelService
 
@@ -54,6 +66,42 @@ def test___set_value_if_changed___different_value_ids___tracks_separately(
     assert accessor.get_value("id2") == "new_value2"
 
 
+def test___set_value_if_changed_with_ndarray_value___set_equal_array___does_not_set_value_again(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value_if_changed("test_id", np.array([1.0, 2.0, 3.0]))
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    accessor.set_value_if_changed("test_id", np.array([1.0, 2.0, 3.0]))
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count
+
+
+@pytest.mark.parametrize(
+    "new_value",
+    [
+        np.array([1.0, 2.0, 4.0]),
+        np.array([1.0, 2.0]),
+        np.array([1, 2, 3]),
+        [1.0, 2.0, 3.0],
+    ],
+)
+def test___set_value_if_changed_with_ndarray_value___set_different_value___sets_new_value(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+    new_value: object,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value_if_changed("test_id", np.array([1.0, 2.0, 3.0]))
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    accessor.set_value_if_changed("test_id", new_value)
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+
+
 def test___set_value_if_changed_with_list_value___set_same_value___does_not_set_value_again(
     fake_panel_channel: grpc.Channel,
     fake_python_panel_service: FakePythonPanelService,
@@ -108,3 +156,637 @@ def test___set_value_if_changed_with_enum_value___set_different_value___sets_new
 
     assert fake_python_panel_service.servicer.set_count > initial_set_count
     assert accessor.get_value("test_id") == 30  # New enum value should be set
+
+
+def test___set_value_with_fingerprint___get_value_with_fingerprint___gets_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    producer.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+
+    assert consumer.get_value("test_id", fingerprint=True) == [1.0, 2.0, 3.0]
+
+
+def test___get_value_with_fingerprint___value_unchanged___does_not_fetch_value_again(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+    first_value = consumer.get_value("test_id", fingerprint=True)
+    requested_ids = fake_python_panel_service.servicer.try_get_value_ids
+    initial_fetch_count = requested_ids.count("test_id")
+
+    second_value = consumer.get_value("test_id", fingerprint=True)
+
+    assert requested_ids.count("test_id") == initial_fetch_count
+    assert second_value == first_value
+
+
+@pytest.mark.parametrize("as_numpy", [False, True])
+def test___get_value_with_fingerprint___mutate_value___next_value_unchanged(
+    fake_panel_channel: grpc.Channel, as_numpy: bool
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+    first_value = accessor.get_value("test_id", fingerprint=True, as_numpy=as_numpy)
+    assert isinstance(first_value, (list, np.ndarray))
+
+    first_value[0] = 100.0
+
+    second_value = accessor.get_value("test_id", fingerprint=True, as_numpy=as_numpy)
+    assert isinstance(second_value, (list, np.ndarray))
+    assert second_value is not first_value
+    assert list(second_value) == [1.0, 2.0, 3.0]
+
+
+def test___get_value_with_fingerprint___value_changed___fetches_new_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+    consumer.get_value("test_id", fingerprint=True)
+
+    producer.set_value("test_id", [4.0, 5.0, 6.0], fingerprint=True)
+
+    assert consumer.get_value("test_id", fingerprint=True) == [4.0, 5.0, 6.0]
+
+
+def test___fingerprinted_value___set_value_without_fingerprint___get_value_fetches_new_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+    consumer.get_value("test_id", fingerprint=True)
+
+    producer.set_value("test_id", [4.0, 5.0, 6.0])
+
+    assert consumer.get_value("test_id", fingerprint=True) == [4.0, 5.0, 6.0]
+
+
+def test___set_value_without_fingerprint___does_not_get_fingerprint(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    accessor.set_value("x", 1)
+    accessor.set_values({"y": 2})
+    accessor.set_encoded("z", accessor.encode(3))
+
+    assert fake_python_panel_service.servicer.try_get_value_ids == []
+
+
+def test___set_value_without_fingerprint___get_value_with_fingerprint___gets_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    accessor.set_value("test_id", "test_value")
+
+    assert accessor.get_value("test_id", fingerprint=True) == "test_value"
+    assert accessor.get_value("unset_id", "default", fingerprint=True) == "default"
+
+
+def test___set_value_with_fingerprint___notifies_once(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    accessor.set_value("test_id", "test_value", fingerprint=True)
+
+    assert fake_python_panel_service.servicer.notification_count == 1
+
+
+def test___float_list_value___get_value_as_numpy___returns_ndarray(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", [1.0, 2.0, 3.0])
+
+    value = accessor.get_value("test_id", as_numpy=True)
+
+    assert isinstance(value, np.ndarray)
+    assert value.dtype == np.float64
+    assert value.tolist() == [1.0, 2.0, 3.0]
+
+
+def test___float_list_value___get_value_as_numpy_with_list_default___returns_ndarray(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", [1.0, 2.0, 3.0])
+
+    value = accessor.get_value("test_id", [0.0], as_numpy=True)
+
+    assert isinstance(value, np.ndarray)
+    assert value.tolist() == [1.0, 2.0, 3.0]
+
+
+@dataclasses.dataclass
+class _Frame:
+    index: int
+    label: str
+
+
+class _Point(NamedTuple):
+    x: float
+    y: float
+
+
+@pytest.mark.parametrize(
+    "composite_value, default_value",
+    [(_Frame(3, "third"), _Frame(0, "")), (_Point(1.5, 2.5), _Point(0.0, 0.0))],
+)
+def test___composite_value___get_value_with_composite_default___returns_default_type(
+    fake_panel_channel: grpc.Channel, composite_value: object, default_value: object
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", composite_value)
+
+    value = accessor.get_value("test_id", default_value)
+
+    assert type(value) is type(composite_value)
+    assert value == composite_value
+
+
+def test___composite_value_with_other_fields___get_value_with_composite_default___raises_type_error(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", {"x": 1.5, "z": 2.5})
+
+    with pytest.raises(TypeError, match="do not match default value type _Point"):
+        _ = accessor.get_value("test_id", _Point(0.0, 0.0))
+
+
+def test___fingerprinted_value___get_value_with_and_without_numpy___returns_requested_types(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("test_id", [1.0, 2.0, 3.0], fingerprint=True)
+
+    list_value = consumer.get_value("test_id", fingerprint=True)
+    numpy_value = consumer.get_value("test_id", fingerprint=True, as_numpy=True)
+
+    assert isinstance(list_value, list)
+    assert isinstance(numpy_value, np.ndarray)
+
+
+def test___buffer_values___set_value___get_value_returns_bytes(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    data = bytearray(b"0123456789")
+
+    accessor.set_value("raw", data)
+    first_result = accessor.get_value("raw")
+    accessor.set_value("raw", memoryview(data)[2:5])
+    second_result = accessor.get_value("raw")
+
+    assert first_result == b"0123456789"
+    assert second_result == b"234"
+
+
+def test___dict_value___set_value___sets_all_fields_in_one_call(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    accessor.set_value("frame", {"time_points": [0.0, 1.0], "amplitude": 2.0})
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+    assert accessor.get_value("frame") == {"time_points": [0.0, 1.0], "amplitude": 2.0}
+
+
+def test___set_value_if_changed_with_dict_of_ndarrays___set_equal_dict___sets_value(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value_if_changed("frame", {"samples": np.array([1.0, 2.0])})
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    accessor.set_value_if_changed("frame", {"samples": np.array([1.0, 2.0])})
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+
+
+def test___set_values___get_value___gets_each_value(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveforms = [AnalogWaveform.from_array_1d(np.arange(10.0) * i) for i in range(4)]
+
+    accessor.set_values({f"channel{i}": waveform for i, waveform in enumerate(waveforms)})
+
+    for i, waveform in enumerate(waveforms):
+        result = accessor.get_value(f"channel{i}")
+        assert isinstance(result, AnalogWaveform)
+        assert np.array_equal(result.scaled_data, waveform.scaled_data)
+    assert fake_python_panel_service.servicer.notification_count == 1
+
+
+def test___set_values_with_thread_pool___get_value___gets_each_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    values = {"a": 1.5, "b": "text", "c": [1, 2, 3], "d": np.zeros((2, 3))}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        accessor.set_values(values, executor=executor)
+
+    assert accessor.get_value("a") == 1.5
+    assert accessor.get_value("b") == "text"
+    assert accessor.get_value("c") == [1, 2, 3]
+    array_value = accessor.get_value("d", as_numpy=True)
+    assert isinstance(array_value, np.ndarray)
+    assert np.array_equal(array_value, np.zeros((2, 3)))
+
+
+def test___fingerprinted_value___set_values___publishes_fingerprint(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("test_id", "first", fingerprint=True)
+    initial_notification_count = fake_python_panel_service.servicer.notification_count
+
+    accessor.set_values({"test_id": "second", "other_id": 2, "third_id": 3.5})
+
+    assert fake_python_panel_service.servicer.notification_count == initial_notification_count + 1
+    assert accessor.get_value("test_id.__fingerprint__") == nipanel._convert.get_fingerprint(
+        nipanel._convert.to_any("second")
+    )
+    assert accessor.get_value("test_id", fingerprint=True) == "second"
+    assert accessor.get_value("other_id") == 2
+    accessor.set_values({"test_id": "third"})
+    assert accessor.get_value("test_id.__fingerprint__") == nipanel._convert.get_fingerprint(
+        nipanel._convert.to_any("third")
+    )
+
+
+def test___float64_waveform___set_value_quantized___gets_waveform_within_error_bound(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = AnalogWaveform.from_array_1d(np.sin(np.linspace(0.0, 20.0, 1000)) * 5.0)
+
+    error_bound = accessor.set_value("test_id", waveform, quantize=True)
+
+    result = accessor.get_value("test_id")
+    assert isinstance(error_bound, float)
+    assert 0.0 < error_bound < 1e-3
+    assert isinstance(result, AnalogWaveform)
+    assert result.raw_data.dtype == np.int16
+    assert np.abs(result.scaled_data - waveform.scaled_data).max() <= error_bound
+
+
+def test___waveform_collection___set_value_quantized___gets_largest_error_bound(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveforms = [
+        AnalogWaveform.from_array_1d(np.linspace(-1.0, 1.0, 100) * (channel + 1))
+        for channel in range(3)
+    ]
+
+    error_bound = accessor.set_value("test_id", waveforms, quantize=True)
+
+    result = accessor.get_value("test_id")
+    assert error_bound == pytest.approx(6.0 / 65534 / 2)
+    assert isinstance(result, list)
+    assert [waveform.raw_data.dtype for waveform in result] == [np.int16] * 3
+    for quantized_waveform, waveform in zip(result, waveforms):
+        assert np.abs(quantized_waveform.scaled_data - waveform.scaled_data).max() <= error_bound
+
+
+def test___dict_with_waveform___set_value_quantized___quantizes_waveform_field(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = AnalogWaveform.from_array_1d(np.linspace(-1.0, 1.0, 100))
+
+    error_bound = accessor.set_value(
+        "test_id", {"waveform": waveform, "average": 0.5}, quantize=True
+    )
+
+    result = accessor.get_value("test_id")
+    assert error_bound == pytest.approx(2.0 / 65534 / 2)
+    assert isinstance(result, dict)
+    assert result["average"] == 0.5
+    assert result["waveform"].raw_data.dtype == np.int16
+
+
+def test___value_without_waveforms___set_value_quantized___zero_error_bound(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    error_bound = accessor.set_value("test_id", [1.5, 2.5], quantize=True)
+
+    assert error_bound == 0.0
+    assert accessor.get_value("test_id") == [1.5, 2.5]
+
+
+def test___set_value_without_quantize___returns_none(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    error_bound = accessor.set_value("test_id", AnalogWaveform.from_array_1d(np.array([1.0, 2.0])))
+
+    assert error_bound is None
+    result = accessor.get_value("test_id")
+    assert isinstance(result, AnalogWaveform)
+    assert result.raw_data.dtype == np.float64
+
+
+def test___float64_waveform___set_value_if_changed_quantized___quantizes_only_changed_value(
+    fake_python_panel_service: FakePythonPanelService,
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = AnalogWaveform.from_array_1d(np.linspace(-1.0, 1.0, 100))
+
+    first_error_bound = accessor.set_value_if_changed("test_id", waveform, quantize=True)
+    second_error_bound = accessor.set_value_if_changed("test_id", waveform, quantize=True)
+
+    result = accessor.get_value("test_id")
+    assert first_error_bound == pytest.approx(2.0 / 65534 / 2)
+    assert second_error_bound is None
+    assert fake_python_panel_service.servicer.set_count == 1
+    assert isinstance(result, AnalogWaveform)
+    assert result.raw_data.dtype == np.int16
+
+
+@pytest.mark.parametrize("option", ["metadata_once", "delta"])
+def test___quantize_with_other_encoding___set_value___throws_value_error(
+    fake_panel_channel: grpc.Channel, option: str
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = AnalogWaveform.from_array_1d(np.array([1.0, 2.0]), dtype=np.float64)
+
+    with pytest.raises(ValueError):
+        accessor.set_value("test_id", waveform, quantize=True, **{option: True})
+
+
+def _create_waveform(
+    t0_seconds: int = 0, channel_name: str = "Dev1/ai0"
+) -> AnalogWaveform[np.float64]:
+    return AnalogWaveform.from_array_1d(
+        np.array([1.5, -2.0, 3.25]),
+        dtype=np.float64,
+        timing=Timing.create_with_regular_interval(
+            ht.timedelta(milliseconds=1),
+            ht.datetime(2025, 1, 1, second=t0_seconds, tzinfo=dt.timezone.utc),
+        ),
+        extended_properties={"NI_ChannelName": channel_name, "NI_UnitDescription": "Volts"},
+    )
+
+
+def test___waveform_collection_value___mutate_got_waveforms___next_get_value_unchanged(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    # Make the waveforms large enough for the decoded value cache.
+    waveforms = [
+        AnalogWaveform.from_array_1d(
+            np.linspace(0.0, 1.0, 1000),
+            dtype=np.float64,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{channel}"},
+        )
+        for channel in range(2)
+    ]
+    accessor.set_value("test_id", waveforms)
+    first_value = accessor.get_value("test_id")
+    assert isinstance(first_value, list)
+
+    first_value[0].raw_data[0] = 100.0
+    first_value[0].extended_properties["NI_ChannelName"] = "Dev1/ai7"
+    first_value.pop()
+
+    second_value = accessor.get_value("test_id")
+    assert isinstance(second_value, list)
+    assert len(second_value) == 2
+    assert np.array_equal(second_value[0].raw_data, waveforms[0].raw_data)
+    assert second_value[0].extended_properties["NI_ChannelName"] == "Dev1/ai0"
+
+
+@pytest.mark.parametrize(
+    "waveform",
+    [
+        _create_waveform(),
+        AnalogWaveform.from_array_1d(
+            np.array([1.0, 2.0]),
+            dtype=np.float64,
+            timing=Timing.create_with_irregular_interval(
+                [ht.datetime(2025, 1, 1, second=s, tzinfo=dt.timezone.utc) for s in (0, 3)]
+            ),
+        ),
+        AnalogWaveform(0),
+    ],
+)
+def test___set_value_with_metadata_once___get_value___gets_whole_waveform(
+    fake_panel_channel: grpc.Channel,
+    waveform: AnalogWaveform[np.float64],
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    producer.set_value("waveform", waveform, metadata_once=True)
+    result = consumer.get_value("waveform")
+
+    assert result == nipanel._convert.from_any(nipanel._convert.to_any(waveform))
+
+
+def test___set_value_with_metadata_once___metadata_unchanged___sets_only_samples(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("waveform", _create_waveform(t0_seconds=0), metadata_once=True)
+    consumer.get_value("waveform")
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    producer.set_value("waveform", _create_waveform(t0_seconds=1), metadata_once=True)
+    result = consumer.get_value("waveform")
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+    assert result == nipanel._convert.from_any(
+        nipanel._convert.to_any(_create_waveform(t0_seconds=1))
+    )
+
+
+def test___set_value_with_metadata_once___smaller_than_whole_waveform(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = _create_waveform()
+
+    accessor.set_value("waveform", waveform, metadata_once=True)
+
+    samples_any = accessor._panel_client.try_get_value_any("panel_id", "waveform")
+    assert isinstance(samples_any, any_pb2.Any)
+    assert samples_any.Is(waveform_pb2_nipanel.DoubleAnalogWaveformSamples.DESCRIPTOR)
+    assert len(samples_any.value) < len(nipanel._convert.to_any(waveform).value) / 2
+
+
+def test___set_value_with_metadata_once___metadata_changed___get_value_gets_new_metadata(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("waveform", _create_waveform(channel_name="Dev1/ai0"), metadata_once=True)
+    consumer.get_value("waveform")
+
+    producer.set_value("waveform", _create_waveform(channel_name="Dev1/ai1"), metadata_once=True)
+    result = consumer.get_value("waveform")
+
+    assert isinstance(result, AnalogWaveform)
+    assert result.channel_name == "Dev1/ai1"
+
+
+def test___set_value_with_metadata_once___set_value_without___gets_whole_waveform(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    accessor.set_value("waveform", _create_waveform(channel_name="Dev1/ai0"), metadata_once=True)
+
+    accessor.set_value("waveform", _create_waveform(channel_name="Dev1/ai1"))
+    result = accessor.get_value("waveform")
+
+    assert isinstance(result, AnalogWaveform)
+    assert result.channel_name == "Dev1/ai1"
+
+
+def test___set_value_with_metadata_once_and_fingerprint___get_value___gets_whole_waveform(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveform = _create_waveform()
+
+    producer.set_value("waveform", waveform, fingerprint=True, metadata_once=True)
+
+    assert consumer.get_value("waveform", fingerprint=True) == nipanel._convert.from_any(
+        nipanel._convert.to_any(waveform)
+    )
+
+
+@pytest.mark.parametrize("value", [[1.0, 2.0], AnalogWaveform(3, np.int16)])
+def test___not_float64_waveform___set_value_with_metadata_once___throws_type_error(
+    fake_panel_channel: grpc.Channel,
+    value: object,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    with pytest.raises(TypeError):
+        accessor.set_value("waveform", value, metadata_once=True)
+
+
+def test___metadata_does_not_match_samples___get_value___throws_runtime_error(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("waveform", _create_waveform(), metadata_once=True)
+    # Metadata from another producer that never sets samples that go with it.
+    other_metadata_any = any_pb2.Any()
+    other_metadata_any.Pack(waveform_pb2_nipanel.DoubleAnalogWaveformMetadata(generation=0))
+    producer._panel_client.set_value_any(
+        "panel_id", "waveform.__metadata__", other_metadata_any, notify=False
+    )
+
+    with pytest.raises(RuntimeError):
+        consumer.get_value("waveform")
+
+
+def test___set_value_with_delta___get_value___gets_array(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    spectrum = np.linspace(0.0, 1.0, 1000)
+
+    producer.set_value("spectrum", spectrum, delta=True)
+    result = consumer.get_value("spectrum")
+
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, spectrum)
+
+
+def test___set_value_with_delta___few_elements_changed___sets_only_changes(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    spectrum = np.linspace(0.0, 1.0, 1000)
+    producer.set_value("spectrum", spectrum, delta=True)
+    consumer.get_value("spectrum")
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    spectrum[500] = 2.0
+    producer.set_value("spectrum", spectrum, delta=True)
+    result = consumer.get_value("spectrum")
+
+    delta_any = producer._panel_client.try_get_value_any("panel_id", "spectrum")
+    assert isinstance(delta_any, any_pb2.Any)
+    assert len(delta_any.value) < 32
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, spectrum)
+
+
+def test___set_value_with_delta___get_value_misses_deltas___gets_latest_array(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    heatmap = np.zeros((100, 100))
+    producer.set_value("heatmap", heatmap, delta=True)
+    consumer.get_value("heatmap")
+
+    for row in range(10):
+        heatmap[row, :] = row
+        producer.set_value("heatmap", heatmap, delta=True)
+    result = consumer.get_value("heatmap")
+
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, heatmap)
+
+
+def test___set_value_with_delta___shape_changed___get_value_gets_new_keyframe(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    producer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    consumer = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    producer.set_value("spectrum", np.zeros(1000), delta=True)
+    consumer.get_value("spectrum")
+
+    producer.set_value("spectrum", np.ones(500), delta=True)
+    result = consumer.get_value("spectrum")
+
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [1.0] * 500
+
+
+def test___not_ndarray___set_value_with_delta___throws_type_error(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+
+    with pytest.raises(TypeError):
+        accessor.set_value("spectrum", [1.0, 2.0], delta=True)
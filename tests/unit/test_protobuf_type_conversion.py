@@ -1,8 +1,9 @@
+import numpy as np
 import pytest
 from ni.protobuf.types import array_pb2, attribute_value_pb2, scalar_pb2, vector_pb2
 from nitypes.scalar import Scalar
 from nitypes.vector import Vector
-from typing_extensions import Mapping
+from typing_extensions import Any, Mapping
 
 from nipanel.converters.protobuf_types import (
     Double2DArrayConverter,
@@ -43,6 +44,31 @@ def test___list_of_lists_inconsistent_column_length___convert___throws_value_err
         _ = converter.to_protobuf_message([[1.0, 2.0], [3.0, 4.0, 5.0]])
 
 
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]),
+        np.asfortranarray([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]),
+        np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]).T,
+        np.array([[1, 2, 3], [4, 5, 6]], np.float32),
+    ],
+)
+def test___2d_ndarray___convert___valid_double2darray(array: np.ndarray[Any, Any]) -> None:
+    converter = Double2DArrayConverter()
+    result = converter.to_protobuf_message(array)
+
+    assert result.data == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert result.rows == 2
+    assert result.columns == 3
+
+
+def test___3d_ndarray___convert___throws_value_error() -> None:
+    converter = Double2DArrayConverter()
+
+    with pytest.raises(ValueError):
+        _ = converter.to_protobuf_message(np.zeros((2, 2, 2)))
+
+
 # ========================================================
 # Double2DArray to list[list[float]]
 # Other collection types are tested in test_convert.py
@@ -86,6 +112,25 @@ def test___double2darray_empty_data___convert___returns_empty_list() -> None:
     assert not list_of_lists
 
 
+def test___double2darray___convert_to_numpy___valid_2d_ndarray() -> None:
+    double2darray = array_pb2.Double2DArray(rows=2, columns=3, data=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    converter = Double2DArrayConverter()
+
+    array = converter.to_numpy_value(double2darray)
+
+    assert array.shape == (2, 3)
+    assert array.dtype == np.float64
+    assert array.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def test___double2darray_invalid_num_rows___convert_to_numpy___throws_value_error() -> None:
+    double2darray = array_pb2.Double2DArray(rows=2, columns=2, data=[1.0, 2.0])
+    converter = Double2DArrayConverter()
+
+    with pytest.raises(ValueError):
+        _ = converter.to_numpy_value(double2darray)
+
+
 # ========================================================
 # Scalar: Protobuf to Python
 # ========================================================
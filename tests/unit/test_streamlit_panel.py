@@ -313,6 +313,22 @@ def test___enum_type___set_value___gets_same_value(
     assert panel.get_value(value_id) == value_payload.value
 
 
+def test___dict_type___set_value___gets_same_value(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    """Test that set_value() and get_value() work for dicts of supported types."""
+    panel = StreamlitPanel("my_panel", PATH_TO_SCRIPT, grpc_channel=fake_panel_channel)
+    value_payload = {
+        "key1": [1, 2, 3],
+        "key2": {"nested": True, "values": [4.5, 6.7]},
+    }
+
+    value_id = "test_id"
+    panel.set_value(value_id, value_payload)
+
+    assert panel.get_value(value_id) == value_payload
+
+
 @pytest.mark.parametrize(
     "value_payload",
     [
@@ -324,8 +340,9 @@ def test___enum_type___set_value___gets_same_value(
         (i for i in range(5)),
         {
             "key1": [1, 2, 3],
-            "key2": {"nested": True, "values": [4.5, 6.7]},
+            "key2": {"nested": True, "values": [4.5, object()]},
         },
+        {1: "non-str key"},
     ],
 )
 def test___unsupported_type___set_value___raises(
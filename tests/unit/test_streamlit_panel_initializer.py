@@ -0,0 +1,59 @@
+import grpc
+from pytest_mock import MockerFixture
+
+import nipanel._streamlit_panel_initializer
+from nipanel import PanelValueAccessor
+from nipanel._streamlit_panel_initializer import _sync_session_state
+from tests.utils._fake_python_panel_service import FakePythonPanelService
+
+
+def test___supported_and_unsupported_values___sync_session_state___sets_supported_values(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+    mocker: MockerFixture,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    session_state = {"slider": 1.0, "text": "value", "unsupported": {"key": object()}}
+    mocker.patch("streamlit.session_state", session_state)
+
+    _sync_session_state(accessor)
+
+    assert fake_python_panel_service.servicer.set_count == 2
+    assert accessor.get_value("slider") == 1.0
+    assert accessor.get_value("text") == "value"
+
+
+def test___unchanged_values___sync_session_state___does_not_set_values_again(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+    mocker: MockerFixture,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    session_state = {"slider": 1.0, "list": [1, 2, 3], "unsupported": {"key": object()}}
+    mocker.patch("streamlit.session_state", session_state)
+    _sync_session_state(accessor)
+    initial_set_count = fake_python_panel_service.servicer.set_count
+    is_supported_type_spy = mocker.spy(nipanel._streamlit_panel_initializer, "is_supported_type")
+
+    _sync_session_state(accessor)
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count
+    assert is_supported_type_spy.call_count == 1  # only the unsupported value is classified
+
+
+def test___changed_value___sync_session_state___sets_only_changed_value(
+    fake_panel_channel: grpc.Channel,
+    fake_python_panel_service: FakePythonPanelService,
+    mocker: MockerFixture,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    session_state: dict[str, object] = {"slider": 1.0, "text": "value"}
+    mocker.patch("streamlit.session_state", session_state)
+    _sync_session_state(accessor)
+    initial_set_count = fake_python_panel_service.servicer.set_count
+
+    session_state["slider"] = 2.0
+    _sync_session_state(accessor)
+
+    assert fake_python_panel_service.servicer.set_count == initial_set_count + 1
+    assert accessor.get_value("slider") == 2.0
@@ -0,0 +1,155 @@
+import datetime as dt
+from typing import Any
+
+import grpc
+import hightime as ht
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.time import convert_datetime
+
+import nipanel._convert
+from nipanel import LazyValue, PanelValueAccessor
+from nipanel._protos import array_pb2
+from nipanel.converters.timestamp_types import TimestampCollectionConverter
+
+_UTC = dt.timezone.utc
+
+
+def _create_timestamps(count: int) -> list[ht.datetime]:
+    t0 = ht.datetime(2025, 3, 4, 5, 6, 7, 890123, femtosecond=456789012, tzinfo=_UTC)
+    return [
+        t0 + ht.timedelta(microseconds=index * 37, femtoseconds=index) for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "python_value",
+    [
+        _create_timestamps(5),
+        tuple(_create_timestamps(5)),
+        [ht.datetime(1904, 1, 1, tzinfo=_UTC), ht.datetime(1903, 12, 31, 23, 59, 59, tzinfo=_UTC)],
+        [ht.datetime(9999, 12, 31, 23, 59, 59, 999999, femtosecond=999999999, tzinfo=_UTC)],
+        [dt.datetime(2025, 3, 4, 5, 6, 7, 890123, tzinfo=_UTC)],
+    ],
+)
+def test___timestamps___to_any_and_from_any___equal_timestamps(
+    python_value: list[dt.datetime],
+) -> None:
+    protobuf_any = nipanel._convert.to_any(python_value)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(array_pb2.TimestampArray.DESCRIPTOR)
+    assert isinstance(result, list)
+    assert all(isinstance(value, ht.datetime) for value in result)
+    assert all(value.tzinfo == _UTC for value in result)
+    assert result == list(python_value)
+
+
+def test___empty_timestamps___to_any_and_from_any___empty_list() -> None:
+    converter = TimestampCollectionConverter()
+
+    protobuf_any = converter.to_protobuf_any([])
+    result = converter.to_python(protobuf_any)
+    numpy_result: Any = converter.to_python_numpy(protobuf_any)
+
+    assert result == []
+    assert numpy_result.dtype == np.dtype("datetime64[ns]")
+    assert numpy_result.size == 0
+
+
+def test___naive_timestamps___to_any_and_from_any___equal_utc_timestamps() -> None:
+    python_value = [dt.datetime(2025, 3, 4, 5, 6, 7, 890123), dt.datetime(1970, 1, 1)]
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+    assert result == [value.replace(tzinfo=_UTC) for value in python_value]
+
+
+def test___timestamps_in_other_time_zone___to_any_and_from_any___equal_utc_timestamps() -> None:
+    time_zone = dt.timezone(dt.timedelta(hours=-6))
+    python_value = [dt.datetime(2025, 3, 4, 23, 30, tzinfo=time_zone)]
+
+    result: Any = nipanel._convert.from_any(nipanel._convert.to_any(python_value))
+
+    assert result == python_value
+    assert result[0] == ht.datetime(2025, 3, 5, 5, 30, tzinfo=_UTC)
+
+
+def test___mixed_naive_and_aware_timestamps___to_any___throws_type_error() -> None:
+    python_value = [dt.datetime(2025, 1, 1, tzinfo=_UTC), dt.datetime(2025, 1, 1)]
+
+    with pytest.raises(TypeError):
+        _ = nipanel._convert.to_any(python_value)
+
+
+def test___timestamps___convert___same_as_precision_timestamps() -> None:
+    python_value = _create_timestamps(3)
+    converter = TimestampCollectionConverter()
+
+    result = converter.to_protobuf_message(python_value)
+
+    seconds = np.frombuffer(result.seconds, dtype="<i8")
+    fractional_seconds = np.frombuffer(result.fractional_seconds, dtype="<u8")
+    for value, value_seconds, value_fractional_seconds in zip(
+        python_value, seconds, fractional_seconds
+    ):
+        expected = convert_datetime(bt.DateTime, value).to_tuple()
+        assert value_seconds == expected.whole_seconds
+        assert abs(int(value_fractional_seconds) - expected.fractional_seconds) <= 1
+
+
+def test___timestamps___convert_to_any___same_as_packed_message() -> None:
+    python_value = _create_timestamps(3)
+    converter = TimestampCollectionConverter()
+
+    result = converter.to_protobuf_any(python_value)
+
+    assert result.value == converter.to_protobuf_message(python_value).SerializeToString()
+
+
+def test___timestamps___from_any_as_numpy___datetime64_array() -> None:
+    python_value = [
+        dt.datetime(2025, 3, 4, 5, 6, 7, 890123, tzinfo=_UTC),
+        ht.datetime(2025, 3, 4, 5, 6, 7, 890123, femtosecond=456789012, tzinfo=_UTC),
+    ]
+    protobuf_any = nipanel._convert.to_any(python_value)
+
+    result = nipanel._convert.from_any(protobuf_any, as_numpy=True)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.dtype("datetime64[ns]")
+    assert result.tolist() == [
+        np.datetime64("2025-03-04T05:06:07.890123000", "ns").astype(int),
+        np.datetime64("2025-03-04T05:06:07.890123457", "ns").astype(int),
+    ]
+
+
+def test___timestamp_array_with_mismatched_lengths___convert___throws_value_error() -> None:
+    message = array_pb2.TimestampArray(seconds=b"\x00" * 16, fractional_seconds=b"\x00" * 8)
+    converter = TimestampCollectionConverter()
+
+    with pytest.raises(ValueError):
+        _ = converter.to_python_value(message)
+
+
+def test___timestamps___from_any_lazy___sample_count_without_decoding() -> None:
+    protobuf_any = nipanel._convert.to_any(_create_timestamps(7))
+
+    result = nipanel._convert.from_any(protobuf_any, lazy=True)
+
+    assert isinstance(result, LazyValue)
+    assert result.sample_count == 7
+    assert result.dtype == np.dtype("datetime64[ns]")
+    assert not result.is_decoded
+
+
+def test___timestamps___set_value_and_get_value___equal_timestamps(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    python_value = _create_timestamps(10)
+
+    accessor.set_value("timestamps", python_value)
+
+    assert accessor.get_value("timestamps") == python_value
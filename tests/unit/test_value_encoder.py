@@ -0,0 +1,135 @@
+import threading
+from unittest.mock import patch
+
+import numpy as np
+from google.protobuf import wrappers_pb2
+from ni.panels.v1.panel_service_pb2 import SetValueRequest
+
+from nipanel._convert import from_any, to_any
+from nipanel._value_encoder import _ValueEncoder
+from nipanel.converters.numpy_types import NDArrayConverter
+
+
+def test___same_type___encode_twice___reuses_request() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    requests: list[SetValueRequest] = []
+    values: list[object] = []
+
+    def send(request: SetValueRequest) -> None:
+        requests.append(request)
+        values.append((from_any(request.value), request.notify))
+
+    encoder.encode_and_send(1.5, False, send)
+    encoder.encode_and_send(2.5, True, send)
+
+    assert requests[0] is requests[1]
+    assert values == [(1.5, False), (2.5, True)]
+    assert requests[1].panel_id == "panel_id"
+    assert requests[1].value_id == "value_id"
+
+
+def test___ndarray___encode___same_as_to_any() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    value = np.arange(12, dtype=np.float32).reshape(3, 4)
+    sent: list[bool] = []
+
+    encoder.encode_and_send(
+        value, False, lambda request: sent.append(request.value == to_any(value))
+    )
+
+    assert sent == [True]
+
+
+def test___ndarray___encode___uses_to_protobuf_any() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    value = np.arange(12, dtype=np.float32).reshape(3, 4)
+    sent: list[SetValueRequest] = []
+
+    with patch.object(
+        NDArrayConverter,
+        "to_protobuf_any",
+        autospec=True,
+        side_effect=NDArrayConverter.to_protobuf_any,
+    ) as to_protobuf_any:
+        encoder.encode_and_send(value, True, sent.append)
+
+    to_protobuf_any.assert_called_once()
+    assert sent[0].value == to_any(value)
+    assert sent[0].notify
+
+
+def test___long_string___encode___does_not_hold_payload_after_send() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    sent_sizes: list[int] = []
+
+    encoder.encode_and_send(
+        "x" * 1_000_000, False, lambda request: sent_sizes.append(len(request.value.value))
+    )
+
+    assert sent_sizes[0] > 1_000_000
+    assert encoder._request.value.value == b""
+    assert encoder._message is not None and encoder._message.ByteSize() == 0
+
+
+def test___ndarray___encode___does_not_hold_payload_after_send() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+
+    encoder.encode_and_send(np.zeros(1_000_000), False, lambda request: None)
+
+    assert encoder._request.value.value == b""
+    assert encoder._message is None
+
+
+def test___different_types___encode___type_url_follows_value() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    values: list[object] = [1.5, "text", [1, 2, 3], 7, b"bytes", 2.5]
+    results: list[object] = []
+
+    for value in values:
+        encoder.encode_and_send(
+            value, False, lambda request: results.append(from_any(request.value))
+        )
+
+    assert results == values
+
+
+def test___encoder_in_use___encode___uses_new_request() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    requests: list[SetValueRequest] = []
+    values: list[object] = []
+
+    def send_inner(request: SetValueRequest) -> None:
+        requests.append(request)
+        values.append(from_any(request.value))
+
+    def send_outer(request: SetValueRequest) -> None:
+        requests.append(request)
+        encoder.encode_and_send("inner", False, send_inner)
+        values.append(from_any(request.value))
+
+    encoder.encode_and_send(1.5, False, send_outer)
+
+    assert requests[0] is not requests[1]
+    assert values == ["inner", 1.5]
+
+
+def test___encoder___encode_from_threads___each_value_is_intact() -> None:
+    encoder = _ValueEncoder("panel_id", "value_id")
+    errors: list[int] = []
+
+    def encode_values(offset: int) -> None:
+        for i in range(200):
+
+            def send(request: SetValueRequest, expected: int = offset + i) -> None:
+                if wrappers_pb2.Int64Value.FromString(request.value.value).value != expected:
+                    errors.append(expected)
+
+            encoder.encode_and_send(offset + i, False, send)
+
+    threads = [threading.Thread(target=encode_values, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
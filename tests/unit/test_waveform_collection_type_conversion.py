@@ -0,0 +1,212 @@
+import datetime as dt
+from typing import Any
+
+import grpc
+import hightime as ht
+import numpy as np
+import pytest
+from nitypes.waveform import AnalogWaveform, ComplexWaveform, Spectrum, Timing
+
+import nipanel._convert
+from nipanel import PanelValueAccessor
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel.converters.waveform_collection_types import (
+    DoubleAnalogWaveformCollectionConverter,
+    DoubleSpectrumCollectionConverter,
+    QuantizedAnalogWaveformCollectionConverter,
+)
+
+_REGULAR_TIMING = Timing.create_with_regular_interval(
+    ht.timedelta(milliseconds=1), ht.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+)
+_IRREGULAR_TIMING = Timing.create_with_irregular_interval(
+    [ht.datetime(2025, 1, 1, second=second, tzinfo=dt.timezone.utc) for second in (0, 1, 4)]
+)
+
+
+def _create_analog_waveforms(*timings: Timing[Any, Any, Any]) -> list[AnalogWaveform[np.float64]]:
+    return [
+        AnalogWaveform.from_array_1d(
+            np.array([1.5, -2.0, 3.25]) * (channel + 1),
+            dtype=np.float64,
+            timing=timing,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{channel}", "NI_UnitDescription": "V"},
+        )
+        for channel, timing in enumerate(timings)
+    ]
+
+
+@pytest.mark.parametrize(
+    "timings",
+    [
+        [_REGULAR_TIMING, _REGULAR_TIMING],
+        [_IRREGULAR_TIMING, _IRREGULAR_TIMING],
+        [Timing.empty, Timing.empty],
+        [_REGULAR_TIMING, _IRREGULAR_TIMING, Timing.empty],
+        [_REGULAR_TIMING],
+    ],
+)
+def test___analog_waveforms___to_any_and_from_any___same_as_each_waveform(
+    timings: list[Timing[Any, Any, Any]],
+) -> None:
+    waveforms = _create_analog_waveforms(*timings)
+
+    protobuf_any = nipanel._convert.to_any(waveforms)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(waveform_pb2_nipanel.DoubleAnalogWaveformCollection.DESCRIPTOR)
+    assert isinstance(result, list)
+    assert result == [
+        nipanel._convert.from_any(nipanel._convert.to_any(waveform)) for waveform in waveforms
+    ]
+    assert [waveform.channel_name for waveform in result] == [
+        waveform.channel_name for waveform in waveforms
+    ]
+
+
+def test___analog_waveforms_with_same_timing___convert___timing_sent_once() -> None:
+    waveforms = _create_analog_waveforms(_REGULAR_TIMING, _REGULAR_TIMING)
+    converter = DoubleAnalogWaveformCollectionConverter()
+
+    result = converter.to_protobuf_message(waveforms)
+
+    assert result.HasField("timing")
+    assert result.timing.dt == 0.001
+    assert all(not waveform.HasField("t0") and waveform.dt == 0 for waveform in result.waveforms)
+    assert list(result.waveforms[1].y_data) == [3.0, -4.0, 6.5]
+
+
+def test___analog_waveforms_with_different_timing___convert___timing_sent_with_each() -> None:
+    waveforms = _create_analog_waveforms(_REGULAR_TIMING, _IRREGULAR_TIMING)
+    converter = DoubleAnalogWaveformCollectionConverter()
+
+    result = converter.to_protobuf_message(waveforms)
+
+    assert not result.HasField("timing")
+    assert result.waveforms[0].dt == 0.001
+    assert len(result.waveforms[1].timestamps) == 3
+
+
+def test___tuple_of_analog_waveforms___to_any___collection_proto() -> None:
+    waveforms = tuple(_create_analog_waveforms(_REGULAR_TIMING, _REGULAR_TIMING))
+
+    result = nipanel._convert.to_any(waveforms)
+
+    assert result.Is(waveform_pb2_nipanel.DoubleAnalogWaveformCollection.DESCRIPTOR)
+
+
+def test___int16_analog_waveforms___to_any___throws_type_error() -> None:
+    waveforms = [AnalogWaveform(3, np.int16), AnalogWaveform(3, np.int16)]
+
+    with pytest.raises(TypeError):
+        _ = nipanel._convert.to_any(waveforms)
+
+
+def test___empty_collection___convert___empty_list() -> None:
+    converter = DoubleAnalogWaveformCollectionConverter()
+
+    result = converter.to_python(converter.to_protobuf_any([]))
+
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    "timings",
+    [[_REGULAR_TIMING, _REGULAR_TIMING], [_REGULAR_TIMING, _IRREGULAR_TIMING]],
+)
+def test___analog_waveforms___convert_quantized___within_error_bound(
+    timings: list[Timing[Any, Any, Any]],
+) -> None:
+    waveforms = _create_analog_waveforms(*timings)
+    converter = QuantizedAnalogWaveformCollectionConverter()
+
+    message, error_bound = converter.to_quantized_message(waveforms)
+    result = converter.to_python_value(message)
+
+    assert message.HasField("timing") == (timings[0] == timings[1])
+    assert error_bound == pytest.approx(np.ptp(waveforms[1].scaled_data) / 65534 / 2)
+    for quantized_waveform, waveform in zip(result, waveforms):
+        assert quantized_waveform.raw_data.dtype == np.int16
+        assert np.abs(quantized_waveform.scaled_data - waveform.scaled_data).max() <= error_bound
+        round_tripped_waveform = nipanel._convert.from_any(nipanel._convert.to_any(waveform))
+        assert isinstance(round_tripped_waveform, AnalogWaveform)
+        assert quantized_waveform.timing == round_tripped_waveform.timing
+        assert quantized_waveform.channel_name == waveform.channel_name
+
+
+def test___analog_waveforms___to_any___not_quantized() -> None:
+    waveforms = _create_analog_waveforms(_REGULAR_TIMING, _REGULAR_TIMING)
+
+    result = nipanel._convert.to_any(waveforms)
+
+    assert result.Is(waveform_pb2_nipanel.DoubleAnalogWaveformCollection.DESCRIPTOR)
+
+
+@pytest.mark.parametrize(
+    "timings",
+    [[_REGULAR_TIMING, _REGULAR_TIMING], [_REGULAR_TIMING, _IRREGULAR_TIMING]],
+)
+def test___complex_waveforms___to_any_and_from_any___same_as_each_waveform(
+    timings: list[Timing[Any, Any, Any]],
+) -> None:
+    waveforms = [
+        ComplexWaveform.from_array_1d(
+            np.array([1 + 2j, -3.5j, 4.0]) * (channel + 1),
+            dtype=np.complex128,
+            timing=timing,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{channel}"},
+        )
+        for channel, timing in enumerate(timings)
+    ]
+
+    protobuf_any = nipanel._convert.to_any(waveforms)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(waveform_pb2_nipanel.DoubleComplexWaveformCollection.DESCRIPTOR)
+    assert result == [
+        nipanel._convert.from_any(nipanel._convert.to_any(waveform)) for waveform in waveforms
+    ]
+
+
+@pytest.mark.parametrize("start_frequencies", [(10.0, 10.0), (10.0, 20.0)])
+def test___spectrums___to_any_and_from_any___equal_spectrums(
+    start_frequencies: tuple[float, float],
+) -> None:
+    spectrums = [
+        Spectrum.from_array_1d(
+            np.array([0.5, 1.5, 2.5]) * (index + 1),
+            dtype=np.float64,
+            start_frequency=start_frequency,
+            frequency_increment=2.5,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{index}"},
+        )
+        for index, start_frequency in enumerate(start_frequencies)
+    ]
+    converter = DoubleSpectrumCollectionConverter()
+
+    protobuf_any = nipanel._convert.to_any(spectrums)
+    result = nipanel._convert.from_any(protobuf_any)
+
+    assert protobuf_any.Is(waveform_pb2_nipanel.DoubleSpectrumCollection.DESCRIPTOR)
+    assert result == spectrums
+    assert converter.to_protobuf_message(spectrums).HasField("frequencies") == (
+        start_frequencies[0] == start_frequencies[1]
+    )
+
+
+def test___analog_waveforms___set_value_and_get_value___same_as_each_waveform(
+    fake_panel_channel: grpc.Channel,
+) -> None:
+    accessor = PanelValueAccessor(panel_id="panel_id", grpc_channel=fake_panel_channel)
+    waveforms = _create_analog_waveforms(_REGULAR_TIMING, _REGULAR_TIMING)
+
+    accessor.set_value("waveforms", waveforms)
+    result = accessor.get_value("waveforms")
+
+    assert isinstance(result, list)
+    assert [waveform.scaled_data.tolist() for waveform in result] == [
+        waveform.scaled_data.tolist() for waveform in waveforms
+    ]
+    assert all(
+        waveform.timing.sample_interval == ht.timedelta(milliseconds=1) for waveform in result
+    )
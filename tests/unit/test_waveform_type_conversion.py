@@ -0,0 +1,351 @@
+import datetime as dt
+from typing import Any
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from ni.protobuf.types import precision_timestamp_conversion, waveform_pb2
+from nitypes.waveform import (
+    AnalogWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    NoneScaleMode,
+    SampleIntervalMode,
+    Timing,
+)
+from pytest_mock import MockerFixture
+
+import nipanel
+import nipanel._convert
+from nipanel._protos import waveform_pb2 as waveform_pb2_nipanel
+from nipanel.converters.waveform_types import (
+    Int8AnalogWaveformConverter,
+    Int32AnalogWaveformConverter,
+    PackedDigitalWaveformConverter,
+    QuantizedAnalogWaveformConverter,
+    quantize_analog_waveform,
+)
+
+EXPECTED_SAMPLE_INTERVAL = dt.timedelta(milliseconds=100)
+EXPECTED_T0_DT = dt.datetime(2000, 12, 1, tzinfo=dt.timezone.utc)
+
+
+# ========================================================
+# Raw AnalogWaveform to protobuf
+# ========================================================
+def test___int8_analog_waveform___convert___one_byte_per_sample() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1, -2, 127], dtype=np.int8), scale_mode=LinearScaleMode(0.5, 1.0)
+    )
+    analog_waveform.channel_name = "Dev1/ai0"
+    analog_waveform.timing = Timing.create_with_regular_interval(
+        EXPECTED_SAMPLE_INTERVAL, EXPECTED_T0_DT
+    )
+
+    converter = Int8AnalogWaveformConverter()
+    analog_waveform_proto = converter.to_protobuf_message(analog_waveform)
+
+    assert analog_waveform_proto.y_data == b"\x01\xfe\x7f"
+    assert analog_waveform_proto.scale.linear_scale == waveform_pb2.LinearScale(
+        gain=0.5, offset=1.0
+    )
+    assert analog_waveform_proto.dt == EXPECTED_SAMPLE_INTERVAL.total_seconds()
+    assert analog_waveform_proto.t0 == precision_timestamp_conversion.bintime_datetime_to_protobuf(
+        bt.DateTime(EXPECTED_T0_DT)
+    )
+    assert analog_waveform_proto.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+
+
+def test___int32_analog_waveform___convert___four_little_endian_bytes_per_sample() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1, -2], dtype=np.int32))
+
+    converter = Int32AnalogWaveformConverter()
+    analog_waveform_proto = converter.to_protobuf_message(analog_waveform)
+
+    assert analog_waveform_proto.y_data == b"\x01\x00\x00\x00\xfe\xff\xff\xff"
+    assert not analog_waveform_proto.HasField("scale")
+
+
+# ========================================================
+# Raw AnalogWaveform from protobuf
+# ========================================================
+def test___int8_analog_waveform_proto___convert___raw_data_with_scale_mode() -> None:
+    analog_waveform_proto = waveform_pb2_nipanel.I8AnalogWaveform(
+        dt=EXPECTED_SAMPLE_INTERVAL.total_seconds(),
+        y_data=b"\x01\xfe\x7f",
+        scale=waveform_pb2.Scale(linear_scale=waveform_pb2.LinearScale(gain=0.5, offset=1.0)),
+    )
+
+    converter = Int8AnalogWaveformConverter()
+    analog_waveform = converter.to_python_value(analog_waveform_proto)
+
+    assert analog_waveform.raw_data.dtype == np.int8
+    assert list(analog_waveform.raw_data) == [1, -2, 127]
+    assert analog_waveform.scale_mode == LinearScaleMode(0.5, 1.0)
+    assert list(analog_waveform.scaled_data) == [1.5, 0.0, 64.5]
+    assert analog_waveform.timing.sample_interval == EXPECTED_SAMPLE_INTERVAL
+
+
+# ========================================================
+# Raw AnalogWaveform round trip
+# ========================================================
+@pytest.mark.parametrize("dtype", [np.int8, np.int32])
+@pytest.mark.parametrize(
+    "timing",
+    [
+        Timing.create_with_no_interval(),
+        Timing.create_with_regular_interval(EXPECTED_SAMPLE_INTERVAL, EXPECTED_T0_DT),
+        Timing.create_with_irregular_interval(
+            [EXPECTED_T0_DT + i * EXPECTED_SAMPLE_INTERVAL for i in range(3)]
+        ),
+    ],
+)
+def test___raw_analog_waveform___to_any_and_from_any___same_samples_scale_and_timing(
+    dtype: type, timing: Timing[Any, Any, Any]
+) -> None:
+    raw_data: np.ndarray[Any, Any] = np.array(
+        [np.iinfo(dtype).min, 0, np.iinfo(dtype).max], dtype=dtype
+    )
+    analog_waveform = AnalogWaveform.from_array_1d(
+        raw_data, scale_mode=LinearScaleMode(2.0, -1.0), timing=timing
+    )
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(analog_waveform))
+
+    assert isinstance(result, AnalogWaveform)
+    assert result.raw_data.dtype == dtype
+    assert np.array_equal(result.raw_data, raw_data)
+    assert np.array_equal(result.scaled_data, analog_waveform.scaled_data)
+    assert result.timing.sample_interval_mode == timing.sample_interval_mode
+    if timing.has_start_time:
+        assert result.timing.start_time == timing.start_time
+    if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        assert list(result.timing.get_timestamps(0, 3)) == list(timing.get_timestamps(0, 3))
+
+
+def test___unscaled_int8_analog_waveform___to_any_and_from_any___no_scale_mode() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1, 2], dtype=np.int8))
+
+    result = nipanel._convert.from_any(nipanel._convert.to_any(analog_waveform))
+
+    assert isinstance(result, AnalogWaveform)
+    assert isinstance(result.scale_mode, NoneScaleMode)
+    assert list(result.scaled_data) == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("dtype, bytes_per_sample", [(np.int8, 1), (np.int32, 4)])
+def test___raw_analog_waveform___to_any___smaller_than_float64_waveform(
+    dtype: type, bytes_per_sample: int
+) -> None:
+    raw_data: np.ndarray[Any, Any] = np.arange(10_000).astype(dtype)
+    analog_waveform = AnalogWaveform.from_array_1d(raw_data, scale_mode=LinearScaleMode(0.1, 0))
+
+    raw_size = len(nipanel._convert.to_any(analog_waveform).value)
+    float64_size = len(
+        nipanel._convert.to_any(AnalogWaveform.from_array_1d(analog_waveform.scaled_data)).value
+    )
+
+    assert raw_size < raw_data.size * bytes_per_sample + 64
+    assert float64_size >= raw_data.size * 8
+
+
+# ========================================================
+# QuantizedAnalogWaveform
+# ========================================================
+@pytest.mark.parametrize(
+    "scaled_data",
+    [
+        np.sin(np.linspace(0.0, 20.0, 10_000)) * 5.0,
+        np.linspace(-1e-6, 3e-6, 1000),
+        np.array([1e9, 1e9 + 1.0, 1e9 - 3.0]),
+        np.array([-32768.0, 0.0, 32767.0]),
+    ],
+)
+def test___float64_analog_waveform___quantize___within_error_bound(
+    scaled_data: np.ndarray[Any, Any],
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(scaled_data)
+
+    quantized_waveform, error_bound = quantize_analog_waveform(analog_waveform)
+
+    assert quantized_waveform.raw_data.dtype == np.int16
+    assert isinstance(quantized_waveform.scale_mode, LinearScaleMode)
+    error = np.abs(quantized_waveform.scaled_data - scaled_data)
+    assert error.max() <= error_bound * (1 + 1e-9)
+    # The samples span the whole 16-bit range, so the bound is half of one part in 65534.
+    assert error_bound == pytest.approx(np.ptp(scaled_data) / 65534 / 2)
+
+
+@pytest.mark.parametrize("scaled_data", [np.full(5, 2.5), np.zeros(0)])
+def test___constant_analog_waveform___quantize___exact(scaled_data: np.ndarray[Any, Any]) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(scaled_data)
+
+    quantized_waveform, _ = quantize_analog_waveform(analog_waveform)
+
+    assert np.array_equal(quantized_waveform.scaled_data, scaled_data)
+
+
+def test___scaled_analog_waveform___quantize___quantizes_scaled_data() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([0.0, 1.0, 2.0]), scale_mode=LinearScaleMode(10.0, 5.0)
+    )
+
+    quantized_waveform, error_bound = quantize_analog_waveform(analog_waveform)
+
+    assert np.allclose(quantized_waveform.scaled_data, [5.0, 15.0, 25.0], atol=error_bound)
+
+
+@pytest.mark.parametrize("bad_sample", [np.nan, np.inf, -np.inf])
+def test___non_finite_analog_waveform___quantize___raises_value_error(bad_sample: float) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1.0, bad_sample]))
+
+    with pytest.raises(ValueError) as exc:
+        quantize_analog_waveform(analog_waveform)
+
+    assert "NaN or infinite" in exc.value.args[0]
+
+
+def test___float64_analog_waveform___convert_quantized___two_bytes_per_sample() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([-1.0, 0.0, 1.0]))
+    analog_waveform.channel_name = "Dev1/ai0"
+
+    converter = QuantizedAnalogWaveformConverter()
+    analog_waveform_proto = converter.to_protobuf_message(analog_waveform)
+
+    assert analog_waveform_proto.y_data == b"\x01\x80\x00\x00\xff\x7f"
+    assert analog_waveform_proto.scale.linear_scale == waveform_pb2.LinearScale(
+        gain=1.0 / 32767, offset=0.0
+    )
+    assert analog_waveform_proto.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+
+
+def test___quantized_converter_registered_with_higher_priority___to_any_and_from_any___scaled_data_close(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(
+        nipanel._convert, "_CONVERTER_REGISTRY", nipanel._convert._create_converter_registry()
+    )
+    scaled_data = np.sin(np.linspace(0.0, 20.0, 10_000)) * 5.0
+    analog_waveform = AnalogWaveform.from_array_1d(
+        scaled_data,
+        timing=Timing.create_with_regular_interval(EXPECTED_SAMPLE_INTERVAL, EXPECTED_T0_DT),
+    )
+    float64_size = len(nipanel._convert.to_any(analog_waveform).value)
+
+    nipanel.register_converter(QuantizedAnalogWaveformConverter(), priority=1)
+    result = nipanel._convert.to_any(analog_waveform)
+
+    assert result.Is(waveform_pb2_nipanel.QuantizedAnalogWaveform.DESCRIPTOR)
+    assert len(result.value) * 4 < float64_size + 256
+    decoded = nipanel._convert.from_any(result)
+    assert isinstance(decoded, AnalogWaveform)
+    assert decoded.raw_data.dtype == np.int16
+    assert np.allclose(decoded.scaled_data, scaled_data, rtol=0, atol=5.0 / 32767)
+    assert decoded.timing.start_time == EXPECTED_T0_DT
+    assert decoded.timing.sample_interval == EXPECTED_SAMPLE_INTERVAL
+
+
+def test___int16_analog_waveform___quantized_converter_registered___not_quantized(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(
+        nipanel._convert, "_CONVERTER_REGISTRY", nipanel._convert._create_converter_registry()
+    )
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1, 2], dtype=np.int16))
+
+    nipanel.register_converter(QuantizedAnalogWaveformConverter(), priority=1)
+    result = nipanel._convert.to_any(analog_waveform)
+
+    assert result.Is(waveform_pb2.I16AnalogWaveform.DESCRIPTOR)
+
+
+# ========================================================
+# PackedDigitalWaveform
+# ========================================================
+def test___digital_waveform___convert_packed___eight_lines_per_byte() -> None:
+    data = np.array([[1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 1, 1, 0, 0, 0, 0, 0, 0]], dtype=np.uint8)
+    digital_waveform = DigitalWaveform.from_lines(data, signal_count=9)
+    digital_waveform.timing = Timing.create_with_regular_interval(
+        EXPECTED_SAMPLE_INTERVAL, EXPECTED_T0_DT
+    )
+
+    converter = PackedDigitalWaveformConverter()
+    digital_waveform_proto = converter.to_protobuf_message(digital_waveform)
+
+    assert digital_waveform_proto.signal_count == 9
+    assert digital_waveform_proto.y_data == b"\x01\x01\x06\x00"
+    assert digital_waveform_proto.dt == EXPECTED_SAMPLE_INTERVAL.total_seconds()
+
+
+def test___digital_waveform_with_other_states___convert_packed___raises_value_error() -> None:
+    data = np.array([[0, 1], [2, 1]], dtype=np.uint8)
+    digital_waveform = DigitalWaveform.from_lines(data, signal_count=2)
+
+    converter = PackedDigitalWaveformConverter()
+    with pytest.raises(ValueError) as exc:
+        converter.to_protobuf_message(digital_waveform)
+
+    assert "only supports line states of 0 and 1" in exc.value.args[0]
+
+
+def test___packed_digital_proto_with_partial_sample___convert___raises_value_error() -> None:
+    digital_waveform_proto = waveform_pb2_nipanel.PackedDigitalWaveform(
+        signal_count=9, y_data=b"\x01\x01\x06"
+    )
+
+    converter = PackedDigitalWaveformConverter()
+    with pytest.raises(ValueError) as exc:
+        converter.to_python_value(digital_waveform_proto)
+
+    assert exc.value.args[0].startswith("Data array length (3)")
+
+
+@pytest.mark.parametrize("signal_count", [1, 8, 13, 100])
+@pytest.mark.parametrize("dtype", [np.bool_, np.uint8])
+def test___digital_waveform___convert_packed_round_trip___same_lines_and_timing(
+    signal_count: int, dtype: type
+) -> None:
+    data: np.ndarray[Any, Any] = (
+        np.random.default_rng(0).integers(0, 2, size=(50, signal_count)).astype(dtype)
+    )
+    digital_waveform = DigitalWaveform.from_lines(data, signal_count=signal_count)
+    digital_waveform.channel_name = "Dev1/port0"
+    digital_waveform.timing = Timing.create_with_regular_interval(
+        EXPECTED_SAMPLE_INTERVAL, EXPECTED_T0_DT
+    )
+
+    converter = PackedDigitalWaveformConverter()
+    result = converter.to_python_value(converter.to_protobuf_message(digital_waveform))
+
+    assert result.signal_count == signal_count
+    assert np.array_equal(result.data, data)
+    assert result.channel_name == "Dev1/port0"
+    assert result.timing.start_time == EXPECTED_T0_DT
+    assert result.timing.sample_interval == EXPECTED_SAMPLE_INTERVAL
+
+
+def test___digital_waveform___to_any___uses_unpacked_encoding_by_default() -> None:
+    digital_waveform = DigitalWaveform.from_lines(np.zeros((4, 16), dtype=np.uint8))
+
+    result = nipanel._convert.to_any(digital_waveform)
+
+    assert result.Is(waveform_pb2.DigitalWaveform.DESCRIPTOR)
+
+
+def test___packed_converter_registered_with_higher_priority___to_any_and_from_any___round_trips(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(
+        nipanel._convert, "_CONVERTER_REGISTRY", nipanel._convert._create_converter_registry()
+    )
+    data = np.random.default_rng(0).integers(0, 2, size=(1000, 32)).astype(np.uint8)
+    digital_waveform = DigitalWaveform.from_lines(data, signal_count=32)
+
+    nipanel.register_converter(PackedDigitalWaveformConverter(), priority=1)
+    result = nipanel._convert.to_any(digital_waveform)
+
+    assert result.Is(waveform_pb2_nipanel.PackedDigitalWaveform.DESCRIPTOR)
+    assert len(result.value) < data.size // 8 + 64
+    decoded = nipanel._convert.from_any(result)
+    assert isinstance(decoded, DigitalWaveform)
+    assert np.array_equal(decoded.data, data)
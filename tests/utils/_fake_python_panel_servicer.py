@@ -30,6 +30,7 @@ class FakePythonPanelServicer(PanelServiceServicer):
         self._panel_value_ids: dict[str, dict[str, Any]] = {}
         self._fail_next_start_panel = False
         self._set_count: int = 0
+        self._try_get_value_ids: list[str] = []
         self._notification_count: int = 0
         self._python_interpreter_url: str = ""
         self._python_script_url: str = ""
@@ -78,6 +79,7 @@ class FakePythonPanelServicer(PanelServiceServicer):
         self, request: TryGetValueRequest, context: Any
     ) -> TryGetValueResponse:
         """Trivial implementation for testing."""
+        self._try_get_value_ids.append(request.value_id)
         if request.value_id not in self._panel_value_ids.get(request.panel_id, {}):
             return TryGetValueResponse()
         value = self._panel_value_ids[request.panel_id][request.value_id]
@@ -101,6 +103,11 @@ class FakePythonPanelServicer(PanelServiceServicer):
         """Get the total number of times SetValue was called."""
         return self._set_count
 
+    @property
+    def try_get_value_ids(self) -> list[str]:
+        """Get the value IDs requested from TryGetValue, in call order."""
+        return self._try_get_value_ids
+
     @property
     def notification_count(self) -> int:
         """Get the number of notifications sent from SetValue."""